@@ -5,6 +5,7 @@ API router endpoints for the bioprocess web application.
 from typing import Optional, Dict, List
 from uuid import uuid4
 from datetime import datetime
+import asyncio
 import json
 from pathlib import Path
 
@@ -23,6 +24,24 @@ from bioprocess.orchestrator import (
 )
 from bioprocess.presets import ASSUMPTIONS
 from bioprocess.models import ScenarioInput, ScenarioResult
+from api.schemas import (
+    JobStatus,
+    RunScenarioRequest,
+    RunScenarioResponse,
+    ExportRequest,
+    ExportResponse,
+    OptimizationRequest,
+    OptimizationResponse,
+    JobInfo,
+    JobProgressResponse,
+    ConfigSaveRequest,
+    ConfigSaveResponse,
+    ConfigListResponse,
+    SensitivityRequest,
+    BatchScenarioRequest,
+    BatchScenarioResponse,
+    StrainDatabaseResponse,
+)
 
 # Router instance
 router = APIRouter()
@@ -198,7 +217,7 @@ def transform_frontend_request(frontend_data: dict) -> dict:
                 if "raw_prices" in raw_prices_section and isinstance(raw_prices_section["raw_prices"], dict):
                     # Use the nested raw_prices which contains the actual material:price mapping
                     actual_raw_prices = raw_prices_section["raw_prices"]
-                    if all(isinstance(v, (int, float)) for v in actual_raw_prices.values()):
+                    if actual_raw_prices and all(isinstance(v, (int, float)) for v in actual_raw_prices.values()):
                         transformed_prices["raw_prices"] = actual_raw_prices
                     else:
                         # Fallback to defaults if validation would fail
@@ -206,7 +225,7 @@ def transform_frontend_request(frontend_data: dict) -> dict:
                         transformed_prices["raw_prices"] = RAW_PRICES.copy()
                 else:
                     # Check if raw_prices is a simple material:price mapping
-                    if all(isinstance(v, (int, float)) for v in raw_prices_section.values()):
+                    if raw_prices_section and all(isinstance(v, (int, float)) for v in raw_prices_section.values()):
                         transformed_prices["raw_prices"] = raw_prices_section
                     else:
                         from bioprocess.presets import RAW_PRICES
@@ -217,7 +236,7 @@ def transform_frontend_request(frontend_data: dict) -> dict:
         elif "raw_prices" in frontend_data:
             # Handle raw_prices at top level (for backwards compatibility)
             raw_prices = frontend_data["raw_prices"]
-            if isinstance(raw_prices, dict) and all(isinstance(v, (int, float)) for v in raw_prices.values()):
+            if isinstance(raw_prices, dict) and raw_prices and all(isinstance(v, (int, float)) for v in raw_prices.values()):
                 transformed_prices["raw_prices"] = raw_prices
             else:
                 from bioprocess.presets import RAW_PRICES
@@ -258,8 +277,9 @@ async def run_scenario_background(job_id: str, scenario: ScenarioInput):
 
         update_job(job_id, progress=0.2, message="Loading strain data...")
 
-        # Run the scenario
-        result = run_scenario_func(scenario)
+        # Run the scenario in a worker thread so the event loop keeps serving
+        # requests (such as job polls) while it computes
+        result = await asyncio.to_thread(run_scenario_func, scenario)
 
         update_job(
             job_id,
@@ -321,7 +341,8 @@ async def run_scenario(request_data: dict, background_tasks: BackgroundTasks):
         else:
             # Run synchronously
             logger.info(f"Running scenario with input: {scenario.model_dump()}")
-            result = run_scenario_func(scenario)
+            # Off the event loop so concurrent requests and job polls are served
+            result = await asyncio.to_thread(run_scenario_func, scenario)
             return RunScenarioResponse(
                 job_id=None,
                 result=result,
@@ -372,7 +393,7 @@ async def run_scenario_raw(request: dict, background_tasks: BackgroundTasks):
         else:
             # Run synchronously
             logger.info(f"Running transformed scenario: {scenario.model_dump()}")
-            result = run_scenario_func(scenario)
+            result = await asyncio.to_thread(run_scenario_func, scenario)
             return RunScenarioResponse(
                 job_id=None,
                 result=result,
@@ -388,6 +409,30 @@ async def run_scenario_raw(request: dict, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/scenarios/run_batch")
+def run_scenarios_sync_batch(request: dict):
+    """Run several frontend scenarios in one request and return all results at once.
+
+    Unlike /scenarios/batch, which queues a background job and returns its id,
+    this blocks until every scenario has finished. It is a plain ``def`` so
+    FastAPI runs it in the threadpool instead of on the event loop.
+    """
+    from bioprocess.presets import RAW_PRICES
+
+    results = []
+    for i, scenario_data in enumerate(request.get("scenarios", [])):
+        try:
+            scenario = ScenarioInput(**transform_frontend_request(scenario_data))
+            if not scenario.prices.raw_prices:
+                scenario.prices.raw_prices = RAW_PRICES.copy()
+            results.append(run_scenario_func(scenario).model_dump())
+        except Exception as e:
+            logger.error(f"Error in batch scenario {i + 1}: {e}")
+            results.append({"error": str(e)})
+
+    return {"results": results}
+
+
 @router.post("/scenarios/batch", response_model=BatchScenarioResponse)
 async def run_batch_scenarios(
     request: BatchScenarioRequest, background_tasks: BackgroundTasks
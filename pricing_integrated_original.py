@@ -1,6 +1,12 @@
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from joblib import Parallel, delayed
 from math import ceil
+import os
 import sys
 
 sys.path.append("/mnt/data")
@@ -10,6 +16,9 @@ from fermentation_capacity_calculator import (
     EquipmentConfig,
     calculate_deterministic_capacity,
     monte_carlo_capacity,
+    _allocation_from_totals,
+    _safe_div,
+    _share_allocation,
 )
 
 # ---------- Paths ----------
@@ -18,6 +27,7 @@ out2 = "Facility2_Lacto_Bifido_10TPA_calc.xlsx"
 out3 = "Facility3_Bacillus_Spores_10TPA_calc.xlsx"
 out4 = "Facility4_Yeast_Probiotic_10TPA_calc.xlsx"
 out5 = "Facility5_ALL_IN_40TPA_calc.xlsx"
+out_all = "all_facilities_calc.xlsx"
 
 
 # ---------- Global assumptions (2025 USD) ----------
@@ -46,6 +56,49 @@ ASSUMPTIONS = {
     "ga_other_scale_factor": 460000 / 42445.0,
 }
 
+
+@dataclass(frozen=True, slots=True)
+class _Assumptions:
+    """Attribute view of ASSUMPTIONS for the hot paths (one field per key)."""
+
+    hours_per_year: float
+    upstream_availability: float
+    downstream_availability: float
+    quality_yield: float
+    price_yogurt_usd_per_kg: float
+    price_lacto_bifido_usd_per_kg: float
+    price_bacillus_usd_per_kg: float
+    price_sacco_usd_per_kg: float
+    discount_rate: float
+    tax_rate: float
+    variable_opex_share: float
+    plant_manager_salary: float
+    fermentation_specialist_salary: float
+    downstream_process_operator_salary: float
+    general_technician_salary: float
+    qaqc_lab_tech_salary: float
+    maintenance_tech_salary: float
+    utility_operator_salary: float
+    logistics_clerk_salary: float
+    office_clerk_salary: float
+    maintenance_pct_of_equip: float
+    ga_other_scale_factor: float
+
+
+# Read-only snapshot of ASSUMPTIONS; clear_model_caches() rebuilds it after edits
+ASSUMPTIONS_NS = _Assumptions(**ASSUMPTIONS)
+
+# Project timeline used by the IRR/NPV cash-flow models: years 0-1 are
+# construction (70% / 30% CAPEX spend), years 2-12 ramp to an 85% plateau.
+CAPACITY_PROFILE = np.array(
+    [0, 0, 0.40, 0.60, 0.75, 0.85] + [0.85] * 7, dtype=np.float64
+)
+YEAR_IDX = np.arange(13)
+# Ramp-up schedule used by the detailed P&L statement (reaches full capacity)
+PL_CAPACITY_PROFILE = np.array(
+    [0, 0, 0.40, 0.60, 0.80, 1.00] + [1.00] * 7, dtype=np.float64
+)
+
 RAW_PRICES = {
     "Glucose": 0.22,
     "Dextrose": 0.61,
@@ -80,10 +133,22 @@ RAW_PRICES = {
     "ZnSO4x7H2O": 1.2,
     "Sodium_Acetate": 1.00,
 }
+# The same price list as records, laid out as the "Raw Material Prices" sheet
+_RAW_PRICES_ARR = np.array(
+    list(RAW_PRICES.items()),
+    dtype=[("Material", "U64"), ("Price (USD/kg)", "f8")],
+)
+
+
+@lru_cache(maxsize=64)
+def _discount_factors(rate, n_years):
+    """(1 + rate) ** t for t = 0 .. n_years - 1, computed once per rate/length."""
+    return tuple((1 + rate) ** t for t in range(n_years))
 
 
 def npv(rate, cashflows):
-    return sum(cf / ((1 + rate) ** t) for t, cf in enumerate(cashflows))
+    factors = _discount_factors(rate, len(cashflows))
+    return sum(cf / factor for cf, factor in zip(cashflows, factors))
 
 
 def irr(cashflows, guess=0.2, tol=1e-6, maxiter=500):
@@ -99,17 +164,18 @@ def irr(cashflows, guess=0.2, tol=1e-6, maxiter=500):
     if not any(cf > 0 for cf in cashflows) or not any(cf < 0 for cf in cashflows):
         return float("nan")
 
+    first_cf = 0.0 + cashflows[0]
+    later_cfs = cashflows[1:]
+
     def npv(r):
-        total = 0.0
+        total = first_cf
         denom = 1.0
-        for t, cf in enumerate(cashflows):
-            if t == 0:
-                total += cf
-            else:
-                denom *= 1.0 + r
-                if denom <= 0:
-                    return float("inf") if cf >= 0 else -float("inf")
-                total += cf / denom
+        growth = 1.0 + r
+        for cf in later_cfs:
+            denom *= growth
+            if denom <= 0:
+                return float("inf") if cf >= 0 else -float("inf")
+            total += cf / denom
         return total
 
     low = -0.9999
@@ -161,6 +227,71 @@ def irr(cashflows, guess=0.2, tol=1e-6, maxiter=500):
     return r
 
 
+def irr_rows(cashflows, tol=1e-6, maxiter=500):
+    """IRR of every row of a 2-D cash-flow array, NaN where undefined.
+
+    Runs the bracketing/bisection search of ``irr`` on all rows at once, one
+    year column at a time, so each row gets exactly the value ``irr`` returns
+    for it. Rows without a sign-changing bracket go through ``irr`` itself.
+    """
+    cf = np.asarray(cashflows, dtype=np.float64)
+    n_rows = cf.shape[0]
+    out = np.full(n_rows, np.nan)
+    defined = (cf > 0).any(axis=1) & (cf < 0).any(axis=1)
+    cf = cf[defined]
+    if cf.shape[0] == 0:
+        return out
+
+    def npv_rows(r):
+        total = cf[:, 0].copy()
+        denom = np.ones_like(r)
+        for t in range(1, cf.shape[1]):
+            denom *= 1.0 + r
+            total += cf[:, t] / denom
+        return total
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        low = np.full(cf.shape[0], -0.9999)
+        high = np.ones(cf.shape[0])
+        f_low = npv_rows(low)
+        f_high = npv_rows(high)
+        while True:
+            widen = (
+                np.isfinite(f_low)
+                & np.isfinite(f_high)
+                & (f_low * f_high > 0)
+                & (high < 1e3)
+            )
+            if not widen.any():
+                break
+            high = np.where(widen, high * 2.0, high)
+            f_high = np.where(widen, npv_rows(high), f_high)
+
+        bracketed = np.isfinite(f_low) & np.isfinite(f_high) & (f_low * f_high <= 0)
+        result = np.full(cf.shape[0], np.nan)
+        active = bracketed.copy()
+        for _ in range(maxiter):
+            if not active.any():
+                break
+            mid = (low + high) / 2.0
+            f_mid = npv_rows(mid)
+            done = active & (~np.isfinite(f_mid) | (np.abs(f_mid) < tol))
+            result[done] = mid[done]
+            active &= ~done
+            left = active & (f_low * f_mid <= 0)
+            right = active & ~left
+            high = np.where(left, mid, high)
+            f_high = np.where(left, f_mid, f_high)
+            low = np.where(right, mid, low)
+            f_low = np.where(right, f_mid, f_low)
+        result[active] = ((low + high) / 2.0)[active]
+
+    for k in np.flatnonzero(~bracketed):
+        result[k] = irr(cf[k].tolist(), tol=tol, maxiter=maxiter)
+    out[defined] = result
+    return out
+
+
 # --- Media & Cryo cost DB (kept as-is from user's script) ---
 # LICENSING FIELDS ADDED (2025-01):
 # - licensing_fixed_cost_usd: One-time fixed fee per strain (affects CAPEX)
@@ -526,9 +657,24 @@ STRAIN_BATCH_DB = {
 
 
 # ---------------- Helpers ----------------
+def _iceil_div(a, b):
+    """ceil(a / b) for equipment counts, in integer arithmetic."""
+    return -(-a // b)
+
+
 def build_strainspecs(strain_names, fermenter_volume_L=2000):
+    """StrainSpec list for ``strain_names`` at ``fermenter_volume_L``.
+
+    The specs are memoized per (strain list, volume) and shared between calls,
+    so treat them as read-only; the returned list itself is fresh.
+    """
+    return list(_strainspecs_cached(tuple(strain_names), fermenter_volume_L))
+
+
+@lru_cache(maxsize=1024)
+def _strainspecs_cached(strains_key, fermenter_volume_L):
     specs = []
-    for s in strain_names:
+    for s in strains_key:
         d = STRAIN_BATCH_DB[s]
         specs.append(
             StrainSpec(
@@ -543,25 +689,173 @@ def build_strainspecs(strain_names, fermenter_volume_L=2000):
                 utility_cost_steam=0.0228,
             )
         )
-    return specs
-
-
-def capacity_given_counts(strain_names, reactors, ds_lines, fermenter_volume_L=2000):
-    specs = build_strainspecs(strain_names, fermenter_volume_L)
-    cfg = EquipmentConfig(
-        year_hours=ASSUMPTIONS["hours_per_year"],
+    return tuple(specs)
+
+
+# ---------------- Memoized capacity / CAPEX helpers ----------------
+# The optimizers evaluate the same (strains, reactors, ds_lines, volume) tuples
+# many times, and every result below is a pure function of those arguments plus
+# the module-level tables. Cached results are shared between callers and must be
+# treated as read-only. Call clear_model_caches() after mutating STRAIN_DB,
+# STRAIN_BATCH_DB or ASSUMPTIONS at runtime.
+@lru_cache(maxsize=1024)
+def _equipment_config(reactors, ds_lines):
+    # Plant-wide hours, availabilities and yield from ASSUMPTIONS; shared, read-only
+    return EquipmentConfig(
+        year_hours=ASSUMPTIONS_NS.hours_per_year,
         reactors_total=reactors,
         ds_lines_total=ds_lines,
-        upstream_availability=ASSUMPTIONS["upstream_availability"],
-        downstream_availability=ASSUMPTIONS["downstream_availability"],
-        quality_yield=ASSUMPTIONS["quality_yield"],
+        upstream_availability=ASSUMPTIONS_NS.upstream_availability,
+        downstream_availability=ASSUMPTIONS_NS.downstream_availability,
+        quality_yield=ASSUMPTIONS_NS.quality_yield,
     )
-    df, totals = calculate_deterministic_capacity(
-        specs,
-        cfg,
+
+
+@lru_cache(maxsize=4096)
+def _deterministic_capacity_cached(
+    strains_key, fermenters, ds_lines, fermenter_volume_L
+):
+    return calculate_deterministic_capacity(
+        list(_strainspecs_cached(strains_key, fermenter_volume_L)),
+        _equipment_config(fermenters, ds_lines),
         reactor_allocation_policy="inverse_ct",
         ds_allocation_policy="inverse_ct",
     )
+
+
+def deterministic_capacity_for_counts(
+    strain_names, fermenters, ds_lines, fermenter_volume_L=2000
+):
+    """Deterministic per-strain capacity (inverse_ct allocation) for given counts.
+
+    Returns the ``(df, totals)`` pair of ``calculate_deterministic_capacity``,
+    memoized on ``(tuple(strain_names), fermenters, ds_lines, fermenter_volume_L)``.
+    """
+    return _deterministic_capacity_cached(
+        tuple(strain_names), fermenters, ds_lines, fermenter_volume_L
+    )
+
+
+_STRAIN_BATCH_COLUMNS = (
+    "t_fedbatch_h",
+    "t_turnaround_h",
+    "yield_g_per_L",
+    "utility_rate_ferm_kw",
+    "utility_rate_cent_kw",
+    "utility_rate_lyo_kw",
+    "t_downstrm_h",
+)
+# Product price fields in STRAIN_BATCH_DB, in the order a strain's price is chosen
+_STRAIN_PRICE_KEYS = (
+    "price_yogurt_usd_per_kg",
+    "price_lacto_bifido_usd_per_kg",
+    "price_bacillus_usd_per_kg",
+    "price_sacco_usd_per_kg",
+)
+
+
+def _build_strain_arrays():
+    """Column-oriented copy of the strain tables: one float64 array per field.
+
+    Rows follow STRAIN_BATCH_DB order; STRAIN_INDEX maps strain name to row.
+    """
+    names = list(STRAIN_BATCH_DB)
+    arrays = {
+        k: np.array([STRAIN_BATCH_DB[s][k] for s in names], dtype=np.float64)
+        for k in _STRAIN_BATCH_COLUMNS
+    }
+    for k, default in (
+        ("media_cost_usd", np.nan),
+        ("cryo_cost_usd", np.nan),
+        ("licensing_royalty_pct", 0.0),
+    ):
+        arrays[k] = np.array(
+            [STRAIN_DB.get(s, {}).get(k, default) for s in names], dtype=np.float64
+        )
+    # NaN where a strain has no price of its own (callers apply the default)
+    arrays["price_usd_per_kg"] = np.array(
+        [
+            next(
+                (
+                    STRAIN_BATCH_DB[s][k]
+                    for k in _STRAIN_PRICE_KEYS
+                    if k in STRAIN_BATCH_DB[s]
+                ),
+                np.nan,
+            )
+            for s in names
+        ],
+        dtype=np.float64,
+    )
+    return {s: i for i, s in enumerate(names)}, arrays
+
+
+STRAIN_INDEX, STRAIN_ARRAYS = _build_strain_arrays()
+
+
+@lru_cache(maxsize=1024)
+def _strain_table_cached(strains_key):
+    idx = np.fromiter(
+        (STRAIN_INDEX[s] for s in strains_key), dtype=np.intp, count=len(strains_key)
+    )
+    return pd.DataFrame(
+        {"name": list(strains_key), **{k: v[idx] for k, v in STRAIN_ARRAYS.items()}}
+    )
+
+
+def strain_table(strain_names):
+    """Per-strain model inputs as one row per entry of ``strain_names``.
+
+    Columns are ``name``, the STRAIN_BATCH_DB process-time, yield and utility
+    fields used by the models, and the STRAIN_DB media, cryo and royalty fields.
+    Built once per strain list so callers can pull whole columns with
+    ``.to_numpy()``.
+    """
+    return _strain_table_cached(tuple(strain_names)).copy()
+
+
+def clear_model_caches():
+    """Drop memoized capacity/CAPEX results (call after editing the strain tables).
+
+    Also rebuilds STRAIN_INDEX/STRAIN_ARRAYS from the strain tables and refreshes
+    ASSUMPTIONS_NS and the labor constants derived from it.
+    """
+    global ASSUMPTIONS_NS, _LABOR_SALARIES, _AVG_LABOR_COST
+    global STRAIN_INDEX, STRAIN_ARRAYS
+    STRAIN_INDEX, STRAIN_ARRAYS = _build_strain_arrays()
+    ASSUMPTIONS_NS = _Assumptions(**ASSUMPTIONS)
+    _LABOR_SALARIES = np.array(
+        [getattr(ASSUMPTIONS_NS, k) for k in _LABOR_SALARY_KEYS], dtype=np.float64
+    )
+    _AVG_LABOR_COST = _average_labor_cost()
+    _strainspecs_cached.cache_clear()
+    _equipment_config.cache_clear()
+    _deterministic_capacity_cached.cache_clear()
+    _strain_table_cached.cache_clear()
+    _capacity_given_counts_cached.cache_clear()
+    _upstream_capacity.cache_clear()
+    _downstream_capacity.cache_clear()
+    _downstream_capacity_matrix.cache_clear()
+    _capex_estimate_2_cached.cache_clear()
+    _licensing_fixed_total_cached.cache_clear()
+    _weighted_royalty_rate_cached.cache_clear()
+    _weighted_price_per_kg_cached.cache_clear()
+    _detailed_opex_report_cached.cache_clear()
+    _detailed_capex_report_cached.cache_clear()
+    _facility_model_cached.cache_clear()
+
+
+def capacity_given_counts(strain_names, reactors, ds_lines, fermenter_volume_L=2000):
+    return _capacity_given_counts_cached(
+        tuple(strain_names), reactors, ds_lines, fermenter_volume_L
+    )
+
+
+@lru_cache(maxsize=4096)
+def _capacity_given_counts_cached(strains_key, reactors, ds_lines, fermenter_volume_L):
+    df, totals = _deterministic_capacity_cached(
+        strains_key, reactors, ds_lines, fermenter_volume_L
+    )
     # Add convenient plant-level metrics
     plant_batches_feasible = totals["total_feasible_batches"]
     plant_batches_good = totals["total_good_batches"]
@@ -583,6 +877,81 @@ def capacity_given_counts(strain_names, reactors, ds_lines, fermenter_volume_L=2
     )
 
 
+def _allocated_capacity_batches(names, cycle_times, total_units, available_hours):
+    # Same inverse-cycle-time allocation and batches/year as
+    # calculate_deterministic_capacity, without its per-strain dicts and frame
+    weights = 1.0 / np.maximum(np.array(cycle_times, dtype=float), 1e-9)
+    if float(total_units) >= len(names):
+        alloc = _allocation_from_totals(
+            names, int(round(float(total_units))), weights, "proportional"
+        )
+    else:
+        alloc = _share_allocation(names, float(total_units), weights, "proportional")
+    return np.array(
+        [
+            float(alloc.get(name, 0.0)) * _safe_div(available_hours, ct)
+            for name, ct in zip(names, cycle_times)
+        ],
+        dtype=np.float64,
+    )
+
+
+# Upstream batch capacity per strain depends only on the reactor count, and
+# downstream capacity only on the DS line count, so a grid search can combine
+# O(R + D) cached vectors instead of solving every (R, D) cell.
+@lru_cache(maxsize=1024)
+def _upstream_capacity(strains_key, reactors, fermenter_volume_L):
+    specs = _strainspecs_cached(strains_key, fermenter_volume_L)
+    return _allocated_capacity_batches(
+        [s.name for s in specs],
+        [s.fermentation_time_h + s.turnaround_time_h for s in specs],
+        reactors,
+        ASSUMPTIONS_NS.hours_per_year * ASSUMPTIONS_NS.upstream_availability,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _downstream_capacity(strains_key, ds_lines, fermenter_volume_L):
+    specs = _strainspecs_cached(strains_key, fermenter_volume_L)
+    return _allocated_capacity_batches(
+        [s.name for s in specs],
+        [s.downstream_time_h for s in specs],
+        ds_lines,
+        ASSUMPTIONS_NS.hours_per_year * ASSUMPTIONS_NS.downstream_availability,
+    )
+
+
+@lru_cache(maxsize=256)
+def _downstream_capacity_matrix(strains_key, max_ds_lines, fermenter_volume_L):
+    # Row d-1 holds the per-strain downstream batches for d DS lines
+    if max_ds_lines < 1:
+        return np.zeros((0, len(strains_key)))
+    return np.vstack(
+        [
+            _downstream_capacity(strains_key, D, fermenter_volume_L)
+            for D in range(1, max_ds_lines + 1)
+        ]
+    )
+
+
+def _plant_kg_good_by_ds_lines(strains_key, reactors, max_ds_lines, fermenter_volume_L):
+    """Plant good kg/year for ``reactors`` and each of 1..max_ds_lines DS lines.
+
+    Combines the split upstream/downstream capacity caches in one array
+    operation. Matches capacity_given_counts up to summation order; use it to
+    screen cells, then confirm candidates with capacity_given_counts.
+    """
+    batch_mass = np.array(
+        [s.batch_mass_kg for s in _strainspecs_cached(strains_key, fermenter_volume_L)],
+        dtype=np.float64,
+    )
+    feasible = np.minimum(
+        _upstream_capacity(strains_key, reactors, fermenter_volume_L)[None, :],
+        _downstream_capacity_matrix(strains_key, max_ds_lines, fermenter_volume_L),
+    )
+    return (feasible * ASSUMPTIONS_NS.quality_yield * batch_mass).sum(axis=1)
+
+
 # ---------------- Licensing Helper Functions ----------------
 def licensing_fixed_total(strain_names):
     """Calculate total fixed licensing costs for selected strains.
@@ -593,7 +962,12 @@ def licensing_fixed_total(strain_names):
     Returns:
         float: Sum of all fixed licensing costs (one-time CAPEX)
     """
-    return sum(STRAIN_DB[s].get("licensing_fixed_cost_usd", 0.0) for s in strain_names)
+    return _licensing_fixed_total_cached(tuple(strain_names))
+
+
+@lru_cache(maxsize=1024)
+def _licensing_fixed_total_cached(strains_key):
+    return sum(STRAIN_DB[s].get("licensing_fixed_cost_usd", 0.0) for s in strains_key)
 
 
 def weighted_royalty_rate(strain_names, fermenters, ds_lines, fermenter_volume_L):
@@ -613,47 +987,34 @@ def weighted_royalty_rate(strain_names, fermenters, ds_lines, fermenter_volume_L
             - weighted_royalty_rate: Production-weighted average royalty percentage
             - per_strain_kg_dict: Dictionary mapping strain names to annual production in kg
     """
-    # Get actual strain batch allocations from capacity calculation
-    specs = build_strainspecs(strain_names, fermenter_volume_L)
-    cfg = EquipmentConfig(
-        year_hours=ASSUMPTIONS["hours_per_year"],
-        reactors_total=fermenters,
-        ds_lines_total=ds_lines,
-        upstream_availability=ASSUMPTIONS["upstream_availability"],
-        downstream_availability=ASSUMPTIONS["downstream_availability"],
-        quality_yield=ASSUMPTIONS["quality_yield"],
+    weighted_rate, per_strain_kg = _weighted_royalty_rate_cached(
+        tuple(strain_names), fermenters, ds_lines, fermenter_volume_L
     )
-    df_det, _ = calculate_deterministic_capacity(
-        specs,
-        cfg,
-        reactor_allocation_policy="inverse_ct",
-        ds_allocation_policy="inverse_ct",
+    # Hand out a fresh dict so callers cannot corrupt the cached result
+    return weighted_rate, dict(per_strain_kg)
+
+
+@lru_cache(maxsize=4096)
+def _weighted_royalty_rate_cached(
+    strains_key, fermenters, ds_lines, fermenter_volume_L
+):
+    # Get actual strain batch allocations from capacity calculation
+    df_det, _ = _deterministic_capacity_cached(
+        strains_key, fermenters, ds_lines, fermenter_volume_L
     )
 
     # Calculate production volumes and weighted royalty
     working_volume_L = fermenter_volume_L * 0.8  # 80% working volume
-    per_strain_kg = {}
-    weighted_sum = 0.0
-    total_kg = 0.0
-
-    for _, row in df_det.iterrows():
-        strain_name = row["name"]
-        good_batches = row["good_batches"]
-
-        # Get yield for this strain
-        yield_g_per_L = STRAIN_BATCH_DB[strain_name]["yield_g_per_L"]
-        kg_per_batch = yield_g_per_L * working_volume_L / 1000.0
-
-        # Calculate annual production for this strain
-        annual_kg = good_batches * kg_per_batch
-        per_strain_kg[strain_name] = annual_kg
-
-        # Get royalty rate for this strain (default to 0 if not specified)
-        royalty_pct = STRAIN_DB[strain_name].get("licensing_royalty_pct", 0.0)
-
-        # Add to weighted sum
-        weighted_sum += annual_kg * royalty_pct
-        total_kg += annual_kg
+    table = _strain_table_cached(strains_key)
+    kg_per_batch = table["yield_g_per_L"].to_numpy() * working_volume_L / 1000.0
+    annual_kg = df_det["good_batches"].to_numpy(dtype=np.float64) * kg_per_batch
+    per_strain_kg = dict(zip(df_det["name"].tolist(), annual_kg.tolist()))
+
+    # Sums stay sequential so the rate matches the per-strain accumulation
+    weighted_sum = sum(
+        (annual_kg * table["licensing_royalty_pct"].to_numpy()).tolist(), 0.0
+    )
+    total_kg = sum(annual_kg.tolist(), 0.0)
 
     # Calculate weighted average royalty rate (avoid division by zero)
     weighted_rate = weighted_sum / total_kg if total_kg > 0 else 0.0
@@ -680,10 +1041,21 @@ def capex_estimate_2(
     Returns:
         tuple: (total_capex, breakdown_dict)
     """
+    total_capex, breakdown = _capex_estimate_2_cached(
+        target_tpa, fermenters, ds_lines, fermenter_volume_L, licensing_fixed_total_usd
+    )
+    # Hand out a fresh dict so callers cannot corrupt the cached breakdown
+    return total_capex, dict(breakdown)
+
+
+@lru_cache(maxsize=4096)
+def _capex_estimate_2_cached(
+    target_tpa, fermenters, ds_lines, fermenter_volume_L, licensing_fixed_total_usd
+):
     # Map DS lines ~ lyophilizer trains (conservative)
     lyos_needed = max(2, ds_lines)
-    centrifuges = ceil(lyos_needed * 0.4)
-    tff_skids = ceil(lyos_needed * 0.4)
+    centrifuges = _iceil_div(lyos_needed * 2, 5)
+    tff_skids = _iceil_div(lyos_needed * 2, 5)
 
     # Scale fermenter cost with volume using six-tenths rule
     base_volume = 2000  # Base case volume in liters
@@ -700,17 +1072,17 @@ def capex_estimate_2(
     fermenterCost = fermenters * base_fermenter_cost * volume_scale_factor
 
     seedFermenterCost = (
-        (max(2, ceil(fermenters * 0.7)) + 1) * 50000 * volume_scale_factor
+        (max(2, _iceil_div(fermenters * 7, 10)) + 1) * 50000 * volume_scale_factor
     )
     mediatankCost = (
-        ceil(fermenters * 4 / 7) * 75000 * volume_scale_factor
+        _iceil_div(fermenters * 4, 7) * 75000 * volume_scale_factor
     )  # Media tanks scale with fermenter volume
     lyophilizerCost = max(1, ds_lines) * 400000 * volume_scale_factor
     centrifugeCost = centrifuges * 120000 * volume_scale_factor
     tffCost = tff_skids * 100000 * volume_scale_factor
-    millblendcontaindetransferCost = max(1, ceil(tff_skids * 0.5)) * 125000
+    millblendcontaindetransferCost = max(1, _iceil_div(tff_skids, 2)) * 125000
 
-    utilitySystemsCost = max(1, ceil(tff_skids * 0.5)) * (
+    utilitySystemsCost = max(1, _iceil_div(tff_skids, 2)) * (
         100000 + 150000 + 400000 + 120000 + 250000
     )  # AutoClave, Purified Water, Water for Injection, Clean Steam, CIP
 
@@ -781,8 +1153,10 @@ def run_financial_monte_carlo(
         fermenter_volume_L: fermenter volume in liters
 
     Returns:
-        dict: {'irr_dist': [...], 'npv_dist': [...], 'kg_dist': [...],
+        dict: {'irr_dist': ndarray, 'npv_dist': ndarray, 'kg_dist': ndarray,
                'irr_stats': {...}, 'npv_stats': {...}}
+        Each distribution holds one entry per simulation; non-convergent IRRs
+        are NaN in 'irr_dist' and excluded from 'irr_stats'.
     """
     # Build strain specs with CV values for stochastic simulation
     specs = []
@@ -805,15 +1179,14 @@ def run_financial_monte_carlo(
             )
         )
 
+    # Per-strain parameters as arrays aligned with ``specs`` (struct-of-arrays)
+    table = _strain_table_cached(tuple(strain_names))
+    media_cost = table["media_cost_usd"].to_numpy(dtype=np.float64)
+    cryo_cost = table["cryo_cost_usd"].to_numpy(dtype=np.float64)
+    batch_mass = np.array([s.batch_mass_kg or 0.0 for s in specs], dtype=np.float64)
+
     # Equipment configuration
-    cfg = EquipmentConfig(
-        year_hours=ASSUMPTIONS["hours_per_year"],
-        reactors_total=config["reactors"],
-        ds_lines_total=config["ds_lines"],
-        upstream_availability=ASSUMPTIONS["upstream_availability"],
-        downstream_availability=ASSUMPTIONS["downstream_availability"],
-        quality_yield=ASSUMPTIONS["quality_yield"],
-    )
+    cfg = _equipment_config(config["reactors"], config["ds_lines"])
 
     # Run Monte Carlo capacity simulation
     mc_summary = monte_carlo_capacity(
@@ -828,90 +1201,56 @@ def run_financial_monte_carlo(
     # Get the distribution of annual_kg_good from Monte Carlo
     # We need to run the full simulation to get individual samples
     np.random.seed(seed)
-    kg_samples = []
 
-    # Get deterministic allocation first
-    df_det, _ = calculate_deterministic_capacity(
-        specs,
-        cfg,
-        reactor_allocation_policy="inverse_ct",
-        ds_allocation_policy="inverse_ct",
+    # Get deterministic allocation first (allocation depends only on cycle times)
+    df_det, _ = deterministic_capacity_for_counts(
+        strain_names, config["reactors"], config["ds_lines"], fermenter_volume_L
     )
-    reactors_alloc = {
-        row["name"]: float(row["reactors_assigned"]) for _, row in df_det.iterrows()
-    }
-    ds_alloc = {
-        row["name"]: float(row["ds_lines_assigned"]) for _, row in df_det.iterrows()
-    }
-
-    # Generate samples
-    for _ in range(n_sims):
-        plant_kg = 0.0
-        for s in specs:
-            # Sample from lognormal distributions for process times
-            ferm = (
-                float(
-                    np.random.lognormal(
-                        np.log(s.fermentation_time_h)
-                        - 0.5 * np.log(1 + (s.cv_ferm or 0.0) ** 2),
-                        np.sqrt(np.log(1 + (s.cv_ferm or 0.0) ** 2)),
-                        1,
-                    )[0]
-                )
-                if s.cv_ferm and s.cv_ferm > 0
-                else s.fermentation_time_h
-            )
-
-            turn = (
-                float(
-                    np.random.lognormal(
-                        np.log(s.turnaround_time_h)
-                        - 0.5 * np.log(1 + (s.cv_turn or 0.0) ** 2),
-                        np.sqrt(np.log(1 + (s.cv_turn or 0.0) ** 2)),
-                        1,
-                    )[0]
-                )
-                if s.cv_turn and s.cv_turn > 0
-                else s.turnaround_time_h
-            )
-
-            down = (
-                float(
-                    np.random.lognormal(
-                        np.log(s.downstream_time_h)
-                        - 0.5 * np.log(1 + (s.cv_down or 0.0) ** 2),
-                        np.sqrt(np.log(1 + (s.cv_down or 0.0) ** 2)),
-                        1,
-                    )[0]
-                )
-                if s.cv_down and s.cv_down > 0
-                else s.downstream_time_h
-            )
-
-            # Calculate capacity for this strain with sampled times
-            ct_up = ferm + turn
-            ct_ds = down
-            up_hours = cfg.year_hours * cfg.upstream_availability
-            ds_hours = cfg.year_hours * cfg.downstream_availability
-
-            up_batches = reactors_alloc[s.name] * (up_hours / ct_up if ct_up > 0 else 0)
-            ds_batches = ds_alloc[s.name] * (ds_hours / ct_ds if ct_ds > 0 else 0)
-
-            feasible_batches = (
-                min(up_batches, ds_batches)
-                if (reactors_alloc[s.name] > 0 and ds_alloc[s.name] > 0)
-                else 0.0
+    reactors_alloc = dict(
+        zip(df_det["name"].tolist(), df_det["reactors_assigned"].tolist())
+    )
+    ds_alloc = dict(zip(df_det["name"].tolist(), df_det["ds_lines_assigned"].tolist()))
+    r_alloc = np.array([reactors_alloc[s.name] for s in specs], dtype=np.float64)
+    d_alloc = np.array([ds_alloc[s.name] for s in specs], dtype=np.float64)
+
+    # Sample process times as (n_sims x n_strains) matrices. Strains with a zero
+    # CV keep their deterministic time; only the stochastic columns are drawn.
+    sampled = []
+    for mean_attr, cv_attr in (
+        ("fermentation_time_h", "cv_ferm"),
+        ("turnaround_time_h", "cv_turn"),
+        ("downstream_time_h", "cv_down"),
+    ):
+        means = np.array([getattr(s, mean_attr) for s in specs], dtype=np.float64)
+        cvs = np.array([getattr(s, cv_attr) or 0.0 for s in specs], dtype=np.float64)
+        times = np.tile(means, (n_sims, 1))
+        stoch_idx = np.where(cvs > 0)[0]
+        if stoch_idx.size:
+            sigma2 = np.log(1 + cvs[stoch_idx] ** 2)
+            times[:, stoch_idx] = np.random.lognormal(
+                np.log(means[stoch_idx]) - 0.5 * sigma2,
+                np.sqrt(sigma2),
+                (n_sims, stoch_idx.size),
             )
-            good_batches = feasible_batches * cfg.quality_yield
-
-            if s.batch_mass_kg:
-                plant_kg += good_batches * s.batch_mass_kg
-
-        kg_samples.append(plant_kg)
-
-    # Calculate financial metrics for each production sample
-    irr_dist = []
-    npv_dist = []
+        sampled.append(times)
+    ferm, turn, down = sampled
+
+    # Calculate capacity for every strain and sample with the sampled times
+    ct_up = ferm + turn
+    ct_ds = down
+    up_hours = cfg.year_hours * cfg.upstream_availability
+    ds_hours = cfg.year_hours * cfg.downstream_availability
+    up_batches = r_alloc * np.divide(
+        up_hours, ct_up, out=np.zeros_like(ct_up), where=ct_up > 0
+    )
+    ds_batches = d_alloc * np.divide(
+        ds_hours, ct_ds, out=np.zeros_like(ct_ds), where=ct_ds > 0
+    )
+    feasible_batches = np.where(
+        (r_alloc > 0) & (d_alloc > 0), np.minimum(up_batches, ds_batches), 0.0
+    )
+    good_batches = feasible_batches * cfg.quality_yield
+    kg_samples = good_batches @ batch_mass
 
     # Get CAPEX and fixed costs (same for all simulations)
     # Include licensing fixed cost in CAPEX
@@ -925,32 +1264,11 @@ def run_financial_monte_carlo(
     )
 
     # Calculate average raw material costs
-    df_media = pd.DataFrame(
-        [
-            {
-                "Strain": s.name,
-                "Media Cost/Batch (USD)": STRAIN_DB[s.name]["media_cost_usd"],
-            }
-            for s in specs
-        ]
-    )
-    df_cryo = pd.DataFrame(
-        [
-            {
-                "Strain": s.name,
-                "Cryo Cost/Batch (USD)": STRAIN_DB[s.name]["cryo_cost_usd"],
-            }
-            for s in specs
-        ]
-    )
-    avg_rm_cost_per_batch = (
-        df_media["Media Cost/Batch (USD)"].mean()
-        + df_cryo["Cryo Cost/Batch (USD)"].mean()
-    )
+    avg_rm_cost_per_batch = media_cost.mean() + cryo_cost.mean()
 
     # Build OPEX components with actual optimized values
     # Get actual plant capacity from deterministic calculation
-    _, totals, plant = capacity_given_counts(
+    det_df, totals, plant = capacity_given_counts(
         strain_names, config["reactors"], config["ds_lines"], fermenter_volume_L
     )
     plant_kg_good = plant["plant_kg_good"]
@@ -969,6 +1287,7 @@ def run_financial_monte_carlo(
         strains=strain_names,
         fermenters=config["reactors"],
         ds_lines=config["ds_lines"],
+        det_df=det_df,
     )
 
     # Get price per kg - use weighted average for multi-product facilities
@@ -982,56 +1301,59 @@ def run_financial_monte_carlo(
     royalty_rate = opx.get("licensing_weighted_royalty_rate", 0.0)
 
     # Fixed and variable OPEX components
-    fixed_opex = (1 - ASSUMPTIONS["variable_opex_share"]) * opx["total_cash_opex"]
+    fixed_opex = (1 - ASSUMPTIONS_NS.variable_opex_share) * opx["total_cash_opex"]
     var_opex_base = (
-        ASSUMPTIONS["variable_opex_share"]
+        ASSUMPTIONS_NS.variable_opex_share
         * opx["total_cash_opex"]
         / (target_tpa * 1000.0)
     )
 
-    # Calculate IRR and NPV for each production sample
-    for kg_annual in kg_samples:
-        # Scale production across ramp-up years
-        years = list(range(0, 13))
-        capacities = [0, 0, 0.40, 0.60, 0.75, 0.85] + [0.85] * 7
-
-        cashflows = []
-        cashflows.append(-capex * 0.70)  # Year 0
-        cashflows.append(-capex * 0.30)  # Year 1
-
-        for i in range(2, 13):
-            util = capacities[i]
-            # Use actual stochastic production scaled by utilization
-            kg = kg_annual * util
-            revenue = kg * price_per_kg
-            # Variable costs scale with actual production
-            cogs = kg * var_opex_base + fixed_opex
-            # Apply royalty on pre-royalty EBITDA
-            ebitda_pre = revenue - cogs
-            royalty_paid = max(0.0, ebitda_pre) * royalty_rate
-            ebitda = ebitda_pre - royalty_paid
-            # Depreciation excludes licensing (50% of process capital only)
-            dep = (capex - cap.get("licensing_fixed_total", 0.0)) * 0.5 / 10.0
-            ebt = ebitda - dep
-            tax = max(0.0, ebt * ASSUMPTIONS["tax_rate"])
-            ufcf = ebitda - tax
-            cashflows.append(ufcf)
-
-        # Calculate financial metrics
-        calc_irr = irr(cashflows)
-        calc_npv = npv(ASSUMPTIONS["discount_rate"], cashflows)
+    # Depreciation excludes licensing (50% of process capital only)
+    dep = (capex - cap.get("licensing_fixed_total", 0.0)) * 0.5 / 10.0
+
+    # Cash flows depend on a sample only through its annual kg, so solve each
+    # distinct production level once (collapses to a single evaluation when no
+    # strain has process-time variability)
+    kg_levels, level_of_sample = np.unique(kg_samples, return_inverse=True)
+
+    # Build the (levels x 13) cash-flow matrix in one pass: rows are production
+    # levels, columns are project years (0-1 construction, 2-12 operations)
+    n_levels = kg_levels.size
+    kg = kg_levels[:, None] * CAPACITY_PROFILE[None, 2:]
+    revenue = kg * price_per_kg
+    # Variable costs scale with actual production
+    cogs = kg * var_opex_base + fixed_opex
+    # Apply royalty on pre-royalty EBITDA
+    ebitda_pre = revenue - cogs
+    royalty_paid = np.maximum(0.0, ebitda_pre) * royalty_rate
+    ebitda = ebitda_pre - royalty_paid
+    ebt = ebitda - dep
+    tax = np.maximum(0.0, ebt * ASSUMPTIONS_NS.tax_rate)
+    ufcf = ebitda - tax
+    cashflows = np.hstack(
+        [
+            np.full((n_levels, 1), -capex * 0.70),  # Year 0
+            np.full((n_levels, 1), -capex * 0.30),  # Year 1
+            ufcf,
+        ]
+    )
 
-        if np.isfinite(calc_irr):
-            irr_dist.append(float(calc_irr))
-        npv_dist.append(float(calc_npv))
+    # Calculate financial metrics per level, then map back onto the samples
+    discount = (1 + ASSUMPTIONS_NS.discount_rate) ** YEAR_IDX
+    level_npv = (cashflows / discount).sum(axis=1)
+    level_irr = irr_rows(cashflows)
+    level_irr[~np.isfinite(level_irr)] = np.nan
+    npv_dist = level_npv[level_of_sample]
+    irr_dist = level_irr[level_of_sample]
 
-    # Calculate statistics
+    # Calculate statistics (NaN-aware so non-convergent IRRs are skipped)
+    has_irr = bool(np.isfinite(irr_dist).any())
     irr_stats = {
-        "mean": np.mean(irr_dist) if irr_dist else np.nan,
-        "std": np.std(irr_dist) if irr_dist else np.nan,
-        "p10": np.percentile(irr_dist, 10) if irr_dist else np.nan,
-        "p50": np.percentile(irr_dist, 50) if irr_dist else np.nan,
-        "p90": np.percentile(irr_dist, 90) if irr_dist else np.nan,
+        "mean": np.nanmean(irr_dist) if has_irr else np.nan,
+        "std": np.nanstd(irr_dist) if has_irr else np.nan,
+        "p10": np.nanpercentile(irr_dist, 10) if has_irr else np.nan,
+        "p50": np.nanpercentile(irr_dist, 50) if has_irr else np.nan,
+        "p90": np.nanpercentile(irr_dist, 90) if has_irr else np.nan,
     }
 
     npv_stats = {
@@ -1067,15 +1389,15 @@ def _price_per_kg_from_flags(anaerobic: bool, premium_spores: bool, sacco: bool)
     """Legacy pricing function for single-product facilities.
     Should not be used for multi-product facilities like facility 5."""
     return (
-        ASSUMPTIONS["price_bacillus_usd_per_kg"]
+        ASSUMPTIONS_NS.price_bacillus_usd_per_kg
         if premium_spores
         else (
-            ASSUMPTIONS["price_lacto_bifido_usd_per_kg"]
+            ASSUMPTIONS_NS.price_lacto_bifido_usd_per_kg
             if anaerobic
             else (
-                ASSUMPTIONS["price_sacco_usd_per_kg"]
+                ASSUMPTIONS_NS.price_sacco_usd_per_kg
                 if sacco
-                else (ASSUMPTIONS["price_yogurt_usd_per_kg"])
+                else (ASSUMPTIONS_NS.price_yogurt_usd_per_kg)
             )
         )
     )
@@ -1094,39 +1416,30 @@ def _get_weighted_price_per_kg(strain_names, fermenter_volume_L=2000):
     Returns:
         float: Weighted average price per kg in USD
     """
-    total_weight = 0
-    weighted_price = 0
-
-    for strain in strain_names:
-        # Get strain-specific data
-        strain_data = STRAIN_BATCH_DB[strain]
-        yield_per_batch = (
-            strain_data["yield_g_per_L"] * fermenter_volume_L / 1000
-        )  # kg per batch
-
-        # Get strain-specific price
-        price_per_kg = None
-        if "price_yogurt_usd_per_kg" in strain_data:
-            price_per_kg = strain_data["price_yogurt_usd_per_kg"]
-        elif "price_lacto_bifido_usd_per_kg" in strain_data:
-            price_per_kg = strain_data["price_lacto_bifido_usd_per_kg"]
-        elif "price_bacillus_usd_per_kg" in strain_data:
-            price_per_kg = strain_data["price_bacillus_usd_per_kg"]
-        elif "price_sacco_usd_per_kg" in strain_data:
-            price_per_kg = strain_data["price_sacco_usd_per_kg"]
-        else:
-            # Fallback to default pricing if not specified
-            price_per_kg = ASSUMPTIONS["price_yogurt_usd_per_kg"]
+    return _weighted_price_per_kg_cached(tuple(strain_names), fermenter_volume_L)
 
-        # Weight by production capacity
-        weighted_price += price_per_kg * yield_per_batch
-        total_weight += yield_per_batch
+
+@lru_cache(maxsize=1024)
+def _weighted_price_per_kg_cached(strains_key, fermenter_volume_L):
+    table = _strain_table_cached(strains_key)
+    # kg per batch for each strain
+    yield_per_batch = table["yield_g_per_L"].to_numpy() * fermenter_volume_L / 1000
+
+    # Strain-specific price, falling back to default pricing if not specified
+    price_per_kg = table["price_usd_per_kg"].to_numpy()
+    price_per_kg = np.where(
+        np.isnan(price_per_kg), ASSUMPTIONS_NS.price_yogurt_usd_per_kg, price_per_kg
+    )
+
+    # Weight by production capacity
+    weighted_price = sum((price_per_kg * yield_per_batch).tolist())
+    total_weight = sum(yield_per_batch.tolist())
 
     # Return weighted average
     return (
         weighted_price / total_weight
         if total_weight > 0
-        else ASSUMPTIONS["price_yogurt_usd_per_kg"]
+        else ASSUMPTIONS_NS.price_yogurt_usd_per_kg
     )
 
 
@@ -1152,7 +1465,7 @@ def _financials_for_counts(
       - NEW: If use_stochastic=True, returns probabilistic metrics from Monte Carlo
     """
     # capacity
-    _, totals, plant = capacity_given_counts(
+    det_df, totals, plant = capacity_given_counts(
         strain_names, reactors, ds_lines, fermenter_volume_L
     )
     plant_kg_good = plant["plant_kg_good"]
@@ -1209,20 +1522,9 @@ def _financials_for_counts(
     else:
         # Original deterministic calculation
         # media/cryo averages (recompute from STRAIN_DB for selected strains)
-        df_media = pd.DataFrame(
-            [
-                {"Strain": s, "Media Cost/Batch (USD)": STRAIN_DB[s]["media_cost_usd"]}
-                for s in strain_names
-            ]
-        )
-        df_cryo = pd.DataFrame(
-            [
-                {"Strain": s, "Cryo Cost/Batch (USD)": STRAIN_DB[s]["cryo_cost_usd"]}
-                for s in strain_names
-            ]
-        )
-        avg_media_cost = df_media["Media Cost/Batch (USD)"].mean()
-        avg_cryo_cost = df_cryo["Cryo Cost/Batch (USD)"].mean()
+        table = _strain_table_cached(tuple(strain_names))
+        avg_media_cost = table["media_cost_usd"].to_numpy(dtype=np.float64).mean()
+        avg_cryo_cost = table["cryo_cost_usd"].to_numpy(dtype=np.float64).mean()
         avg_rm_cost_per_batch = float(avg_media_cost + avg_cryo_cost)
 
         # OPEX - includes licensing metadata
@@ -1240,6 +1542,7 @@ def _financials_for_counts(
             strains=strain_names,
             fermenters=reactors,
             ds_lines=ds_lines,
+            det_df=det_df,
         )
 
         # Extract licensing metadata
@@ -1254,21 +1557,19 @@ def _financials_for_counts(
             price_per_kg = _price_per_kg_from_flags(anaerobic, premium_spores, sacco)
         steady_state_kg = target_tpa * 1000.0
         var_opex_per_kg = (
-            ASSUMPTIONS["variable_opex_share"] * opx["total_cash_opex"]
+            ASSUMPTIONS_NS.variable_opex_share * opx["total_cash_opex"]
         ) / steady_state_kg
-        fixed_opex = (1 - ASSUMPTIONS["variable_opex_share"]) * opx["total_cash_opex"]
-        years = list(range(0, 13))
+        fixed_opex = (1 - ASSUMPTIONS_NS.variable_opex_share) * opx["total_cash_opex"]
         capex_spend = [0] * 13
         capex_spend[0] = -capex * 0.70
         capex_spend[1] = -capex * 0.30
-        capacities = [0, 0, 0.40, 0.60, 0.75, 0.85] + [0.85] * 7
 
         cashflows = []
-        for i, yr in enumerate(years):
+        for i in YEAR_IDX:
             if i < 2:
                 ufcf = capex_spend[i]
             else:
-                util = capacities[i]
+                util = CAPACITY_PROFILE[i]
                 kg = steady_state_kg * util
                 revenue = kg * price_per_kg
                 cogs = kg * var_opex_per_kg + fixed_opex
@@ -1279,11 +1580,11 @@ def _financials_for_counts(
                 # Depreciation excludes licensing (50% of process capital only)
                 dep = (capex - licensing_fixed) * 0.5 / 10.0
                 ebt = ebitda - dep
-                tax = max(0.0, ebt * ASSUMPTIONS["tax_rate"])
+                tax = max(0.0, ebt * ASSUMPTIONS_NS.tax_rate)
                 ufcf = ebitda - tax
             cashflows.append(ufcf)
 
-        calc_npv = npv(ASSUMPTIONS["discount_rate"], cashflows)
+        calc_npv = npv(ASSUMPTIONS_NS.discount_rate, cashflows)
         calc_irr = irr(cashflows)
 
         return {
@@ -1301,6 +1602,27 @@ def _financials_for_counts(
         }
 
 
+def _pareto_front_2d(data):
+    """Non-dominated mask for two minimization objectives via sort-and-sweep.
+
+    Equivalent to the pairwise dominance scan in O(n log n): a point is dominated
+    when an earlier point (smaller first objective) has a second objective no
+    larger than its own, or a point with the same first objective has a strictly
+    smaller second objective. Rows with a NaN objective compare false against
+    everything, so they are never dominated and never dominate.
+    """
+    mask = np.ones(data.shape[0], dtype=bool)
+    valid = np.flatnonzero(~np.isnan(data).any(axis=1))
+    a, b = data[valid, 0], data[valid, 1]
+    order = np.lexsort((b, a))
+    a_s, b_s = a[order], b[order]
+    group_start = np.searchsorted(a_s, a_s, side="left")
+    prefix_min = np.concatenate(([np.inf], np.minimum.accumulate(b_s)))
+    dominated = (prefix_min[group_start] <= b_s) | (b_s[group_start] < b_s)
+    mask[valid[order[dominated]]] = False
+    return mask
+
+
 def _pareto_front(df, minimize_cols=("capex",), maximize_cols=("irr",)):
     """Return a boolean mask marking non-dominated solutions (Pareto front)."""
     vals = df.copy()
@@ -1309,7 +1631,11 @@ def _pareto_front(df, minimize_cols=("capex",), maximize_cols=("irr",)):
     for c in maximize_cols:
         vals[c] = -vals[c]  # convert to minimization by negating
 
-    data = vals[list(minimize_cols) + list(maximize_cols)].to_numpy()
+    data = vals[list(minimize_cols) + list(maximize_cols)].to_numpy(dtype=np.float64)
+    if data.shape[1] == 2:
+        return _pareto_front_2d(data)
+
+    # General case (more than two objectives): pairwise dominance scan
     n = data.shape[0]
     is_dominated = np.zeros(n, dtype=bool)
     for i in range(n):
@@ -1329,21 +1655,24 @@ def _choose_knee_point(pareto_df):
     """Pick the 'knee' (closest to utopia: min CAPEX, max IRR) with normalization."""
     if pareto_df.empty:
         return None
-    cap_min, cap_max = pareto_df["capex"].min(), pareto_df["capex"].max()
-    irr_min, irr_max = pareto_df["irr"].min(), pareto_df["irr"].max()
+    cap = pareto_df["capex"].to_numpy(dtype=np.float64)
+    irr_v = pareto_df["irr"].to_numpy(dtype=np.float64)
+    cap_min, cap_max = np.nanmin(cap), np.nanmax(cap)
+    irr_min, irr_max = np.nanmin(irr_v), np.nanmax(irr_v)
 
     # Normalize (lower capex better -> 0; higher irr better -> 0 after flipping sign)
-    def norm_cap(x):
-        return 0.0 if cap_max == cap_min else (x - cap_min) / (cap_max - cap_min)
-
-    def norm_irr(x):
-        return 0.0 if irr_max == irr_min else (irr_max - x) / (irr_max - irr_min)
-
-    d = (
-        pareto_df["capex"].apply(norm_cap) ** 2 + pareto_df["irr"].apply(norm_irr) ** 2
-    ) ** 0.5
-    idx = d.idxmin()
-    return int(idx)
+    cap_n = (
+        np.zeros_like(cap)
+        if cap_max == cap_min
+        else (cap - cap_min) / (cap_max - cap_min)
+    )
+    irr_n = (
+        np.zeros_like(irr_v)
+        if irr_max == irr_min
+        else (irr_max - irr_v) / (irr_max - irr_min)
+    )
+    d = (cap_n**2 + irr_n**2) ** 0.5
+    return int(pareto_df.index[np.nanargmin(d)])
 
 
 def parse_media_components(strain_name):
@@ -1498,6 +1827,66 @@ def parse_media_components(strain_name):
     return media_components, cryo_components
 
 
+# Base headcount (15 TPA reference plant) for the detailed OPEX labor rows,
+# as parallel arrays: position, head count, loaded annual salary
+_LABOR_POSITIONS = (
+    "Plant Manager",
+    "Fermentation Specialist",
+    "Downstream Process Operator",
+    "General Technician",
+    "QA/QC Lab Technician",
+    "Maintenance Technician",
+    "Utility Operator",
+    "Logistics Clerk",
+    "Office Clerk",
+)
+_LABOR_COUNTS = np.array([1, 3, 3, 2, 1, 1, 2, 1, 1], dtype=np.float64)
+_LABOR_SALARY_KEYS = (
+    "plant_manager_salary",
+    "fermentation_specialist_salary",
+    "downstream_process_operator_salary",
+    "general_technician_salary",
+    "qaqc_lab_tech_salary",
+    "maintenance_tech_salary",
+    "utility_operator_salary",
+    "logistics_clerk_salary",
+    "office_clerk_salary",
+)
+_LABOR_SALARIES = np.array(
+    [getattr(ASSUMPTIONS_NS, k) for k in _LABOR_SALARY_KEYS], dtype=np.float64
+)
+
+
+def _average_labor_cost():
+    # Base 15-FTE roster cost per FTE, as used by opex_block
+    return (
+        sum(
+            salary * count
+            for salary, count in zip(_LABOR_SALARIES.tolist(), _LABOR_COUNTS.tolist())
+        )
+        / 15
+    )
+
+
+_AVG_LABOR_COST = _average_labor_cost()
+
+
+def _round_column(values, ndigits):
+    """Round a sequence of floats to ``ndigits`` as a float64 array.
+
+    Same results as Python's ``round``: ``np.round`` scales by ``10**ndigits``
+    first, which can tip values sitting on a half-way point, so those few cells
+    are redone with ``round``.
+    """
+    arr = np.fromiter(values, dtype=np.float64, count=len(values))
+    out = arr.round(ndigits)
+    scaled = np.abs(arr) * 10.0**ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-9 + 1e-15 * scaled
+    for i in np.flatnonzero(near_tie).tolist():
+        out[i] = round(float(arr[i]), ndigits)
+    return out
+
+
 def generate_detailed_opex_report(
     strains,
     fermenters,
@@ -1507,49 +1896,108 @@ def generate_detailed_opex_report(
     plant_kg_good,
     plant_batches_good,
     price_per_kg=None,
+    strain_batches_map=None,
+):
+    """Generate detailed OPEX breakdown with component-level details.
+
+    Reports are memoized on the full argument tuple (see clear_model_caches());
+    each call returns a fresh copy of the cached DataFrame.
+
+    Returns:
+        tuple: ``(opex_df, totals)`` where ``totals`` holds the rounded figures
+            shown in the report: ``total_opex``, ``total_labor``,
+            ``maintenance`` and ``ga``, plus the weighted ``royalty_rate``.
+
+    Args:
+        strain_batches_map: Optional mapping of strain name to good batches per year.
+            Pass the allocation the caller already computed for the same
+            (strains, fermenters, ds_lines, fermenter_volume_L) to skip a second
+            deterministic capacity solve. Computed here when None.
+    """
+    opex_df, totals = _detailed_opex_report_cached(
+        tuple(strains),
+        fermenters,
+        ds_lines,
+        fermenter_volume_L,
+        target_tpa,
+        plant_kg_good,
+        plant_batches_good,
+        price_per_kg,
+        None if strain_batches_map is None else tuple(strain_batches_map.items()),
+    )
+    return opex_df.copy(), dict(totals)
+
+
+@lru_cache(maxsize=256)
+def _detailed_opex_report_cached(
+    strains,
+    fermenters,
+    ds_lines,
+    fermenter_volume_L,
+    target_tpa,
+    plant_kg_good,
+    plant_batches_good,
+    price_per_kg,
+    strain_batches_items,
 ):
-    """Generate detailed OPEX breakdown with component-level details."""
-    opex_data = []
+    strain_batches_map = (
+        None if strain_batches_items is None else dict(strain_batches_items)
+    )
+    # Report columns are accumulated as plain lists and assembled once at the end
+    category, strain_col, component_col = [], [], []
+    unit_price, usage_per_batch, annual_usage = [], [], []
+    annual_cost_col, cost_per_kg = [], []
+    opex_columns = (
+        category,
+        strain_col,
+        component_col,
+        unit_price,
+        usage_per_batch,
+        annual_usage,
+        annual_cost_col,
+        cost_per_kg,
+    )
+
+    def add_opex_row(*values):
+        for column, value in zip(opex_columns, values):
+            column.append(value)
 
     # Calculate working volume (80% of fermenter volume)
     working_volume_L = fermenter_volume_L * 0.8
     scale_factor = working_volume_L / 1600.0  # Scale from base 1600L working volume
 
-    # Get actual strain batch allocations from capacity calculation
-    df_det, _ = calculate_deterministic_capacity(
-        build_strainspecs(strains, fermenter_volume_L=fermenter_volume_L),
-        EquipmentConfig(
-            year_hours=ASSUMPTIONS["hours_per_year"],
-            reactors_total=fermenters,
-            ds_lines_total=ds_lines,
-            upstream_availability=ASSUMPTIONS["upstream_availability"],
-            downstream_availability=ASSUMPTIONS["downstream_availability"],
-            quality_yield=ASSUMPTIONS["quality_yield"],
-        ),
-        reactor_allocation_policy="inverse_ct",
-        ds_allocation_policy="inverse_ct",
-    )
+    if strain_batches_map is None:
+        # Get actual strain batch allocations from capacity calculation
+        df_det, _ = deterministic_capacity_for_counts(
+            strains, fermenters, ds_lines, fermenter_volume_L
+        )
 
-    # Create a mapping of strain to actual good batches
-    strain_batches_map = {
-        row["name"]: row["good_batches"] for _, row in df_det.iterrows()
-    }
+        # Create a mapping of strain to actual good batches
+        strain_batches_map = dict(
+            zip(df_det["name"].tolist(), df_det["good_batches"].tolist())
+        )
+
+    # Per-strain inputs as arrays aligned with ``strains`` (struct-of-arrays)
+    n_strains = len(strains)
+    table = _strain_table_cached(tuple(strains))
+    S = {k: table[k].to_numpy(dtype=np.float64) for k in _STRAIN_BATCH_COLUMNS}
+    # Actual allocated batches
+    batches = np.fromiter(
+        (strain_batches_map.get(strain, 0) for strain in strains),
+        dtype=np.float64,
+        count=n_strains,
+    )
+    batch_mass = S["yield_g_per_L"] * working_volume_L / 1000  # kg per batch
+    # Annual kg per strain, the cost-per-kg denominator for media, cryo and steam
+    kg_per_strain = batch_mass * batches
 
     # Raw materials breakdown by strain
     total_media_cost = 0
     total_cryo_cost = 0
 
-    for strain in strains:
-        strain_data = STRAIN_BATCH_DB[strain]
-        # Calculate strain production metrics using actual batch allocation
-        yield_per_batch = (
-            strain_data["yield_g_per_L"] * working_volume_L / 1000
-        )  # kg per batch
-        batches_per_strain = strain_batches_map.get(
-            strain, 0
-        )  # Actual allocated batches
-        annual_production = yield_per_batch * batches_per_strain
-
+    for strain, batches_per_strain, annual_production in zip(
+        strains, batches.tolist(), kg_per_strain.tolist()
+    ):
         # Get media components
         media_components, cryo_components = parse_media_components(strain)
 
@@ -1561,22 +2009,15 @@ def generate_detailed_opex_report(
                 annual_cost = annual_kg * RAW_PRICES[component]
                 total_media_cost += annual_cost
 
-                opex_data.append(
-                    {
-                        "Category": "Raw Materials - Media",
-                        "Strain": strain,
-                        "Component": component,
-                        "Unit Price (USD/kg)": RAW_PRICES[component],
-                        "Usage per Batch (kg)": round(kg_per_batch, 3),
-                        "Annual Usage (kg)": round(annual_kg, 1),
-                        "Annual Cost (USD)": round(annual_cost, 2),
-                        "Cost per kg DCW (USD/kg)": round(
-                            annual_cost / annual_production
-                            if annual_production > 0
-                            else 0,
-                            2,
-                        ),
-                    }
+                add_opex_row(
+                    "Raw Materials - Media",
+                    strain,
+                    component,
+                    RAW_PRICES[component],
+                    round(kg_per_batch, 3),
+                    round(annual_kg, 1),
+                    annual_cost,
+                    annual_cost / annual_production if annual_production > 0 else 0,
                 )
 
         # Cryo components
@@ -1587,213 +2028,143 @@ def generate_detailed_opex_report(
                 annual_cost = annual_kg * RAW_PRICES[component]
                 total_cryo_cost += annual_cost
 
-                opex_data.append(
-                    {
-                        "Category": "Raw Materials - Cryoprotectants",
-                        "Strain": strain,
-                        "Component": component,
-                        "Unit Price (USD/kg)": RAW_PRICES[component],
-                        "Usage per Batch (kg)": round(kg_per_batch, 3),
-                        "Annual Usage (kg)": round(annual_kg, 1),
-                        "Annual Cost (USD)": round(annual_cost, 2),
-                        "Cost per kg DCW (USD/kg)": round(
-                            annual_cost / annual_production
-                            if annual_production > 0
-                            else 0,
-                            2,
-                        ),
-                    }
+                add_opex_row(
+                    "Raw Materials - Cryoprotectants",
+                    strain,
+                    component,
+                    RAW_PRICES[component],
+                    round(kg_per_batch, 3),
+                    round(annual_kg, 1),
+                    annual_cost,
+                    annual_cost / annual_production if annual_production > 0 else 0,
                 )
 
     # Utilities breakdown
     electricity_rate = 0.107  # USD/kWh
     steam_rate = 0.0228  # USD/kg steam
 
-    total_electricity_cost = 0
-    total_steam_cost = 0
-
-    for strain in strains:
-        strain_data = STRAIN_BATCH_DB[strain]
-        batches_per_strain = strain_batches_map.get(
-            strain, 0
-        )  # Use actual allocated batches
-
-        # Electricity consumption
-        ferm_kwh_per_batch = strain_data["utility_rate_ferm_kw"]
-        cent_kwh_per_batch = (
-            strain_data["utility_rate_cent_kw"]
-            * strain_data["t_downstrm_h"]
-            * (fermenter_volume_L / 1000)
-        )
-        lyo_kwh_per_batch = (
-            strain_data["utility_rate_lyo_kw"]
-            * strain_data["t_downstrm_h"]
-            * fermenter_volume_L
-        )
+    # Electricity consumption (chained products are updated in place so each
+    # step reuses one scratch array instead of allocating a temporary)
+    cent_kwh_per_batch = S["utility_rate_cent_kw"] * S["t_downstrm_h"]
+    cent_kwh_per_batch *= fermenter_volume_L / 1000
+    lyo_kwh_per_batch = S["utility_rate_lyo_kw"] * S["t_downstrm_h"]
+    lyo_kwh_per_batch *= fermenter_volume_L
+    # Fermentation kWh per batch is already a total: S["utility_rate_ferm_kw"]
+    total_kwh_per_batch = S["utility_rate_ferm_kw"] + cent_kwh_per_batch
+    total_kwh_per_batch += lyo_kwh_per_batch
+    annual_kwh = total_kwh_per_batch * batches
+    annual_electricity_cost = annual_kwh * electricity_rate
+    # Same kg as kg_per_strain, but in the multiplication order of the
+    # reported figures; the reordered product can shift a rounded cent
+    electricity_per_kg = np.divide(
+        annual_electricity_cost,
+        S["yield_g_per_L"] * working_volume_L * batches / 1000,
+        out=np.zeros(n_strains),
+        where=batches > 0,
+    )
 
-        total_kwh_per_batch = (
-            ferm_kwh_per_batch + cent_kwh_per_batch + lyo_kwh_per_batch
-        )
-        annual_kwh = total_kwh_per_batch * batches_per_strain
-        annual_electricity_cost = annual_kwh * electricity_rate
-        total_electricity_cost += annual_electricity_cost
+    # Steam consumption
+    steam_per_batch = batch_mass * 10  # Assume 10 kg steam per kg product
+    annual_steam = steam_per_batch * batches
+    annual_steam_cost = annual_steam * steam_rate
+    steam_per_kg = np.divide(
+        annual_steam_cost, kg_per_strain, out=np.zeros(n_strains), where=batches > 0
+    )
 
-        opex_data.append(
-            {
-                "Category": "Utilities - Electricity",
-                "Strain": strain,
-                "Component": "Electricity (Fermentation + DS)",
-                "Unit Price (USD/kg)": electricity_rate,
-                "Usage per Batch (kg)": round(total_kwh_per_batch, 1),
-                "Annual Usage (kg)": round(annual_kwh, 0),
-                "Annual Cost (USD)": round(annual_electricity_cost, 2),
-                "Cost per kg DCW (USD/kg)": round(
-                    annual_electricity_cost
-                    / (
-                        strain_data["yield_g_per_L"]
-                        * working_volume_L
-                        * batches_per_strain
-                        / 1000
-                    )
-                    if batches_per_strain > 0
-                    else 0,
-                    2,
-                ),
-            }
+    total_electricity_cost = float(annual_electricity_cost.sum())
+    total_steam_cost = float(annual_steam_cost.sum())
+
+    for (
+        strain,
+        kwh,
+        kwh_yr,
+        elec_cost,
+        elec_kg,
+        steam,
+        steam_yr,
+        steam_cost,
+        steam_kg,
+    ) in zip(
+        strains,
+        total_kwh_per_batch.tolist(),
+        annual_kwh.tolist(),
+        annual_electricity_cost.tolist(),
+        electricity_per_kg.tolist(),
+        steam_per_batch.tolist(),
+        annual_steam.tolist(),
+        annual_steam_cost.tolist(),
+        steam_per_kg.tolist(),
+    ):
+        add_opex_row(
+            "Utilities - Electricity",
+            strain,
+            "Electricity (Fermentation + DS)",
+            electricity_rate,
+            round(kwh, 1),
+            round(kwh_yr, 0),
+            elec_cost,
+            elec_kg,
         )
-
-        # Steam consumption
-        batch_mass_kg = strain_data["yield_g_per_L"] * working_volume_L / 1000
-        steam_per_batch = batch_mass_kg * 10  # Assume 10 kg steam per kg product
-        annual_steam = steam_per_batch * batches_per_strain
-        annual_steam_cost = annual_steam * steam_rate
-        total_steam_cost += annual_steam_cost
-
-        opex_data.append(
-            {
-                "Category": "Utilities - Steam",
-                "Strain": strain,
-                "Component": "Process Steam",
-                "Unit Price (USD/kg)": steam_rate,
-                "Usage per Batch (kg)": round(steam_per_batch, 1),
-                "Annual Usage (kg)": round(annual_steam, 0),
-                "Annual Cost (USD)": round(annual_steam_cost, 2),
-                "Cost per kg DCW (USD/kg)": round(
-                    annual_steam_cost / (batch_mass_kg * batches_per_strain)
-                    if batches_per_strain > 0
-                    else 0,
-                    2,
-                ),
-            }
+        add_opex_row(
+            "Utilities - Steam",
+            strain,
+            "Process Steam",
+            steam_rate,
+            round(steam, 1),
+            round(steam_yr, 0),
+            steam_cost,
+            steam_kg,
         )
 
     # Labor breakdown - scale with production like in opex_block
     # Base headcount for 15 TPA, scales linearly with production
     ftes_scaling = target_tpa / 15.0 if target_tpa >= 15 else 1.0
 
-    labor_positions = [
-        {
-            "Position": "Plant Manager",
-            "Count": 1,
-            "Annual Salary": ASSUMPTIONS["plant_manager_salary"],
-        },
-        {
-            "Position": "Fermentation Specialist",
-            "Count": 3,
-            "Annual Salary": ASSUMPTIONS["fermentation_specialist_salary"],
-        },
-        {
-            "Position": "Downstream Process Operator",
-            "Count": 3,
-            "Annual Salary": ASSUMPTIONS["downstream_process_operator_salary"],
-        },
-        {
-            "Position": "General Technician",
-            "Count": 2,
-            "Annual Salary": ASSUMPTIONS["general_technician_salary"],
-        },
-        {
-            "Position": "QA/QC Lab Technician",
-            "Count": 1,
-            "Annual Salary": ASSUMPTIONS["qaqc_lab_tech_salary"],
-        },
-        {
-            "Position": "Maintenance Technician",
-            "Count": 1,
-            "Annual Salary": ASSUMPTIONS["maintenance_tech_salary"],
-        },
-        {
-            "Position": "Utility Operator",
-            "Count": 2,
-            "Annual Salary": ASSUMPTIONS["utility_operator_salary"],
-        },
-        {
-            "Position": "Logistics Clerk",
-            "Count": 1,
-            "Annual Salary": ASSUMPTIONS["logistics_clerk_salary"],
-        },
-        {
-            "Position": "Office Clerk",
-            "Count": 1,
-            "Annual Salary": ASSUMPTIONS["office_clerk_salary"],
-        },
-    ]
-
-    total_labor_cost = 0
-    for position in labor_positions:
-        # Scale headcount with production for all positions
-        scaled_count = position["Count"] * ftes_scaling
-        annual_cost = scaled_count * position["Annual Salary"]
-        total_labor_cost += annual_cost
-
-        opex_data.append(
-            {
-                "Category": "Labor",
-                "Strain": "Common",
-                "Component": position["Position"],
-                "Unit Price (USD/kg)": position["Annual Salary"],
-                "Usage per Batch (kg)": round(scaled_count, 2),
-                "Annual Usage (kg)": round(scaled_count, 2),
-                "Annual Cost (USD)": round(annual_cost, 2),
-                "Cost per kg DCW (USD/kg)": round(
-                    annual_cost / plant_kg_good if plant_kg_good > 0 else 0, 2
-                ),
-            }
+    scaled_counts = _LABOR_COUNTS * ftes_scaling
+    annual_costs = scaled_counts * _LABOR_SALARIES
+    total_labor_cost = float(annual_costs.sum())
+    for position, salary, scaled_count, annual_cost in zip(
+        _LABOR_POSITIONS,
+        _LABOR_SALARIES.tolist(),
+        scaled_counts.tolist(),
+        annual_costs.tolist(),
+    ):
+        add_opex_row(
+            "Labor",
+            "Common",
+            position,
+            salary,
+            round(scaled_count, 2),
+            round(scaled_count, 2),
+            annual_cost,
+            annual_cost / plant_kg_good if plant_kg_good > 0 else 0,
         )
 
     # Other OPEX components
     _, cap = capex_estimate_2(target_tpa, fermenters, ds_lines, fermenter_volume_L)
-    maintenance_cost = ASSUMPTIONS["maintenance_pct_of_equip"] * cap["equip"]
-    ga_cost = ASSUMPTIONS["ga_other_scale_factor"] * (target_tpa * 1000.0)
-
-    opex_data.append(
-        {
-            "Category": "Maintenance",
-            "Strain": "Common",
-            "Component": "Equipment Maintenance (9% of equipment cost)",
-            "Unit Price (USD/kg)": "-",
-            "Usage per Batch (kg)": "-",
-            "Annual Usage (kg)": "-",
-            "Annual Cost (USD)": round(maintenance_cost, 2),
-            "Cost per kg DCW (USD/kg)": round(
-                maintenance_cost / plant_kg_good if plant_kg_good > 0 else 0, 2
-            ),
-        }
+    maintenance_cost = ASSUMPTIONS_NS.maintenance_pct_of_equip * cap["equip"]
+    ga_cost = ASSUMPTIONS_NS.ga_other_scale_factor * (target_tpa * 1000.0)
+
+    add_opex_row(
+        "Maintenance",
+        "Common",
+        "Equipment Maintenance (9% of equipment cost)",
+        "-",
+        "-",
+        "-",
+        maintenance_cost,
+        maintenance_cost / plant_kg_good if plant_kg_good > 0 else 0,
     )
 
-    opex_data.append(
-        {
-            "Category": "G&A",
-            "Strain": "Common",
-            "Component": "General & Administrative",
-            "Unit Price (USD/kg)": "-",
-            "Usage per Batch (kg)": "-",
-            "Annual Usage (kg)": "-",
-            "Annual Cost (USD)": round(ga_cost, 2),
-            "Cost per kg DCW (USD/kg)": round(
-                ga_cost / plant_kg_good if plant_kg_good > 0 else 0, 2
-            ),
-        }
+    add_opex_row(
+        "G&A",
+        "Common",
+        "General & Administrative",
+        "-",
+        "-",
+        "-",
+        ga_cost,
+        ga_cost / plant_kg_good if plant_kg_good > 0 else 0,
     )
 
     # Add licensing royalty information (before TOTAL OPEX)
@@ -1817,24 +2188,19 @@ def generate_detailed_opex_report(
         ebitda_pre = steady_state_revenue - steady_state_cogs
         licensing_royalty_estimate = max(0, ebitda_pre) * royalty_rate
 
-    opex_data.append(
-        {
-            "Category": "Licensing - Royalty",
-            "Strain": "ALL",
-            "Component": "Weighted Royalty Rate on EBITDA",
-            "Unit Price (USD/kg)": f"{royalty_rate:.2%}",
-            "Usage per Batch (kg)": "-",
-            "Annual Usage (kg)": "-",
-            "Annual Cost (USD)": round(licensing_royalty_estimate, 2)
-            if price_per_kg
-            else 0,
-            "Cost per kg DCW (USD/kg)": round(
-                licensing_royalty_estimate / plant_kg_good
-                if plant_kg_good > 0 and price_per_kg
-                else 0,
-                2,
-            ),
-        }
+    add_opex_row(
+        "Licensing - Royalty",
+        "ALL",
+        "Weighted Royalty Rate on EBITDA",
+        f"{royalty_rate:.2%}",
+        "-",
+        "-",
+        licensing_royalty_estimate if price_per_kg else 0,
+        (
+            licensing_royalty_estimate / plant_kg_good
+            if plant_kg_good > 0 and price_per_kg
+            else 0
+        ),
     )
 
     # Summary row
@@ -1848,162 +2214,194 @@ def generate_detailed_opex_report(
         + ga_cost
     )
 
-    opex_data.append(
+    add_opex_row(
+        "TOTAL OPEX",
+        "ALL",
+        "Total Operating Expenses",
+        "-",
+        "-",
+        "-",
+        total_opex,
+        total_opex / plant_kg_good if plant_kg_good > 0 else 0,
+    )
+
+    opex_df = pd.DataFrame(
         {
-            "Category": "TOTAL OPEX",
-            "Strain": "ALL",
-            "Component": "Total Operating Expenses",
-            "Unit Price (USD/kg)": "-",
-            "Usage per Batch (kg)": "-",
-            "Annual Usage (kg)": "-",
-            "Annual Cost (USD)": round(total_opex, 2),
-            "Cost per kg DCW (USD/kg)": round(
-                total_opex / plant_kg_good if plant_kg_good > 0 else 0, 2
-            ),
-        }
+            "Category": category,
+            "Strain": strain_col,
+            "Component": component_col,
+            "Unit Price (USD/kg)": unit_price,
+            "Usage per Batch (kg)": usage_per_batch,
+            "Annual Usage (kg)": annual_usage,
+            # Cost columns hold raw floats up to here; round both in one pass
+            "Annual Cost (USD)": _round_column(annual_cost_col, 2),
+            "Cost per kg DCW (USD/kg)": _round_column(cost_per_kg, 2),
+        },
+        copy=False,
     )
+    totals = {
+        "total_opex": float(opex_df["Annual Cost (USD)"].iat[-1]),
+        "total_labor": round(total_labor_cost, 2),
+        "maintenance": round(maintenance_cost, 2),
+        "ga": round(ga_cost, 2),
+        "royalty_rate": royalty_rate,
+    }
+    return opex_df, totals
 
-    return pd.DataFrame(opex_data)
+
+# Unit costs (USD, 2000 L basis) of the equipment that scales with fermenter volume
+# by the six-tenths rule: fermenter, seed fermenter, media tank, lyophilizer,
+# centrifuge, TFF skid
+_SCALED_EQUIPMENT_BASE_COSTS = np.array(
+    [150000, 50000, 75000, 400000, 120000, 100000], dtype=np.float64
+)
 
 
 def generate_detailed_capex_report(
     fermenters, ds_lines, fermenter_volume_L, target_tpa, strains=None
 ):
-    """Generate detailed CAPEX breakdown with individual equipment costs."""
-    capex_data = []
+    """Generate detailed CAPEX breakdown with individual equipment costs.
+
+    Memoized like generate_detailed_opex_report; returns a fresh copy per call.
+    """
+    return _detailed_capex_report_cached(
+        fermenters,
+        ds_lines,
+        fermenter_volume_L,
+        target_tpa,
+        None if strains is None else tuple(strains),
+    ).copy()
+
+
+@lru_cache(maxsize=256)
+def _detailed_capex_report_cached(
+    fermenters, ds_lines, fermenter_volume_L, target_tpa, strains
+):
+    # Report columns are accumulated as plain lists and assembled once at the end
+    category, item, quantity, unit_cost, total_cost = [], [], [], [], []
+    capex_columns = (category, item, quantity, unit_cost, total_cost)
+    running_total = 0.0  # sum of the Total Cost cells appended so far
+
+    def add_capex_row(*values):
+        nonlocal running_total
+        for column, value in zip(capex_columns, values):
+            column.append(value)
+        running_total += values[-1]
 
     # Calculate individual equipment quantities and costs
     base_volume = 2000
-    base_fermenter_cost = 150000
     volume_scale_factor = (fermenter_volume_L / base_volume) ** 0.6
+    (
+        fermenter_cost,
+        seed_fermenter_cost,
+        media_tank_cost,
+        lyo_cost,
+        centrifuge_cost,
+        tff_cost,
+    ) = (_SCALED_EQUIPMENT_BASE_COSTS * volume_scale_factor).tolist()
+
+    # Equipment counts (each evaluated once and reused across rows)
+    seed_fermenters = max(2, _iceil_div(fermenters * 7, 10)) + 1
+    media_tanks = _iceil_div(fermenters * 4, 7)
+    lyophilizers = max(1, ds_lines)
+    centrifuges = tff_skids = _iceil_div(max(2, ds_lines) * 2, 5)
+    mill_blend_units = max(1, _iceil_div(tff_skids, 2))
 
     # Fermenters (already includes spare when min 2 fermenters enforced)
-    fermenter_cost = base_fermenter_cost * volume_scale_factor
-    capex_data.append(
-        {
-            "Category": "Process Equipment",
-            "Item": f"{fermenter_volume_L}L Fermenters (min 2, incl. 1 spare)",
-            "Quantity": fermenters,
-            "Unit Cost (USD)": round(fermenter_cost, 0),
-            "Total Cost (USD)": round(fermenters * fermenter_cost, 0),
-        }
+    add_capex_row(
+        "Process Equipment",
+        f"{fermenter_volume_L}L Fermenters (min 2, incl. 1 spare)",
+        fermenters,
+        round(fermenter_cost, 0),
+        round(fermenters * fermenter_cost, 0),
     )
 
     # Seed fermenters
-    seed_fermenters = max(2, ceil(fermenters * 0.7)) + 1
-    seed_fermenter_cost = 50000 * volume_scale_factor
-    capex_data.append(
-        {
-            "Category": "Process Equipment",
-            "Item": f"{int(fermenter_volume_L * 0.125)}L Seed Fermenters",
-            "Quantity": seed_fermenters,
-            "Unit Cost (USD)": round(seed_fermenter_cost, 0),
-            "Total Cost (USD)": round(seed_fermenters * seed_fermenter_cost, 0),
-        }
+    add_capex_row(
+        "Process Equipment",
+        f"{int(fermenter_volume_L * 0.125)}L Seed Fermenters",
+        seed_fermenters,
+        round(seed_fermenter_cost, 0),
+        round(seed_fermenters * seed_fermenter_cost, 0),
     )
 
     # Media tanks scale with fermenters
-    media_tanks = ceil(fermenters * 4 / 7)
-    media_tank_cost = 75000 * volume_scale_factor
-    capex_data.append(
-        {
-            "Category": "Process Equipment",
-            "Item": f"{int(fermenter_volume_L * 1.25)}L Media Tanks",
-            "Quantity": media_tanks,
-            "Unit Cost (USD)": round(media_tank_cost, 0),
-            "Total Cost (USD)": round(media_tanks * media_tank_cost, 0),
-        }
+    add_capex_row(
+        "Process Equipment",
+        f"{int(fermenter_volume_L * 1.25)}L Media Tanks",
+        media_tanks,
+        round(media_tank_cost, 0),
+        round(media_tanks * media_tank_cost, 0),
     )
 
     # Lyophilizers
-    lyo_cost = 400000 * volume_scale_factor
-    capex_data.append(
-        {
-            "Category": "Process Equipment",
-            "Item": "20m² Lyophilizers",
-            "Quantity": max(1, ds_lines),
-            "Unit Cost (USD)": round(lyo_cost, 0),
-            "Total Cost (USD)": round(max(1, ds_lines) * lyo_cost, 0),
-        }
+    add_capex_row(
+        "Process Equipment",
+        "20m² Lyophilizers",
+        lyophilizers,
+        round(lyo_cost, 0),
+        round(lyophilizers * lyo_cost, 0),
     )
 
     # Centrifuges
-    centrifuges = ceil(max(2, ds_lines) * 0.4)
-    centrifuge_cost = 120000 * volume_scale_factor
-    capex_data.append(
-        {
-            "Category": "Process Equipment",
-            "Item": "Disc-Stack Centrifuges",
-            "Quantity": centrifuges,
-            "Unit Cost (USD)": round(centrifuge_cost, 0),
-            "Total Cost (USD)": round(centrifuges * centrifuge_cost, 0),
-        }
+    add_capex_row(
+        "Process Equipment",
+        "Disc-Stack Centrifuges",
+        centrifuges,
+        round(centrifuge_cost, 0),
+        round(centrifuges * centrifuge_cost, 0),
     )
 
     # TFF Skids
-    tff_skids = ceil(max(2, ds_lines) * 0.4)
-    tff_cost = 100000 * volume_scale_factor
-    capex_data.append(
-        {
-            "Category": "Process Equipment",
-            "Item": "TFF Skids",
-            "Quantity": tff_skids,
-            "Unit Cost (USD)": round(tff_cost, 0),
-            "Total Cost (USD)": round(tff_skids * tff_cost, 0),
-        }
+    add_capex_row(
+        "Process Equipment",
+        "TFF Skids",
+        tff_skids,
+        round(tff_cost, 0),
+        round(tff_skids * tff_cost, 0),
     )
 
     # Mill/Blend/Container
     mill_blend_cost = 125000
-    capex_data.append(
-        {
-            "Category": "Process Equipment",
-            "Item": "Mill/Blend/Container Equipment",
-            "Quantity": max(1, ceil(tff_skids * 0.5)),
-            "Unit Cost (USD)": round(mill_blend_cost, 0),
-            "Total Cost (USD)": round(
-                max(1, ceil(tff_skids * 0.5)) * mill_blend_cost, 0
-            ),
-        }
+    add_capex_row(
+        "Process Equipment",
+        "Mill/Blend/Container Equipment",
+        mill_blend_units,
+        round(mill_blend_cost, 0),
+        round(mill_blend_units * mill_blend_cost, 0),
     )
 
     # Utility systems
     utility_cost = 100000 + 150000 + 400000 + 120000 + 250000  # Various utility systems
-    capex_data.append(
-        {
-            "Category": "Utilities",
-            "Item": "Utility Systems (Autoclave, PW, WFI, Steam, CIP)",
-            "Quantity": max(1, ceil(tff_skids * 0.5)),
-            "Unit Cost (USD)": round(utility_cost, 0),
-            "Total Cost (USD)": round(max(1, ceil(tff_skids * 0.5)) * utility_cost, 0),
-        }
+    add_capex_row(
+        "Utilities",
+        "Utility Systems (Autoclave, PW, WFI, Steam, CIP)",
+        mill_blend_units,
+        round(utility_cost, 0),
+        round(mill_blend_units * utility_cost, 0),
     )
 
     # QC Lab equipment
     qc_equipment_cost = 180000 / 20000 * target_tpa * 1000
-    capex_data.append(
-        {
-            "Category": "QC Laboratory",
-            "Item": "QC Lab Equipment",
-            "Quantity": 1,
-            "Unit Cost (USD)": round(qc_equipment_cost, 0),
-            "Total Cost (USD)": round(qc_equipment_cost, 0),
-        }
+    add_capex_row(
+        "QC Laboratory",
+        "QC Lab Equipment",
+        1,
+        round(qc_equipment_cost, 0),
+        round(qc_equipment_cost, 0),
     )
 
-    # Calculate totals for equipment
-    total_equipment = sum([item["Total Cost (USD)"] for item in capex_data])
+    # Calculate totals for equipment (only equipment rows have been added so far)
+    total_equipment = running_total
 
     # Installation
     installation_cost = total_equipment * 0.15
-    capex_data.append(
-        {
-            "Category": "Installation",
-            "Item": "Installation & Commissioning (15% of equipment)",
-            "Quantity": 1,
-            "Unit Cost (USD)": round(installation_cost, 0),
-            "Total Cost (USD)": round(installation_cost, 0),
-        }
+    add_capex_row(
+        "Installation",
+        "Installation & Commissioning (15% of equipment)",
+        1,
+        round(installation_cost, 0),
+        round(installation_cost, 0),
     )
 
     # Building and land scale with fermenters
@@ -2015,24 +2413,20 @@ def generate_detailed_capex_report(
         + 2000 * (fermenters * 500 * volume_scale_factor)
     )
 
-    capex_data.append(
-        {
-            "Category": "Infrastructure",
-            "Item": f"Land ({round(facility_area, 0)} m²)",
-            "Quantity": 1,
-            "Unit Cost (USD)": round(land_cost, 0),
-            "Total Cost (USD)": round(land_cost, 0),
-        }
+    add_capex_row(
+        "Infrastructure",
+        f"Land ({round(facility_area, 0)} m²)",
+        1,
+        round(land_cost, 0),
+        round(land_cost, 0),
     )
 
-    capex_data.append(
-        {
-            "Category": "Infrastructure",
-            "Item": "Building & Cleanrooms",
-            "Quantity": 1,
-            "Unit Cost (USD)": round(building_cost, 0),
-            "Total Cost (USD)": round(building_cost, 0),
-        }
+    add_capex_row(
+        "Infrastructure",
+        "Building & Cleanrooms",
+        1,
+        round(building_cost, 0),
+        round(building_cost, 0),
     )
 
     # Direct costs subtotal
@@ -2040,26 +2434,22 @@ def generate_detailed_capex_report(
 
     # Contingency
     contingency = direct_costs * 0.125
-    capex_data.append(
-        {
-            "Category": "Contingency",
-            "Item": "Contingency (12.5% of direct costs)",
-            "Quantity": 1,
-            "Unit Cost (USD)": round(contingency, 0),
-            "Total Cost (USD)": round(contingency, 0),
-        }
+    add_capex_row(
+        "Contingency",
+        "Contingency (12.5% of direct costs)",
+        1,
+        round(contingency, 0),
+        round(contingency, 0),
     )
 
     # Working capital
     working_capital = direct_costs * 0.1
-    capex_data.append(
-        {
-            "Category": "Working Capital",
-            "Item": "Initial Working Capital (10% of direct costs)",
-            "Quantity": 1,
-            "Unit Cost (USD)": round(working_capital, 0),
-            "Total Cost (USD)": round(working_capital, 0),
-        }
+    add_capex_row(
+        "Working Capital",
+        "Initial Working Capital (10% of direct costs)",
+        1,
+        round(working_capital, 0),
+        round(working_capital, 0),
     )
 
     # Licensing (fixed one-time fee)
@@ -2067,29 +2457,98 @@ def generate_detailed_capex_report(
     if strains:
         fixed_total = licensing_fixed_total(strains)
     if fixed_total > 0:
-        capex_data.append(
-            {
-                "Category": "Licensing",
-                "Item": "Strain Licensing (Fixed)",
-                "Quantity": len(strains) if strains else "-",
-                "Unit Cost (USD)": "-",
-                "Total Cost (USD)": round(fixed_total, 0),
-            }
+        add_capex_row(
+            "Licensing",
+            "Strain Licensing (Fixed)",
+            len(strains) if strains else "-",
+            "-",
+            round(fixed_total, 0),
         )
 
     # Total CAPEX - includes licensing if present
     total_capex = direct_costs + contingency + working_capital + fixed_total
-    capex_data.append(
+    add_capex_row(
+        "TOTAL",
+        "Total Initial Investment",
+        "-",
+        "-",
+        round(total_capex, 0),
+    )
+
+    return pd.DataFrame(
         {
-            "Category": "TOTAL",
-            "Item": "Total Initial Investment",
-            "Quantity": "-",
-            "Unit Cost (USD)": "-",
-            "Total Cost (USD)": round(total_capex, 0),
-        }
+            "Category": category,
+            "Item": item,
+            "Quantity": quantity,
+            "Unit Cost (USD)": unit_cost,
+            # Only numeric cells in this column, so pin it to float64 up front
+            "Total Cost (USD)": np.fromiter(
+                total_cost, dtype=np.float64, count=len(total_cost)
+            ),
+        },
+        copy=False,
     )
 
-    return pd.DataFrame(capex_data)
+
+# Years 0-1 of the P&L: construction only, so every operating line item is zero
+_CONSTRUCTION_ZEROS = np.zeros(2)
+
+
+def _pl_rollforward(
+    capacities,
+    plant_kg_good,
+    price_per_kg,
+    variable_opex_per_kg,
+    fixed_opex,
+    royalty_rate,
+    capex,
+    fixed_total,
+    tax_rate,
+):
+    """Year-by-year P&L and cash flow as arrays over ``len(capacities)`` years.
+
+    Years 0-1 are construction (70% / 30% CAPEX spend, no operations); later
+    years produce ``plant_kg_good * capacities[year]``. Royalty is charged on
+    positive pre-royalty EBITDA and depreciation excludes the licensing fees.
+    """
+    # Operating years only; the construction block is prepended at the end
+    production_kg = plant_kg_good * capacities[2:]
+    revenue = production_kg * price_per_kg
+    # COGS = Variable costs (scaled) + Fixed costs
+    cogs = production_kg * variable_opex_per_kg + fixed_opex
+    gross_profit = revenue - cogs
+    licensing_royalty = np.maximum(0, gross_profit) * royalty_rate
+    ebitda = gross_profit - licensing_royalty
+    # Depreciation (10-year straight line, 50% of process capital only)
+    depreciation = np.full(production_kg.size, (capex - fixed_total) * 0.5 / 10.0)
+    ebit = ebitda - depreciation
+    tax = np.maximum(0, ebit * tax_rate)
+    net_income = ebit - tax
+    # Cash Flow (add back depreciation) once operating, CAPEX spend before
+    construction_spend = np.array([-capex * 0.70, -capex * 0.30])
+    cashflow = np.concatenate((construction_spend, net_income + depreciation))
+    pl = {
+        key: np.concatenate((_CONSTRUCTION_ZEROS, values))
+        for key, values in (
+            ("production_kg", production_kg),
+            ("revenue", revenue),
+            ("cogs", cogs),
+            ("gross_profit", gross_profit),
+            ("licensing_royalty", licensing_royalty),
+            ("ebitda", ebitda),
+            ("depreciation", depreciation),
+            ("ebit", ebit),
+            ("tax", tax),
+            ("net_income", net_income),
+        )
+    }
+    pl["capacity"] = capacities
+    pl["capex_spend"] = np.concatenate(
+        (construction_spend, np.zeros(production_kg.size))
+    )
+    pl["cashflow"] = cashflow
+    pl["cumulative_cashflow"] = np.cumsum(cashflow)
+    return pl
 
 
 def generate_detailed_pl_statement(
@@ -2103,8 +2562,15 @@ def generate_detailed_pl_statement(
     anaerobic,
     premium_spores,
     sacco,
+    strain_batches_map=None,
 ):
-    """Generate detailed 10-year P&L statement with payback analysis including licensing."""
+    """Generate detailed 10-year P&L statement with payback analysis including licensing.
+
+    ``strain_batches_map`` is forwarded to ``generate_detailed_opex_report`` so a
+    caller holding the deterministic allocation does not trigger another solve.
+    OPEX and the royalty rate are read from that memoized report, so a caller
+    that has just built the OPEX report pays for the per-strain economics once.
+    """
 
     # Get price per kg
     if anaerobic and premium_spores and sacco:
@@ -2116,9 +2582,6 @@ def generate_detailed_pl_statement(
 
     # Calculate licensing costs
     fixed_total = licensing_fixed_total(strains)
-    royalty_rate, _ = weighted_royalty_rate(
-        strains, fermenters, ds_lines, fermenter_volume_L
-    )
 
     # Calculate CAPEX (includes licensing fixed cost)
     capex, cap = capex_estimate_2(
@@ -2129,122 +2592,82 @@ def generate_detailed_pl_statement(
         licensing_fixed_total_usd=fixed_total,
     )
 
-    # Calculate detailed OPEX (without licensing royalty - that's calculated from EBITDA)
-    opex_df = generate_detailed_opex_report(
-        strains,
+    # Calculate detailed OPEX (without licensing royalty - that's calculated from
+    # EBITDA). Only the cached totals are read, so the report frame is not copied
+    _, opex_totals = _detailed_opex_report_cached(
+        tuple(strains),
         fermenters,
         ds_lines,
         fermenter_volume_L,
         target_tpa,
         plant_kg_good,
         plant_batches_good,
+        None,
+        None if strain_batches_map is None else tuple(strain_batches_map.items()),
     )
-    total_opex = opex_df[opex_df["Category"] == "TOTAL OPEX"]["Annual Cost (USD)"].iloc[
-        0
-    ]
+    total_opex = opex_totals["total_opex"]
+    royalty_rate = opex_totals["royalty_rate"]
 
     # Variable vs fixed OPEX split
-    variable_opex_ratio = ASSUMPTIONS["variable_opex_share"]
+    variable_opex_ratio = ASSUMPTIONS_NS.variable_opex_share
     fixed_opex = total_opex * (1 - variable_opex_ratio)
     variable_opex_per_kg = (
         (total_opex * variable_opex_ratio) / plant_kg_good if plant_kg_good > 0 else 0
     )
 
     # Build 10-year P&L
-    years = list(range(0, 13))  # Years 0-12 (construction + 10 operational years)
-    capacities = [0, 0, 0.40, 0.60, 0.80, 1.00] + [1.00] * 7  # Ramp-up schedule
-
-    pl_data = []
-    cumulative_cashflow = 0
-    payback_year = None
-
-    for year in years:
-        if year < 2:
-            # Construction phase
-            capex_spend = -capex * 0.70 if year == 0 else -capex * 0.30
-            revenue = 0
-            production_kg = 0
-            cogs = 0
-            gross_profit = 0
-            licensing_royalty = 0
-            ebitda_pre_royalty = 0
-            ebitda = 0
-            depreciation = 0
-            ebit = 0
-            tax = 0
-            net_income = 0
-            cashflow = capex_spend
-        else:
-            # Operational phase
-            capacity_util = capacities[year]
-            production_kg = plant_kg_good * capacity_util
-            revenue = production_kg * price_per_kg
-
-            # COGS = Variable costs (scaled) + Fixed costs
-            cogs = (production_kg * variable_opex_per_kg) + fixed_opex
-            gross_profit = revenue - cogs
-
-            # EBITDA before royalty
-            ebitda_pre_royalty = gross_profit
-
-            # Licensing royalty payment (% of pre-royalty EBITDA, capped at 0)
-            licensing_royalty = max(0, ebitda_pre_royalty) * royalty_rate
-
-            # EBITDA after royalty
-            ebitda = ebitda_pre_royalty - licensing_royalty
-
-            # Depreciation (10-year straight line, 50% of process capital only - excludes licensing)
-            depreciation = (capex - fixed_total) * 0.5 / 10.0
-
-            # EBIT
-            ebit = ebitda - depreciation
-
-            # Tax
-            tax = max(0, ebit * ASSUMPTIONS["tax_rate"])
-
-            # Net Income
-            net_income = ebit - tax
-
-            # Cash Flow (add back depreciation)
-            cashflow = net_income + depreciation
-            capex_spend = 0
-
-        cumulative_cashflow += cashflow
-
-        # Check for payback
-        if payback_year is None and cumulative_cashflow > 0:
-            payback_year = year
+    pl = _pl_rollforward(
+        PL_CAPACITY_PROFILE,
+        plant_kg_good,
+        price_per_kg,
+        variable_opex_per_kg,
+        fixed_opex,
+        royalty_rate,
+        capex,
+        fixed_total,
+        ASSUMPTIONS_NS.tax_rate,
+    )
+    cols = {k: v.tolist() for k, v in pl.items()}
+    positive = np.flatnonzero(pl["cumulative_cashflow"] > 0)
+    payback_year = int(positive[0]) if positive.size else None
+    years = YEAR_IDX.tolist()
 
-        pl_data.append(
-            {
-                "Year": year,
-                "Capacity Utilization (%)": capacities[year] * 100 if year >= 2 else 0,
-                "Production (kg)": round(production_kg, 0) if year >= 2 else 0,
-                "Revenue (USD)": round(revenue, 0) if year >= 2 else 0,
-                "COGS (USD)": round(cogs, 0) if year >= 2 else 0,
-                "Gross Profit (USD)": round(gross_profit, 0) if year >= 2 else 0,
-                "Gross Margin (%)": round(gross_profit / revenue * 100, 1)
-                if revenue > 0
-                else 0,
-                "Licensing Royalty (USD)": round(licensing_royalty, 0)
-                if year >= 2
-                else 0,
-                "EBITDA (USD)": round(ebitda, 0) if year >= 2 else 0,
-                "Depreciation (USD)": round(depreciation, 0) if year >= 2 else 0,
-                "EBIT (USD)": round(ebit, 0) if year >= 2 else 0,
-                "Tax (USD)": round(tax, 0) if year >= 2 else 0,
-                "Net Income (USD)": round(net_income, 0) if year >= 2 else 0,
-                "CAPEX (USD)": round(capex_spend, 0) if capex_spend != 0 else 0,
-                "Free Cash Flow (USD)": round(cashflow, 0),
-                "Cumulative FCF (USD)": round(cumulative_cashflow, 0),
-            }
-        )
+    def operating(key, ndigits=0):
+        # Operating line items are reported as 0 during construction (years 0-1)
+        return [0, 0] + [round(v, ndigits) for v in cols[key][2:]]
 
-    pl_df = pd.DataFrame(pl_data)
+    free_cash_flow = [round(v, 0) for v in cols["cashflow"]]
+    pl_df = pd.DataFrame(
+        {
+            "Year": years,
+            "Capacity Utilization (%)": [0, 0]
+            + [c * 100 for c in cols["capacity"][2:]],
+            "Production (kg)": operating("production_kg"),
+            "Revenue (USD)": operating("revenue"),
+            "COGS (USD)": operating("cogs"),
+            "Gross Profit (USD)": operating("gross_profit"),
+            "Gross Margin (%)": [
+                round(g / r * 100, 1) if r > 0 else 0
+                for g, r in zip(cols["gross_profit"], cols["revenue"])
+            ],
+            "Licensing Royalty (USD)": operating("licensing_royalty"),
+            "EBITDA (USD)": operating("ebitda"),
+            "Depreciation (USD)": operating("depreciation"),
+            "EBIT (USD)": operating("ebit"),
+            "Tax (USD)": operating("tax"),
+            "Net Income (USD)": operating("net_income"),
+            "CAPEX (USD)": [round(c, 0) if c != 0 else 0 for c in cols["capex_spend"]],
+            "Free Cash Flow (USD)": free_cash_flow,
+            "Cumulative FCF (USD)": [round(v, 0) for v in cols["cumulative_cashflow"]],
+        }
+    )
+    # Steady-state year for the summary margin
+    revenue = cols["revenue"][-1]
+    ebitda = cols["ebitda"][-1]
 
     # Calculate financial metrics
-    cashflows = [row["Free Cash Flow (USD)"] for row in pl_data]
-    calc_npv = npv(ASSUMPTIONS["discount_rate"], cashflows)
+    cashflows = free_cash_flow
+    calc_npv = npv(ASSUMPTIONS_NS.discount_rate, cashflows)
     calc_irr = irr(cashflows)
 
     # Add summary metrics
@@ -2274,6 +2697,43 @@ def generate_detailed_pl_statement(
     return pl_df, summary_df
 
 
+def _evaluate_grid_point(
+    target_tpa,
+    strain_names,
+    R,
+    D,
+    anaerobic,
+    premium_spores,
+    sacco,
+    V,
+    use_stochastic,
+    n_sims,
+):
+    """Financial metrics for one (V, R, D) grid cell, tagged for the optimizer."""
+    metrics = _financials_for_counts(
+        target_tpa,
+        strain_names,
+        R,
+        D,
+        anaerobic,
+        premium_spores,
+        sacco,
+        V,
+        use_stochastic=use_stochastic,
+        n_sims=n_sims,
+    )
+    metrics["meets_capacity"] = bool(
+        metrics["plant_kg_good"] + 1e-6 >= target_tpa * 1000.0
+    )
+    metrics["fermenter_volume_L"] = V
+    return metrics
+
+
+# Deterministic grid cells take a few milliseconds each, so below this many the
+# worker start-up and pickling cost more than a parallel grid saves
+_PARALLEL_MIN_DETERMINISTIC_CELLS = 1000
+
+
 def optimize_counts_multiobjective(
     target_tpa,
     strain_names,
@@ -2288,6 +2748,8 @@ def optimize_counts_multiobjective(
     use_stochastic=False,
     stochastic_objective="irr_p10",
     n_sims=100,
+    n_jobs=1,
+    prune_dominated=False,
 ):
     """
     Grid-search over (reactors, ds_lines, fermenter_volumes), build full feasible set,
@@ -2300,38 +2762,78 @@ def optimize_counts_multiobjective(
         stochastic_objective: Which metric to optimize when using stochastic mode
                              Options: "irr_p10" (conservative), "irr_p50" (median), "irr_mean"
         n_sims: Number of Monte Carlo simulations per configuration
+        n_jobs: Worker processes for the grid evaluation (joblib semantics, -1 = all
+                cores). The default of 1 evaluates serially in-process. Parallel runs
+                need this module importable in the workers without side effects.
+                Deterministic grids smaller than _PARALLEL_MIN_DETERMINISTIC_CELLS
+                still run serially, since those cells cost less than the IPC.
+        prune_dominated: If True (and enforce_capacity), only cells on the
+                minimum-reactor capacity frontier are costed: for each (V, D)
+                the smallest feasible R and R + 1. Capacity and CAPEX grow with
+                R, so larger R at the same D mostly add dominated points; they
+                are not guaranteed to be dominated, so results can differ from
+                the full grid. all_df then holds only the costed cells. Falls back
+                to the full grid when no cell meets the target.
 
     Returns dict(best), pareto_df, all_df.
     """
-    target_kg = target_tpa * 1000.0
-    records = []
-
     # If no fermenter volumes specified, use the single provided volume
     if fermenter_volumes_to_test is None:
         fermenter_volumes_to_test = [fermenter_volume_L]
 
-    for V in fermenter_volumes_to_test:
-        for R in range(
-            2, max_reactors + 1
-        ):  # Start from 2 to ensure minimum 2 fermenters (1 spare)
+    # Every (V, R, D) cell is independent; Monte Carlo cells use a fixed seed, so
+    # results do not depend on evaluation order or worker count
+    combos = [
+        (V, R, D)
+        for V in fermenter_volumes_to_test
+        for R in range(2, max_reactors + 1)  # Min 2 fermenters (1 spare)
+        for D in range(1, max_ds_lines + 1)
+    ]
+    if prune_dominated and enforce_capacity:
+        frontier = set()
+        for V in fermenter_volumes_to_test:
             for D in range(1, max_ds_lines + 1):
-                metrics = _financials_for_counts(
-                    target_tpa,
-                    strain_names,
-                    R,
-                    D,
-                    anaerobic,
-                    premium_spores,
-                    sacco,
-                    V,
-                    use_stochastic=use_stochastic,
-                    n_sims=n_sims,
-                )
-                metrics["meets_capacity"] = bool(
-                    metrics["plant_kg_good"] + 1e-6 >= target_kg
-                )
-                metrics["fermenter_volume_L"] = V
-                records.append(metrics)
+                for R in range(2, max_reactors + 1):
+                    _, _, plant = capacity_given_counts(strain_names, R, D, V)
+                    if plant["plant_kg_good"] + 1e-6 >= target_tpa * 1000.0:
+                        frontier.update({(V, R, D), (V, min(R + 1, max_reactors), D)})
+                        break
+        if frontier:
+            combos = [combo for combo in combos if combo in frontier]
+    if n_jobs == 1 or (
+        not use_stochastic and len(combos) < _PARALLEL_MIN_DETERMINISTIC_CELLS
+    ):
+        records = [
+            _evaluate_grid_point(
+                target_tpa,
+                strain_names,
+                R,
+                D,
+                anaerobic,
+                premium_spores,
+                sacco,
+                V,
+                use_stochastic,
+                n_sims,
+            )
+            for V, R, D in combos
+        ]
+    else:
+        records = Parallel(n_jobs=n_jobs, backend="loky", batch_size="auto")(
+            delayed(_evaluate_grid_point)(
+                target_tpa,
+                strain_names,
+                R,
+                D,
+                anaerobic,
+                premium_spores,
+                sacco,
+                V,
+                use_stochastic,
+                n_sims,
+            )
+            for V, R, D in combos
+        )
     all_df = pd.DataFrame(records)
 
     # Filter feasibility if requested
@@ -2396,11 +2898,28 @@ def optimize_counts_for_target(
     target_tpa, strain_names, max_reactors=40, max_ds_lines=12, fermenter_volume_L=2000
 ):
     target_kg = target_tpa * 1000.0
+    # Plant kg is not monotone in R: the integer reactor split between strains can
+    # move a reactor to a slower strain when one is added, so a staircase walk over
+    # (R, D) could step past the cheapest feasible cell. Every R is screened
+    # instead, with all D at once, until the CAPEX bound below ends the search.
+    # Cells clearly below target on the split capacity estimate are skipped
+    # without a full capacity solve
+    screen_kg = target_kg - 1e-6 - 1e-9 * target_kg
+    strains_key = tuple(strain_names)
     best = None
     for R in range(
         2, max_reactors + 1
     ):  # Start from 2 to ensure minimum 2 fermenters (1 spare)
-        for D in range(1, max_ds_lines + 1):
+        # CAPEX is non-decreasing in R and D, so once the cheapest cell left
+        # (this R, one DS line) costs at least the best found, stop
+        if best is not None and (
+            capex_estimate_2(target_tpa, R, 1, fermenter_volume_L)[0] >= best["capex"]
+        ):
+            break
+        kg_by_ds_lines = _plant_kg_good_by_ds_lines(
+            strains_key, R, max_ds_lines, fermenter_volume_L
+        )
+        for D in (np.flatnonzero(kg_by_ds_lines >= screen_kg) + 1).tolist():
             _, totals, plant = capacity_given_counts(
                 strain_names, R, D, fermenter_volume_L
             )
@@ -2454,6 +2973,7 @@ def opex_block(
     strains=None,
     fermenters=None,
     ds_lines=None,
+    det_df=None,
 ):
     """Calculate OPEX components including utilities with proper unit scaling.
 
@@ -2484,6 +3004,9 @@ def opex_block(
         plant_kg_good: Total good product kg/year from capacity calculation
         plant_batches_good: Total good batches/year from capacity calculation
         fermenter_volume_L: Fermenter volume in liters (default 2000.0)
+        det_df: Optional per-strain deterministic capacity frame for the same
+            (strains, fermenters, ds_lines, fermenter_volume_L), e.g. the first
+            element of capacity_given_counts(). Looked up here when None.
 
     Returns:
         dict: OPEX components including raw materials, utilities, labor, maintenance, G&A, and total
@@ -2492,34 +3015,30 @@ def opex_block(
     # We need the actual per-strain batch allocation from capacity calculation
     if strains and fermenters and ds_lines:
         # Get deterministic capacity allocation to see actual batches per strain
-        df_det, _ = calculate_deterministic_capacity(
-            build_strainspecs(strains, fermenter_volume_L=fermenter_volume_L),
-            EquipmentConfig(
-                year_hours=ASSUMPTIONS["hours_per_year"],
-                reactors_total=fermenters,
-                ds_lines_total=ds_lines,
-                upstream_availability=ASSUMPTIONS["upstream_availability"],
-                downstream_availability=ASSUMPTIONS["downstream_availability"],
-                quality_yield=ASSUMPTIONS["quality_yield"],
-            ),
-            reactor_allocation_policy="inverse_ct",
-            ds_allocation_policy="inverse_ct",
-        )
+        if det_df is not None:
+            df_det = det_df
+        else:
+            df_det, _ = deterministic_capacity_for_counts(
+                strains, fermenters, ds_lines, fermenter_volume_L
+            )
 
         # Calculate raw materials cost based on actual strain allocations
-        raw_materials_total = 0
         base_working_volume = 1600.0  # liters (80% of 2000L)
         actual_working_volume = fermenter_volume_L * 0.8
         volume_scale_factor = actual_working_volume / base_working_volume
 
-        for _, row in df_det.iterrows():
-            strain_name = row["name"]
-            strain_good_batches = row["good_batches"]
-            # Get media and cryo costs for this strain, scaled for volume
-            media_cost = STRAIN_DB[strain_name]["media_cost_usd"] * volume_scale_factor
-            cryo_cost = STRAIN_DB[strain_name]["cryo_cost_usd"] * volume_scale_factor
-            strain_rm_cost_per_batch = media_cost + cryo_cost
-            raw_materials_total += strain_rm_cost_per_batch * strain_good_batches
+        # Media and cryo costs per strain (rows align with df_det), scaled for volume
+        table = _strain_table_cached(tuple(strains))
+        strain_rm_cost_per_batch = (
+            table["media_cost_usd"].to_numpy(dtype=np.float64) * volume_scale_factor
+            + table["cryo_cost_usd"].to_numpy(dtype=np.float64) * volume_scale_factor
+        )
+        raw_materials_total = sum(
+            (
+                strain_rm_cost_per_batch
+                * df_det["good_batches"].to_numpy(dtype=np.float64)
+            ).tolist()
+        )
     else:
         # Fallback: use average cost * total batches with volume scaling
         batches_required = (
@@ -2535,7 +3054,6 @@ def opex_block(
         )
 
     # Calculate per-strain utility costs with volume-aware scaling
-    utilities_total = 0
     electricity_rate_usd_per_kwh = (
         0.107  # Standard industrial electricity rate from ASSUMPTIONS
     )
@@ -2544,9 +3062,9 @@ def opex_block(
     # Get total batches for utilities calculation
     if strains and fermenters and ds_lines and "df_det" in locals():
         # Use actual strain allocations if available
-        utilities_batches_map = {
-            row["name"]: row["good_batches"] for _, row in df_det.iterrows()
-        }
+        utilities_batches_map = dict(
+            zip(df_det["name"].tolist(), df_det["good_batches"].tolist())
+        )
     else:
         # Fallback to equal distribution
         utilities_batches_map = None
@@ -2556,63 +3074,49 @@ def opex_block(
             else (target_tpa * 1000.0) / 25.6
         )
 
-    for i, strain_spec in enumerate(strains_specs):
-        # Calculate number of batches for this strain
-        if utilities_batches_map and strain_spec.name in utilities_batches_map:
-            batches_for_this_strain = utilities_batches_map[strain_spec.name]
-        else:
-            # Equal distribution fallback
-            batches_for_this_strain = total_batches_for_utilities / len(strains_specs)
-
-        # Volume-aware electricity calculations per batch:
-        # Each component scales differently with fermenter volume
-        ferm_kwh = (
-            strain_spec.utility_rate_ferm_kw
-        )  # Already total kWh per batch (legacy units)
-        cent_kwh = (
-            strain_spec.utility_rate_cent_kw * strain_spec.downstream_time_h * volume_m3
-        )  # Scales with full volume
-        lyo_kwh = (
-            strain_spec.utility_rate_lyo_kw
-            * strain_spec.downstream_time_h
-            * (fermenter_volume_L)
-        )  # Scales with 100% of volume
-
-        # Total electricity per batch for this strain
-        electricity_kwh_per_batch = ferm_kwh + cent_kwh + lyo_kwh
-
-        # Convert electricity to USD
-        electricity_cost_per_batch = (
-            electricity_kwh_per_batch * electricity_rate_usd_per_kwh
-        )
+    # Per-strain utility inputs as arrays aligned with ``strains_specs``
+    n_specs = len(strains_specs)
 
-        # Steam cost scales with batch mass (which already scales with volume)
-        steam_cost_per_batch = (
-            strain_spec.utility_cost_steam * strain_spec.batch_mass_kg
+    def spec_array(attr):
+        return np.fromiter(
+            (getattr(spec, attr) for spec in strains_specs),
+            dtype=np.float64,
+            count=n_specs,
         )
 
-        # Total utility cost per batch for this strain
-        utilities_cost_per_batch = electricity_cost_per_batch + steam_cost_per_batch
-
-        # Add to total utilities cost
-        utilities_total += utilities_cost_per_batch * batches_for_this_strain
+    if utilities_batches_map:
+        batches = np.fromiter(
+            (utilities_batches_map[spec.name] for spec in strains_specs),
+            dtype=np.float64,
+            count=n_specs,
+        )
+    elif n_specs:
+        # Equal distribution fallback
+        batches = np.full(n_specs, total_batches_for_utilities / n_specs)
+    else:
+        batches = np.zeros(0)
+
+    # Volume-aware electricity per batch; each component scales differently:
+    # fermentation is already total kWh per batch (legacy units), centrifugation
+    # scales with the full volume in m³ and lyophilization with 100% of volume
+    downstream_h = spec_array("downstream_time_h")
+    electricity_kwh_per_batch = (
+        spec_array("utility_rate_ferm_kw")
+        + spec_array("utility_rate_cent_kw") * downstream_h * volume_m3
+        + spec_array("utility_rate_lyo_kw") * downstream_h * (fermenter_volume_L)
+    )
+    # Steam cost scales with batch mass (which already scales with volume)
+    utilities_cost_per_batch = (
+        electricity_kwh_per_batch * electricity_rate_usd_per_kwh
+        + spec_array("utility_cost_steam") * spec_array("batch_mass_kg")
+    )
+    utilities_total = sum((utilities_cost_per_batch * batches).tolist())
 
     ftes = target_tpa if target_tpa >= 15 else 15
 
-    avg_labor_cost = (
-        ASSUMPTIONS["plant_manager_salary"] * 1
-        + ASSUMPTIONS["fermentation_specialist_salary"] * 3
-        + ASSUMPTIONS["downstream_process_operator_salary"] * 3
-        + ASSUMPTIONS["general_technician_salary"] * 2
-        + ASSUMPTIONS["qaqc_lab_tech_salary"] * 1
-        + ASSUMPTIONS["maintenance_tech_salary"] * 1
-        + ASSUMPTIONS["utility_operator_salary"] * 2
-        + ASSUMPTIONS["logistics_clerk_salary"] * 1
-        + ASSUMPTIONS["office_clerk_salary"] * 1
-    ) / 15
-    labor_total = ftes * avg_labor_cost
-    maintenance_total = ASSUMPTIONS["maintenance_pct_of_equip"] * equip_cost
-    ga_other_total = ASSUMPTIONS["ga_other_scale_factor"] * (target_tpa * 1000.0)
+    labor_total = ftes * _AVG_LABOR_COST
+    maintenance_total = ASSUMPTIONS_NS.maintenance_pct_of_equip * equip_cost
+    ga_other_total = ASSUMPTIONS_NS.ga_other_scale_factor * (target_tpa * 1000.0)
 
     # Calculate licensing metadata if strains are provided
     # Note: Royalty amount is NOT included in total_cash_opex - it's applied later on EBITDA
@@ -2646,6 +3150,34 @@ def opex_block(
     }
 
 
+# "Product Type" label for every (anaerobic, premium_spores, sacco) combination.
+# Only all three flags together mean multi-product; otherwise premium spores win
+# over anaerobic over sacco, the same precedence _price_per_kg_from_flags uses.
+_PRODUCT_TYPE_LABELS = {
+    (True, True, True): "Multi-Product (All Types)",
+    (True, True, False): "Premium Spores",
+    (False, True, True): "Premium Spores",
+    (False, True, False): "Premium Spores",
+    (True, False, True): "Anaerobic",
+    (True, False, False): "Anaerobic",
+    (False, False, True): "Sacco",
+    (False, False, False): "Standard",
+}
+
+# Columns shown on the Pareto Frontier / All Feasible Configurations sheets
+_CONFIG_REPORT_COLUMNS = [
+    "fermenter_volume_L",
+    "reactors",
+    "ds_lines",
+    "capex",
+    "irr",
+    "npv",
+    "plant_kg_good",
+    "util_up",
+    "util_ds",
+]
+
+
 def facility_model(
     name,
     target_tpa,
@@ -2662,6 +3194,8 @@ def facility_model(
     use_stochastic=False,
     stochastic_objective="irr_p10",
     n_sims=100,
+    n_jobs=1,
+    build_tables=True,
 ):
     """Model a fermentation facility's economics with optional fermenter volume optimization.
 
@@ -2689,6 +3223,12 @@ def facility_model(
         stochastic_objective: Which metric to optimize when using stochastic mode
                              Options: "irr_p10" (conservative), "irr_p50" (median), "irr_mean"
         n_sims: Number of Monte Carlo simulations per configuration when use_stochastic=True
+        n_jobs: Worker processes for the multi-objective grid search (see
+                optimize_counts_multiobjective); 1 evaluates serially
+        build_tables: If False, skip every report table and return only the
+                      headline scalars (configuration, capex, total_cash_opex,
+                      price_per_kg, npv, irr, plant_kg_good, plant_batches_good,
+                      meets_capacity, util_up, util_ds)
 
     Returns:
         dict: Comprehensive facility model including:
@@ -2698,50 +3238,80 @@ def facility_model(
             - Financial metrics (NPV, IRR)
             - Capacity and utilization metrics
             - DataFrames with detailed tables
+
+    Results are memoized on the arguments other than n_jobs (see
+    clear_model_caches()); each call returns a fresh dict with copies of the tables.
     """
-    # Process parameters from STRAIN_DB for cost, and STRAIN_BATCH_DB for times
-    df_proc = pd.DataFrame(
-        [
-            {
-                "Strain": s,
-                "Fed-batch Fermentation Time (h)": STRAIN_BATCH_DB[s]["t_fedbatch_h"],
-                "Turnaround (h)": STRAIN_BATCH_DB[s]["t_turnaround_h"],
-                "Downstream (h)": STRAIN_BATCH_DB[s]["t_downstrm_h"],
-                "Batch Cycle (UP) (h)": STRAIN_BATCH_DB[s]["t_fedbatch_h"]
-                + STRAIN_BATCH_DB[s]["t_turnaround_h"],
-            }
-            for s in strains
-        ]
-    )
+    # Worker count does not change the model, so keep it out of the cache key
+    token = _FACILITY_MODEL_N_JOBS.set(n_jobs)
+    try:
+        result = _facility_model_cached(
+            name,
+            target_tpa,
+            tuple(strains),
+            fermenters_suggested,
+            lyos_guess,
+            anaerobic,
+            premium_spores,
+            sacco,
+            optimize_equipment,
+            use_multiobjective,
+            fermenter_volume_L,
+            (
+                None
+                if fermenter_volumes_to_test is None
+                else tuple(fermenter_volumes_to_test)
+            ),
+            use_stochastic,
+            stochastic_objective,
+            n_sims,
+            build_tables,
+        )
+    finally:
+        _FACILITY_MODEL_N_JOBS.reset(token)
+    # Hand out fresh tables so callers cannot corrupt the cached result
+    return {
+        k: v.copy() if isinstance(v, pd.DataFrame) else v for k, v in result.items()
+    }
+
 
+_FACILITY_MODEL_N_JOBS = ContextVar("_FACILITY_MODEL_N_JOBS", default=1)
+
+
+@lru_cache(maxsize=32)
+def _facility_model_cached(
+    name,
+    target_tpa,
+    strains_key,
+    fermenters_suggested,
+    lyos_guess,
+    anaerobic,
+    premium_spores,
+    sacco,
+    optimize_equipment,
+    use_multiobjective,
+    fermenter_volume_L,
+    fermenter_volumes_key,
+    use_stochastic,
+    stochastic_objective,
+    n_sims,
+    build_tables,
+):
+    strains = list(strains_key)
+    fermenter_volumes_to_test = (
+        None if fermenter_volumes_key is None else list(fermenter_volumes_key)
+    )
     # Average costs - need to scale for fermenter volume
     # STRAIN_DB costs are for 1600L working volume (2000L * 0.8)
     base_working_volume = 1600.0  # liters
     actual_working_volume = fermenter_volume_L * 0.8
     volume_scale_factor = actual_working_volume / base_working_volume
 
-    df_media = pd.DataFrame(
-        [
-            {
-                "Strain": s,
-                "Media Cost/Batch (USD)": STRAIN_DB[s]["media_cost_usd"]
-                * volume_scale_factor,
-            }
-            for s in strains
-        ]
-    )
-    df_cryo = pd.DataFrame(
-        [
-            {
-                "Strain": s,
-                "Cryo Cost/Batch (USD)": STRAIN_DB[s]["cryo_cost_usd"]
-                * volume_scale_factor,
-            }
-            for s in strains
-        ]
-    )
-    avg_media_cost = df_media["Media Cost/Batch (USD)"].mean()
-    avg_cryo_cost = df_cryo["Cryo Cost/Batch (USD)"].mean()
+    table = _strain_table_cached(tuple(strains))
+    media_cost_per_batch = table["media_cost_usd"].to_numpy() * volume_scale_factor
+    cryo_cost_per_batch = table["cryo_cost_usd"].to_numpy() * volume_scale_factor
+    avg_media_cost = media_cost_per_batch.mean()
+    avg_cryo_cost = cryo_cost_per_batch.mean()
     avg_rm_cost_per_batch = avg_media_cost + avg_cryo_cost
 
     # Initial guesses
@@ -2765,6 +3335,7 @@ def facility_model(
                 use_stochastic=use_stochastic,
                 stochastic_objective=stochastic_objective,
                 n_sims=n_sims,
+                n_jobs=_FACILITY_MODEL_N_JOBS.get(),
             )
             fermenters = int(best_mo["reactors"])
             ds_lines = int(best_mo["ds_lines"])
@@ -2826,6 +3397,11 @@ def facility_model(
     centrifuges = max(1, ds_lines)
     tff_skids = max(1, ds_lines if anaerobic else 1)
 
+    # Deterministic per-strain capacity table for the chosen counts
+    det_df, det_totals = deterministic_capacity_for_counts(
+        strains, fermenters, ds_lines, fermenter_volume_L
+    )
+
     # OPEX block - now using the potentially optimized fermenter volume
     strains_specs = build_strainspecs(strains, fermenter_volume_L=fermenter_volume_L)
     opx = opex_block(
@@ -2841,6 +3417,7 @@ def facility_model(
         strains=strains,
         fermenters=fermenters,
         ds_lines=ds_lines,
+        det_df=det_df,
     )
 
     # Financials (same structure as original but using calc-based kg if desired)
@@ -2849,66 +3426,80 @@ def facility_model(
         price_per_kg = _get_weighted_price_per_kg(strains, fermenter_volume_L)
     else:
         price_per_kg = (
-            ASSUMPTIONS["price_bacillus_usd_per_kg"]
+            ASSUMPTIONS_NS.price_bacillus_usd_per_kg
             if premium_spores
             else (
-                ASSUMPTIONS["price_lacto_bifido_usd_per_kg"]
+                ASSUMPTIONS_NS.price_lacto_bifido_usd_per_kg
                 if anaerobic
                 else (
-                    ASSUMPTIONS["price_sacco_usd_per_kg"]
+                    ASSUMPTIONS_NS.price_sacco_usd_per_kg
                     if sacco
-                    else (ASSUMPTIONS["price_yogurt_usd_per_kg"])
+                    else (ASSUMPTIONS_NS.price_yogurt_usd_per_kg)
                 )
             )
         )
     steady_state_kg = target_tpa * 1000.0
     var_opex_per_kg = (
-        ASSUMPTIONS["variable_opex_share"] * opx["total_cash_opex"]
+        ASSUMPTIONS_NS.variable_opex_share * opx["total_cash_opex"]
     ) / steady_state_kg
-    fixed_opex = (1 - ASSUMPTIONS["variable_opex_share"]) * opx["total_cash_opex"]
-
-    years = list(range(0, 13))
-    capex_spend = [0] * 13
-    capex_spend[0] = -capex * 0.70
-    capex_spend[1] = -capex * 0.30
-    capacities = [0, 0, 0.40, 0.60, 0.80, 1.00] + [1.00] * 7
+    fixed_opex = (1 - ASSUMPTIONS_NS.variable_opex_share) * opx["total_cash_opex"]
 
     # Get licensing info for financial calculations
     royalty_rate = opx.get("licensing_weighted_royalty_rate", 0.0)
     licensing_fixed = opx.get("licensing_fixed_total", 0.0)
 
-    fin_rows = []
-    cashflows = []
-    for i, yr in enumerate(years):
-        if i < 2:
-            util = 0.0
-            revenue = 0.0
-            cogs = 0.0
-            ebitda = 0.0
-            dep = 0.0
-            ebt = 0.0
-            tax = 0.0
-            ufcf = capex_spend[i]
-        else:
-            util = capacities[i]
-            kg = steady_state_kg * util
-            revenue = kg * price_per_kg
-            cogs = kg * var_opex_per_kg + fixed_opex
-            # Apply licensing royalty on EBITDA
-            ebitda_pre = revenue - cogs
-            licensing_royalty = max(0, ebitda_pre) * royalty_rate
-            ebitda = ebitda_pre - licensing_royalty
-            # Depreciation excludes licensing fixed cost
-            dep = (capex - licensing_fixed) * 0.5 / 10.0
-            ebt = ebitda - dep
-            tax = max(0.0, ebt * ASSUMPTIONS["tax_rate"])
-            ufcf = ebitda - tax
-        cashflows.append(ufcf)
-        fin_rows.append([yr, util, revenue, cogs, ebitda, dep, ebt, tax, ufcf])
-
-    calc_npv = npv(ASSUMPTIONS["discount_rate"], cashflows)
+    # Operating years 2-12 as arrays; years 0-1 are construction only
+    util = PL_CAPACITY_PROFILE[2:]
+    kg = steady_state_kg * util
+    revenue = kg * price_per_kg
+    cogs = kg * var_opex_per_kg + fixed_opex
+    # Apply licensing royalty on EBITDA
+    ebitda_pre = revenue - cogs
+    licensing_royalty = np.maximum(0, ebitda_pre) * royalty_rate
+    ebitda = ebitda_pre - licensing_royalty
+    # Depreciation excludes licensing fixed cost
+    dep = np.full(util.size, (capex - licensing_fixed) * 0.5 / 10.0)
+    ebt = ebitda - dep
+    tax = np.maximum(0.0, ebt * ASSUMPTIONS_NS.tax_rate)
+    ufcf = ebitda - tax
+    cashflows = [-capex * 0.70, -capex * 0.30] + ufcf.tolist()
+    calc_npv = npv(ASSUMPTIONS_NS.discount_rate, cashflows)
     calc_irr = irr(cashflows)
 
+    if not build_tables:
+        return {
+            "fermenter_volume_L": fermenter_volume_L,
+            "reactors": fermenters,
+            "ds_lines": ds_lines,
+            "capex": capex,
+            "total_cash_opex": opx["total_cash_opex"],
+            "price_per_kg": price_per_kg,
+            "npv": calc_npv,
+            "irr": calc_irr,
+            "plant_kg_good": plant_kg_good,
+            "plant_batches_good": plant_batches_good,
+            "meets_capacity": bool(plant_kg_good + 1e-6 >= target_tpa * 1000.0),
+            "util_up": util_up,
+            "util_ds": util_ds,
+        }
+
+    # Process parameters from STRAIN_BATCH_DB for times and STRAIN_DB for cost,
+    # built as one frame and split into the report tables
+    strain_inputs = pd.DataFrame(
+        {
+            "Strain": table["name"],
+            "Fed-batch Fermentation Time (h)": table["t_fedbatch_h"],
+            "Turnaround (h)": table["t_turnaround_h"],
+            "Downstream (h)": table["t_downstrm_h"],
+            "Batch Cycle (UP) (h)": table["t_fedbatch_h"] + table["t_turnaround_h"],
+            "Media Cost/Batch (USD)": media_cost_per_batch,
+            "Cryo Cost/Batch (USD)": cryo_cost_per_batch,
+        }
+    )
+    df_proc = strain_inputs.iloc[:, :5]
+    df_media = strain_inputs[["Strain", "Media Cost/Batch (USD)"]]
+    df_cryo = strain_inputs[["Strain", "Cryo Cost/Batch (USD)"]]
+
     # Equipment list - dynamically sized based on fermenter volume
     # Media tank scales to 1.25x fermenter volume, seed fermenter is 12.5% of main fermenter
     media_tank_volume = int(fermenter_volume_L * 1.25)
@@ -2928,7 +3519,7 @@ def facility_model(
             },
             {
                 "Equipment": f"{seed_fermenter_volume} L Seed Fermenter",
-                "Quantity": max(2, ceil(fermenters * 0.7)),
+                "Quantity": max(2, _iceil_div(fermenters * 7, 10)),
                 "Notes": "Upstream seed (12.5% of main)",
             },
             {
@@ -3004,19 +3595,9 @@ def facility_model(
 
     df_opex = pd.DataFrame(opex_rows, columns=["OPEX Component", "USD"])
 
-    # Deterministic per-strain capacity table for the chosen counts
-    det_df, det_totals = calculate_deterministic_capacity(
-        build_strainspecs(strains, fermenter_volume_L=fermenter_volume_L),
-        EquipmentConfig(
-            year_hours=ASSUMPTIONS["hours_per_year"],
-            reactors_total=fermenters,
-            ds_lines_total=ds_lines,
-            upstream_availability=ASSUMPTIONS["upstream_availability"],
-            downstream_availability=ASSUMPTIONS["downstream_availability"],
-            quality_yield=ASSUMPTIONS["quality_yield"],
-        ),
-        reactor_allocation_policy="inverse_ct",
-        ds_allocation_policy="inverse_ct",
+    # Reused by the detailed OPEX / P&L reports below instead of re-solving
+    strain_batches_map = dict(
+        zip(det_df["name"].tolist(), det_df["good_batches"].tolist())
     )
     det_df = det_df.sort_values("feasible_batches", ascending=False)
 
@@ -3068,19 +3649,21 @@ def facility_model(
         }
     )
 
+    # One (year x metric) block; construction years 0-1 stay zero
+    fin_values = np.zeros((YEAR_IDX.size, 7))
+    fin_values[2:] = np.column_stack((util, revenue, cogs, ebitda, dep, ebt, tax))
     df_fin = pd.DataFrame(
-        fin_rows,
-        columns=[
-            "Year",
-            "Capacity Utilization",
-            "Revenue (USD)",
-            "COGS & Cash OPEX (USD)",
-            "EBITDA (USD)",
-            "Depreciation (USD)",
-            "EBT (USD)",
-            "Taxes (USD)",
-            "Unlevered FCF (USD)",
-        ],
+        {
+            "Year": YEAR_IDX,
+            "Capacity Utilization": fin_values[:, 0],
+            "Revenue (USD)": fin_values[:, 1],
+            "COGS & Cash OPEX (USD)": fin_values[:, 2],
+            "EBITDA (USD)": fin_values[:, 3],
+            "Depreciation (USD)": fin_values[:, 4],
+            "EBT (USD)": fin_values[:, 5],
+            "Taxes (USD)": fin_values[:, 6],
+            "Unlevered FCF (USD)": np.array(cashflows),
+        }
     )
 
     # Enhanced Assumptions with facility-specific information
@@ -3112,45 +3695,35 @@ def facility_model(
         ("Selected Strains", ", ".join(strains)),
         (
             "Product Type",
-            "Multi-Product (All Types)"
-            if (anaerobic and premium_spores and sacco)
-            else (
-                "Premium Spores"
-                if premium_spores
-                else ("Anaerobic" if anaerobic else ("Sacco" if sacco else "Standard"))
-            ),
+            _PRODUCT_TYPE_LABELS[(bool(anaerobic), bool(premium_spores), bool(sacco))],
         ),
         ("Price per kg (USD)", price_per_kg),
     ]
     df_assump = pd.DataFrame(assumptions_data, columns=["Parameter", "Value"])
 
-    # Create strain process parameters DataFrame
-    strain_params_data = []
-    for s in strains:
-        db_entry = STRAIN_BATCH_DB[s]
-        strain_params_data.append(
-            {
-                "Strain": s,
-                "Yield (g/L)": db_entry["yield_g_per_L"],
-                "Fermentation (h)": db_entry["t_fedbatch_h"],
-                "Turnaround (h)": db_entry["t_turnaround_h"],
-                "Downstream (h)": db_entry["t_downstrm_h"],
-                "CV Ferm": db_entry["cv_ferm"],
-                "CV Turn": db_entry["cv_turn"],
-                "CV Down": db_entry["cv_down"],
-                "Media Cost (USD/batch)": STRAIN_DB[s]["media_cost_usd"],
-                "Cryo Cost (USD/batch)": STRAIN_DB[s]["cryo_cost_usd"],
-            }
-        )
-    df_strain_params = pd.DataFrame(strain_params_data)
+    # Create strain process parameters DataFrame, one column at a time
+    batch_entries = [STRAIN_BATCH_DB[s] for s in strains]
+    cost_entries = [STRAIN_DB[s] for s in strains]
+    df_strain_params = pd.DataFrame(
+        {
+            "Strain": list(strains),
+            "Yield (g/L)": [b["yield_g_per_L"] for b in batch_entries],
+            "Fermentation (h)": [b["t_fedbatch_h"] for b in batch_entries],
+            "Turnaround (h)": [b["t_turnaround_h"] for b in batch_entries],
+            "Downstream (h)": [b["t_downstrm_h"] for b in batch_entries],
+            "CV Ferm": [b["cv_ferm"] for b in batch_entries],
+            "CV Turn": [b["cv_turn"] for b in batch_entries],
+            "CV Down": [b["cv_down"] for b in batch_entries],
+            "Media Cost (USD/batch)": [c["media_cost_usd"] for c in cost_entries],
+            "Cryo Cost (USD/batch)": [c["cryo_cost_usd"] for c in cost_entries],
+        }
+    )
 
     # Create raw material prices DataFrame
-    df_raw_prices = pd.DataFrame(
-        list(RAW_PRICES.items()), columns=["Material", "Price (USD/kg)"]
-    )
+    df_raw_prices = pd.DataFrame.from_records(_RAW_PRICES_ARR)
 
     # Generate detailed reports
-    detailed_opex_df = generate_detailed_opex_report(
+    detailed_opex_df, _ = generate_detailed_opex_report(
         strains,
         fermenters,
         ds_lines,
@@ -3158,6 +3731,7 @@ def facility_model(
         target_tpa,
         plant_kg_good,
         plant_batches_good,
+        strain_batches_map=strain_batches_map,
     )
     detailed_capex_df = generate_detailed_capex_report(
         fermenters, ds_lines, fermenter_volume_L, target_tpa
@@ -3173,6 +3747,7 @@ def facility_model(
         anaerobic,
         premium_spores,
         sacco,
+        strain_batches_map=strain_batches_map,
     )
 
     # Create output dictionary with detailed reports as first sheets
@@ -3195,143 +3770,228 @@ def facility_model(
         "Raw Material Prices": df_raw_prices,
     }
     if optimize_equipment and use_multiobjective:
-        out["Pareto Frontier"] = pareto_df[
-            [
-                "fermenter_volume_L",
-                "reactors",
-                "ds_lines",
-                "capex",
-                "irr",
-                "npv",
-                "plant_kg_good",
-                "util_up",
-                "util_ds",
-            ]
-        ]
-        out["All Feasible Configurations"] = all_df[all_df["meets_capacity"]][
-            [
-                "fermenter_volume_L",
-                "reactors",
-                "ds_lines",
-                "capex",
-                "irr",
-                "npv",
-                "plant_kg_good",
-                "util_up",
-                "util_ds",
-            ]
+        out["Pareto Frontier"] = pareto_df[_CONFIG_REPORT_COLUMNS]
+        out["All Feasible Configurations"] = all_df.loc[
+            all_df["meets_capacity"].to_numpy(), _CONFIG_REPORT_COLUMNS
         ]
     return out
 
 
 # ============ Build models (same four facilities) ============
-def write_book(path, model_dict):
-    with pd.ExcelWriter(path, engine="xlsxwriter") as writer:
-        for sheet, df in model_dict.items():
-            df.to_excel(writer, sheet_name=sheet, index=False)
-        wb = writer.book
-        for sheet in model_dict.keys():
-            ws = writer.sheets[sheet]
-            ws.set_zoom(110)
-            ws.set_column(0, max(2, len(model_dict[sheet].columns)), 18)
-
-
-fac1 = facility_model(
-    "Facility 1 - Yogurt Cultures (10 TPA)",
-    target_tpa=10,
-    strains=[
-        "S. thermophilus",
-        "L. delbrueckii subsp. bulgaricus",
-        "L. acidophilus",
-        "B. animalis subsp. lactis",
-    ],
-    fermenters_suggested=4,
-    lyos_guess=2,
-    anaerobic=False,
-    premium_spores=False,
-    sacco=False,
-    optimize_equipment=True,
-    use_multiobjective=True,
-    fermenter_volumes_to_test=[500, 1000, 1500, 2000, 3000, 4000, 5000],
-    use_stochastic=False,
-    stochastic_objective="irr_p10",
-)
-fac2 = facility_model(
-    "Facility 2 - Lacto/Bifido (10 TPA)",
-    target_tpa=10,
-    strains=["L. rhamnosus GG", "L. casei", "L. plantarum", "B. breve", "B. longum"],
-    fermenters_suggested=5,
-    lyos_guess=2,
-    anaerobic=True,
-    premium_spores=False,
-    sacco=False,
-    optimize_equipment=True,
-    use_multiobjective=True,
-    fermenter_volumes_to_test=[500, 1000, 1500, 2000, 3000, 4000, 5000],
-    use_stochastic=False,
-    stochastic_objective="irr_p10",
-)
-fac3 = facility_model(
-    "Facility 3 - Bacillus Spores (10 TPA)",
-    target_tpa=10,
-    strains=["Bacillus coagulans", "Bacillus subtilis"],
-    fermenters_suggested=2,
-    lyos_guess=1,
-    anaerobic=False,
-    premium_spores=True,
-    sacco=False,
-    optimize_equipment=True,
-    use_multiobjective=True,
-    fermenter_volumes_to_test=[500, 1000, 1500, 2000, 3000, 4000, 5000],
-    use_stochastic=False,
-    stochastic_objective="irr_p10",
-)
-fac4 = facility_model(
-    "Facility 4 - Yeast Based Probiotic (10 TPA)",
-    target_tpa=10,
-    strains=["Saccharomyces boulardii"],
-    fermenters_suggested=4,
-    lyos_guess=2,
-    anaerobic=False,
-    premium_spores=False,
-    sacco=True,
-    optimize_equipment=True,
-    use_multiobjective=True,
-    fermenter_volumes_to_test=[500, 1000, 1500, 2000, 3000, 4000, 5000],
-    use_stochastic=False,
-    stochastic_objective="irr_p10",
-)
-fac5 = facility_model(
-    "Facility 5 - ALL IN (40 TPA)",
-    target_tpa=40,
-    strains=[
-        "Saccharomyces boulardii",
-        "Bacillus coagulans",
-        "Bacillus subtilis",
-        "L. rhamnosus GG",
-        "L. casei",
-        "L. plantarum",
-        "B. breve",
-        "B. longum",
-        "S. thermophilus",
-        "L. delbrueckii subsp. bulgaricus",
-        "L. acidophilus",
-        "B. animalis subsp. lactis",
-    ],
-    fermenters_suggested=4,
-    lyos_guess=2,
-    anaerobic=True,
-    premium_spores=True,
-    sacco=True,
+# Header cell style DataFrame.to_excel uses (bold, thin border, centered)
+_HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
+
+
+def _excel_value(value):
+    # Same cell conversions DataFrame.to_excel applies: blank for missing
+    # values, "inf"/"-inf" text for infinities, str() for anything non-numeric
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        if np.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        return value
+    return str(value)
+
+
+def _excel_writer(path):
+    # constant_memory flushes each row to disk once the next row starts, so
+    # sheets are sized first and rows written strictly top to bottom.
+    # DataFrame.to_excel writes column by column, which this mode would drop.
+    return pd.ExcelWriter(
+        path,
+        engine="xlsxwriter",
+        engine_kwargs={"options": {"constant_memory": True}},
+    )
+
+
+def _write_sheets(writer, model_dict, header_format, prefix=""):
+    for sheet, df in model_dict.items():
+        # A table with no rows (e.g. no feasible configuration) gets no sheet
+        if df is None or df.empty:
+            continue
+        # Excel caps sheet names at 31 characters
+        ws = writer.book.add_worksheet(f"{prefix}{sheet}"[:31])
+        ws.set_zoom(110)
+        ws.set_column(0, max(2, len(df.columns)), 18)
+        ws.write_row(0, 0, [_excel_value(c) for c in df.columns], header_format)
+        for r, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            ws.write_row(r, 0, [_excel_value(v) for v in row])
+
+
+# Grid-search result sheets that can run to thousands of rows
+_TALL_SHEETS = ("Pareto Frontier", "All Feasible Configurations")
+# Narrower dtypes for their Parquet copies; float32 keeps IRR/NPV to ~6e-8 relative
+_TALL_SHEET_DTYPES = {
+    "fermenter_volume_L": "int32",
+    "reactors": "int16",
+    "ds_lines": "int16",
+    "capex": "float32",
+    "irr": "float32",
+    "npv": "float32",
+    "plant_kg_good": "float32",
+    "util_up": "float32",
+    "util_ds": "float32",
+}
+
+
+def write_book(path, model_dict, tall_sheets_as_parquet=False, preview_rows=50):
+    """Write a facility_model result to ``path``, one sheet per table.
+
+    With ``tall_sheets_as_parquet`` the grid-search sheets (_TALL_SHEETS) are
+    saved in full as companion ``<book>__<Sheet_Name>.parquet`` files (needs
+    pyarrow or fastparquet), downcast per _TALL_SHEET_DTYPES, and the workbook
+    keeps only their ``preview_rows`` highest-IRR rows at full precision.
+    """
+    if tall_sheets_as_parquet:
+        model_dict = dict(model_dict)
+        stem = os.path.splitext(path)[0]
+        for sheet in _TALL_SHEETS:
+            df = model_dict.get(sheet)
+            if df is None:
+                continue
+            compact = df.astype(
+                {k: v for k, v in _TALL_SHEET_DTYPES.items() if k in df.columns}
+            )
+            compact.to_parquet(
+                f"{stem}__{sheet.replace(' ', '_')}.parquet",
+                compression="zstd",
+                index=False,
+            )
+            model_dict[sheet] = df.nlargest(preview_rows, "irr")
+    with _excel_writer(path) as writer:
+        header_format = writer.book.add_format(_HEADER_FORMAT)
+        _write_sheets(writer, model_dict, header_format)
+
+
+def write_combined_book(path, model_dicts):
+    """Write several facility models into one workbook.
+
+    ``model_dicts`` maps a sheet-name prefix (e.g. "F1_") to a facility_model
+    result. One writer and one header format serve every sheet.
+    """
+    with _excel_writer(path) as writer:
+        header_format = writer.book.add_format(_HEADER_FORMAT)
+        for prefix, model_dict in model_dicts.items():
+            _write_sheets(writer, model_dict, header_format, prefix)
+
+
+def _run_facility(config):
+    return facility_model(**config)
+
+
+# The five reference facilities written by ``python pricing_integrated_original.py``:
+# settings they all share, then what differs per facility
+_VOL_OPTIONS = (500, 1000, 1500, 2000, 3000, 4000, 5000)
+_FACILITY_DEFAULTS = dict(
     optimize_equipment=True,
     use_multiobjective=True,
-    fermenter_volumes_to_test=[500, 1000, 1500, 2000, 3000, 4000, 5000],
+    fermenter_volumes_to_test=_VOL_OPTIONS,
     use_stochastic=False,
     stochastic_objective="irr_p10",
 )
-write_book(out1, fac1)
-write_book(out2, fac2)
-write_book(out3, fac3)
-write_book(out4, fac4)
-write_book(out5, fac5)
-print("Created files:", out1, out2, out3, out4, out5)
+FACILITY_CONFIGS = [
+    {**_FACILITY_DEFAULTS, **facility}
+    for facility in [
+        dict(
+            name="Facility 1 - Yogurt Cultures (10 TPA)",
+            target_tpa=10,
+            strains=[
+                "S. thermophilus",
+                "L. delbrueckii subsp. bulgaricus",
+                "L. acidophilus",
+                "B. animalis subsp. lactis",
+            ],
+            fermenters_suggested=4,
+            lyos_guess=2,
+            anaerobic=False,
+            premium_spores=False,
+            sacco=False,
+        ),
+        dict(
+            name="Facility 2 - Lacto/Bifido (10 TPA)",
+            target_tpa=10,
+            strains=[
+                "L. rhamnosus GG",
+                "L. casei",
+                "L. plantarum",
+                "B. breve",
+                "B. longum",
+            ],
+            fermenters_suggested=5,
+            lyos_guess=2,
+            anaerobic=True,
+            premium_spores=False,
+            sacco=False,
+        ),
+        dict(
+            name="Facility 3 - Bacillus Spores (10 TPA)",
+            target_tpa=10,
+            strains=["Bacillus coagulans", "Bacillus subtilis"],
+            fermenters_suggested=2,
+            lyos_guess=1,
+            anaerobic=False,
+            premium_spores=True,
+            sacco=False,
+        ),
+        dict(
+            name="Facility 4 - Yeast Based Probiotic (10 TPA)",
+            target_tpa=10,
+            strains=["Saccharomyces boulardii"],
+            fermenters_suggested=4,
+            lyos_guess=2,
+            anaerobic=False,
+            premium_spores=False,
+            sacco=True,
+        ),
+        dict(
+            name="Facility 5 - ALL IN (40 TPA)",
+            target_tpa=40,
+            strains=[
+                "Saccharomyces boulardii",
+                "Bacillus coagulans",
+                "Bacillus subtilis",
+                "L. rhamnosus GG",
+                "L. casei",
+                "L. plantarum",
+                "B. breve",
+                "B. longum",
+                "S. thermophilus",
+                "L. delbrueckii subsp. bulgaricus",
+                "L. acidophilus",
+                "B. animalis subsp. lactis",
+            ],
+            fermenters_suggested=4,
+            lyos_guess=2,
+            anaerobic=True,
+            premium_spores=True,
+            sacco=True,
+        ),
+    ]
+]
+
+
+if __name__ == "__main__":
+    # The models share no state, so each runs in its own process
+    with ProcessPoolExecutor(
+        max_workers=min(len(FACILITY_CONFIGS), os.cpu_count() or 1)
+    ) as executor:
+        facilities = list(executor.map(_run_facility, FACILITY_CONFIGS))
+    if "--combined" in sys.argv[1:]:
+        # One workbook, sheets prefixed F1_ .. F5_
+        write_combined_book(
+            out_all, {f"F{i}_": fac for i, fac in enumerate(facilities, start=1)}
+        )
+        print("Created file:", out_all)
+    else:
+        # --parquet: full grid-search sheets go to companion .parquet files
+        as_parquet = "--parquet" in sys.argv[1:]
+        outputs = [out1, out2, out3, out4, out5]
+        for path, fac in zip(outputs, facilities):
+            write_book(path, fac, tall_sheets_as_parquet=as_parquet)
+        print("Created files:", *outputs)
@@ -9,8 +9,13 @@ Run:
   python scripts/verify_wvf_and_royalty.py
 """
 
+import importlib
 import logging
-from typing import Dict
+import sys
+from types import SimpleNamespace
+from typing import Dict, List
+
+import numpy as np
 
 from bioprocess.models import (
     ScenarioInput,
@@ -23,32 +28,66 @@ from bioprocess.orchestrator import run_scenario
 from bioprocess.presets import STRAIN_DB, STRAIN_BATCH_DB, RAW_PRICES
 from bioprocess.econ import calculate_economics
 
-# Original helper for royalty rate
-import sys
-
-sys.path.append("/home/eggzy/Downloads/Project_Hasan")
-from pricing_integrated_original import weighted_royalty_rate  # type: ignore
+# Original pricing script, imported on first use by compare_weighted_royalty
+LEGACY_PATH = "/home/eggzy/Downloads/Project_Hasan"
+_legacy = None
 
 logging.basicConfig(level=logging.INFO)
 
 
-def build_strain(name: str) -> StrainInput:
-    sb = STRAIN_BATCH_DB[name]
-    sd = STRAIN_DB.get(name, {})
+def build_strain_arrays(names: List[str]) -> SimpleNamespace:
+    """Strain parameters for ``names`` as parallel float64 arrays, one row per name."""
+    batch = [STRAIN_BATCH_DB[n] for n in names]
+    cost = [STRAIN_DB.get(n, {}) for n in names]
+
+    def column(entries, key, default=None):
+        values = (e[key] if default is None else e.get(key, default) for e in entries)
+        return np.fromiter(values, dtype=np.float64, count=len(names))
+
+    return SimpleNamespace(
+        names=list(names),
+        t_fedbatch_h=column(batch, "t_fedbatch_h"),
+        t_turnaround_h=column(batch, "t_turnaround_h", 9.0),
+        t_downstrm_h=column(batch, "t_downstrm_h"),
+        yield_g_per_L=column(batch, "yield_g_per_L"),
+        media_cost_usd=column(cost, "media_cost_usd", 100),
+        cryo_cost_usd=column(cost, "cryo_cost_usd", 50),
+        utility_rate_ferm_kw=column(batch, "utility_rate_ferm_kw", 250),
+        utility_rate_cent_kw=column(batch, "utility_rate_cent_kw", 15),
+        utility_rate_lyo_kw=column(batch, "utility_rate_lyo_kw", 1.5),
+    )
+
+
+def strain_input_at(arrays: SimpleNamespace, i: int) -> StrainInput:
+    """StrainInput for row ``i`` of a build_strain_arrays() result."""
     return StrainInput(
-        name=name,
-        fermentation_time_h=sb["t_fedbatch_h"],
-        turnaround_time_h=sb.get("t_turnaround_h", 9.0),
-        downstream_time_h=sb["t_downstrm_h"],
-        yield_g_per_L=sb["yield_g_per_L"],
-        media_cost_usd=sd.get("media_cost_usd", 100),
-        cryo_cost_usd=sd.get("cryo_cost_usd", 50),
-        utility_rate_ferm_kw=sb.get("utility_rate_ferm_kw", 250),
-        utility_rate_cent_kw=sb.get("utility_rate_cent_kw", 15),
-        utility_rate_lyo_kw=sb.get("utility_rate_lyo_kw", 1.5),
+        name=arrays.names[i],
+        fermentation_time_h=float(arrays.t_fedbatch_h[i]),
+        turnaround_time_h=float(arrays.t_turnaround_h[i]),
+        downstream_time_h=float(arrays.t_downstrm_h[i]),
+        yield_g_per_L=float(arrays.yield_g_per_L[i]),
+        media_cost_usd=float(arrays.media_cost_usd[i]),
+        cryo_cost_usd=float(arrays.cryo_cost_usd[i]),
+        utility_rate_ferm_kw=float(arrays.utility_rate_ferm_kw[i]),
+        utility_rate_cent_kw=float(arrays.utility_rate_cent_kw[i]),
+        utility_rate_lyo_kw=float(arrays.utility_rate_lyo_kw[i]),
     )
 
 
+def build_strain(name: str) -> StrainInput:
+    return strain_input_at(build_strain_arrays([name]), 0)
+
+
+def _legacy_pricing():
+    """The original pricing module, loaded once and only when it is needed."""
+    global _legacy
+    if _legacy is None:
+        if LEGACY_PATH not in sys.path:
+            sys.path.insert(0, LEGACY_PATH)
+        _legacy = importlib.import_module("pricing_integrated_original")
+    return _legacy
+
+
 def verify_wvf_effect():
     s = build_strain("L. acidophilus")
     equip = EquipmentConfig(reactors_total=4, ds_lines_total=2)
@@ -128,7 +167,8 @@ def trigger_sanity_checks():
 
 def compare_weighted_royalty():
     strains = ["L. acidophilus", "Bacillus subtilis"]
-    s_inputs = [build_strain(n) for n in strains]
+    strain_arrays = build_strain_arrays(strains)
+    s_inputs = [strain_input_at(strain_arrays, i) for i in range(len(strains))]
     equip = EquipmentConfig(reactors_total=4, ds_lines_total=2)
     # Run minimal capacity to get batches per strain via orchestrator
     from bioprocess.capacity import calculate_capacity_deterministic
@@ -136,9 +176,10 @@ def compare_weighted_royalty():
     df, totals, cap = calculate_capacity_deterministic(
         s_inputs, equip, fermenter_volume_l=2000, working_volume_fraction=0.8
     )
-    batches_per_strain: Dict[str, float] = {
-        row["name"]: row.get("good_batches", 0.0) for _, row in df.iterrows()
-    }
+    good_batches = (
+        df["good_batches"].tolist() if "good_batches" in df else [0.0] * len(df)
+    )
+    batches_per_strain: Dict[str, float] = dict(zip(df["name"].tolist(), good_batches))
 
     # New implementation royalty rate (through calculate_economics)
     from bioprocess.models import (
@@ -165,7 +206,7 @@ def compare_weighted_royalty():
     )
 
     # Original implementation royalty rate
-    wr, per_strain = weighted_royalty_rate(
+    wr, per_strain = _legacy_pricing().weighted_royalty_rate(
         strains, fermenters=4, ds_lines=2, fermenter_volume_L=2000
     )
 
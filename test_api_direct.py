@@ -1,58 +1,88 @@
 #!/usr/bin/env python3
 """
 Test API directly to diagnose production overestimation issue.
-Tests both with and without optimization.
+Tests both with and without optimization, running the two scenarios concurrently.
+
+By default the app is called in-process over ASGI; pass --external to send the
+requests to a server already listening on BASE_URL instead.
 """
 
-import requests
+import asyncio
+import sys
+
+import httpx
+import orjson
 
 BASE_URL = "http://localhost:8000"
 
+# The optimization run is the slow one; allow the server plenty of time
+REQUEST_TIMEOUT = httpx.Timeout(300.0)
+
+# Payloads are encoded with orjson, so the content type is set by hand
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def make_client(external=False):
+    """Async client for the API, in-process unless ``external`` is set."""
+    if external:
+        # Small keep-alive pool and connection retries for a real server
+        return httpx.AsyncClient(
+            base_url=BASE_URL,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+            transport=httpx.AsyncHTTPTransport(retries=3),
+            timeout=REQUEST_TIMEOUT,
+        )
 
-def test_scenario_no_optimization():
+    from api.main import app
+
+    return httpx.AsyncClient(
+        base_url="http://testserver",
+        transport=httpx.ASGITransport(app=app),
+        timeout=REQUEST_TIMEOUT,
+    )
+
+
+# Per-strain fields shared by every strain in the test scenarios
+_STRAIN_DEFAULTS = dict(
+    yield_g_per_L=3.0,
+    media_cost_usd=600.0,
+    cryo_cost_usd=50.0,
+    utility_rate_ferm_kw=300,
+    utility_rate_cent_kw=15,
+    utility_rate_lyo_kw=1.5,
+    utility_cost_steam=0.0228,
+    licensing_fixed_cost_usd=0.0,
+    licensing_royalty_pct=0.0,
+    cv_ferm=0.1,
+    cv_turn=0.1,
+    cv_down=0.1,
+)
+
+YOGURT_STRAINS = [
+    dict(
+        _STRAIN_DEFAULTS,
+        name="S. thermophilus",
+        fermentation_time_h=17.0,
+        turnaround_time_h=10.0,
+        downstream_time_h=8.0,
+    ),
+    dict(
+        _STRAIN_DEFAULTS,
+        name="L. bulgaricus",
+        fermentation_time_h=14.0,
+        turnaround_time_h=9.0,
+        downstream_time_h=9.0,
+    ),
+]
+
+
+async def run_scenario_no_optimization(client):
     """Test scenario without optimization - should match Python calculations"""
 
     scenario = {
         "name": "Test Yogurt Cultures No Opt",
         "target_tpa": 10,
-        "strains": [
-            {
-                "name": "S. thermophilus",
-                "fermentation_time_h": 17.0,
-                "turnaround_time_h": 10.0,
-                "downstream_time_h": 8.0,
-                "yield_g_per_L": 3.0,
-                "media_cost_usd": 600.0,
-                "cryo_cost_usd": 50.0,
-                "utility_rate_ferm_kw": 300,
-                "utility_rate_cent_kw": 15,
-                "utility_rate_lyo_kw": 1.5,
-                "utility_cost_steam": 0.0228,
-                "licensing_fixed_cost_usd": 0.0,
-                "licensing_royalty_pct": 0.0,
-                "cv_ferm": 0.1,
-                "cv_turn": 0.1,
-                "cv_down": 0.1,
-            },
-            {
-                "name": "L. bulgaricus",
-                "fermentation_time_h": 14.0,
-                "turnaround_time_h": 9.0,
-                "downstream_time_h": 9.0,
-                "yield_g_per_L": 3.0,
-                "media_cost_usd": 600.0,
-                "cryo_cost_usd": 50.0,
-                "utility_rate_ferm_kw": 300,
-                "utility_rate_cent_kw": 15,
-                "utility_rate_lyo_kw": 1.5,
-                "utility_cost_steam": 0.0228,
-                "licensing_fixed_cost_usd": 0.0,
-                "licensing_royalty_pct": 0.0,
-                "cv_ferm": 0.1,
-                "cv_turn": 0.1,
-                "cv_down": 0.1,
-            },
-        ],
+        "strains": YOGURT_STRAINS,
         "optimize_equipment": False,
         "volumes": {
             "base_fermenter_vol_l": 500,
@@ -119,7 +149,9 @@ def test_scenario_no_optimization():
     print("Configuration: 500L, 3 reactors, 1 DS line")
     print("=" * 80)
 
-    response = requests.post(f"{BASE_URL}/api/scenarios/run", json=payload)
+    response = await client.post(
+        "/api/scenarios/run", content=orjson.dumps(payload), headers=JSON_HEADERS
+    )
 
     if response.status_code == 200:
         result = response.json()
@@ -167,50 +199,13 @@ def test_scenario_no_optimization():
     return result if response.status_code == 200 else None
 
 
-def test_scenario_with_optimization():
+async def run_scenario_with_optimization(client):
     """Test scenario with optimization - should find config that meets TPA"""
 
     scenario = {
         "name": "Test Yogurt Cultures With Opt",
         "target_tpa": 10,
-        "strains": [
-            {
-                "name": "S. thermophilus",
-                "fermentation_time_h": 17.0,
-                "turnaround_time_h": 10.0,
-                "downstream_time_h": 8.0,
-                "yield_g_per_L": 3.0,
-                "media_cost_usd": 600.0,
-                "cryo_cost_usd": 50.0,
-                "utility_rate_ferm_kw": 300,
-                "utility_rate_cent_kw": 15,
-                "utility_rate_lyo_kw": 1.5,
-                "utility_cost_steam": 0.0228,
-                "licensing_fixed_cost_usd": 0.0,
-                "licensing_royalty_pct": 0.0,
-                "cv_ferm": 0.1,
-                "cv_turn": 0.1,
-                "cv_down": 0.1,
-            },
-            {
-                "name": "L. bulgaricus",
-                "fermentation_time_h": 14.0,
-                "turnaround_time_h": 9.0,
-                "downstream_time_h": 9.0,
-                "yield_g_per_L": 3.0,
-                "media_cost_usd": 600.0,
-                "cryo_cost_usd": 50.0,
-                "utility_rate_ferm_kw": 300,
-                "utility_rate_cent_kw": 15,
-                "utility_rate_lyo_kw": 1.5,
-                "utility_cost_steam": 0.0228,
-                "licensing_fixed_cost_usd": 0.0,
-                "licensing_royalty_pct": 0.0,
-                "cv_ferm": 0.1,
-                "cv_turn": 0.1,
-                "cv_down": 0.1,
-            },
-        ],
+        "strains": YOGURT_STRAINS,
         "optimize_equipment": True,
         "use_multiobjective": True,
         "max_reactors": 10,
@@ -276,7 +271,9 @@ def test_scenario_with_optimization():
     print(f"Volume options: {scenario['volumes']['volume_options_l']}")
     print("=" * 80)
 
-    response = requests.post(f"{BASE_URL}/api/scenarios/run", json=payload)
+    response = await client.post(
+        "/api/scenarios/run", content=orjson.dumps(payload), headers=JSON_HEADERS
+    )
 
     if response.status_code == 200:
         result = response.json()
@@ -323,51 +320,30 @@ def test_scenario_with_optimization():
 
 
 if __name__ == "__main__":
-    # Kill any existing server and restart
-    print("Stopping existing API server...")
-    import subprocess
-
-    subprocess.run(["pkill", "-f", "uvicorn.*main:app"], stderr=subprocess.DEVNULL)
-    import time
+    external = "--external" in sys.argv[1:]
+
+    async def main():
+        async with make_client(external) as client:
+            # Both scenarios in flight at once; total time is the slower one
+            return await asyncio.gather(
+                run_scenario_no_optimization(client),
+                run_scenario_with_optimization(client),
+            )
 
-    time.sleep(2)
+    result_no_opt, result_with_opt = asyncio.run(main())
 
-    print("Starting fresh API server...")
-    import os
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
 
-    os.chdir("/home/eggzy/Downloads/Project_Hasan/bioprocess-web")
-    server_process = subprocess.Popen(
-        ["uvicorn", "api.main:app", "--port", "8000"],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
-    time.sleep(5)  # Wait for server to start
-
-    try:
-        # Test without optimization first
-        result_no_opt = test_scenario_no_optimization()
-
-        # Test with optimization
-        result_with_opt = test_scenario_with_optimization()
-
-        print("\n" + "=" * 80)
-        print("SUMMARY")
-        print("=" * 80)
-
-        if result_no_opt:
-            no_opt_tpa = result_no_opt.get("kpis", {}).get("tpa", 0)
-            print(f"Without optimization: {no_opt_tpa:.1f} TPA")
-            if no_opt_tpa > 15:
-                print("  ❌ Excessive production")
-
-        if result_with_opt:
-            with_opt_tpa = result_with_opt.get("kpis", {}).get("tpa", 0)
-            print(f"With optimization: {with_opt_tpa:.1f} TPA")
-            if with_opt_tpa > 15:
-                print("  ❌ Excessive production")
-
-    finally:
-        # Kill the server
-        print("\nStopping API server...")
-        server_process.terminate()
-        server_process.wait()
+    if result_no_opt:
+        no_opt_tpa = result_no_opt.get("kpis", {}).get("tpa", 0)
+        print(f"Without optimization: {no_opt_tpa:.1f} TPA")
+        if no_opt_tpa > 15:
+            print("  ❌ Excessive production")
+
+    if result_with_opt:
+        with_opt_tpa = result_with_opt.get("kpis", {}).get("tpa", 0)
+        print(f"With optimization: {with_opt_tpa:.1f} TPA")
+        if with_opt_tpa > 15:
+            print("  ❌ Excessive production")
@@ -4,166 +4,313 @@ Test script to verify form data collection issue in the bioprocess web applicati
 This script will send test data to the API and verify that form changes are actually processed.
 """
 
-import json
-import requests
+import asyncio
+import copy
+import orjson
 import sys
-from datetime import datetime
+
+# requests, httpx and datetime are imported where requests are sent, so importing
+# this module for the scenario fixture stays cheap
 
 # Test API endpoint
-API_BASE = "http://localhost:8000"
-SCENARIO_ENDPOINT = f"{API_BASE}/api/scenarios/run"
+API_HOST, API_PORT = "localhost", 8000
+API_BASE = f"http://{API_HOST}:{API_PORT}"
+SCENARIO_PATH = "/api/scenarios/run"
+SCENARIO_ENDPOINT = f"{API_BASE}{SCENARIO_PATH}"
+BATCH_ENDPOINT = f"{API_BASE}/api/scenarios/run_batch"
 
-def create_test_scenario_with_modified_values():
-    """Create a test scenario with modified values that should be different from defaults."""
-    scenario = {
-        "name": "Form Data Test Scenario",
-        "description": "Testing if form data changes are processed",
-        "target_tpa": 15.0,  # Changed from default 10.0
-        "strains": [{
-            "name": "Test Strain",
-            "fermentation_time_h": 20.0,  # Changed from default 18.0
-            "turnaround_time_h": 10.0,  # Changed from default 9.0
-            "downstream_time_h": 5.0,  # Changed from default 4.0
-            "yield_g_per_L": 90.0,  # Changed from default 82.87
-            "media_cost_usd": 300.0,  # Changed from default 245
-            "cryo_cost_usd": 200.0,  # Changed from default 189
-            "utility_rate_ferm_kw": 350.0,  # Changed from default 324
-            "utility_rate_cent_kw": 20.0,  # Changed from default 15
-            "utility_rate_lyo_kw": 2.0,  # Changed from default 1.5
-            "utility_cost_steam": 0.025,  # Changed from default 0.0228
-            "cv_ferm": 0.15,  # Changed from default 0.1
-            "cv_turn": 0.15,  # Changed from default 0.1
-            "cv_down": 0.15,  # Changed from default 0.1
-        }],
-        "equipment": {
-            "reactors_total": 6,  # Changed from default 4
-            "ds_lines_total": 3,  # Changed from default 2
-            "reactor_allocation_policy": "inverse_ct",
-            "ds_allocation_policy": "inverse_ct",
-            "shared_downstream": True
-        },
-        "volumes": {
-            "base_fermenter_vol_l": 2500.0,  # Changed from default 2000
-            "volume_options_l": [2500.0, 3000.0],  # Changed
-            "working_volume_fraction": 0.85,  # Changed from default 0.8
-            "seed_fermenter_ratio": 0.15,  # Changed from default 0.125
-            "media_tank_ratio": 1.5,  # Changed from default 1.25
-        },
-        "economics": {
-            "discount_rate": 0.12,  # Changed from default 0.10
-            "tax_rate": 0.30,  # Changed from default 0.25
-            "depreciation_years": 12,  # Changed from default 10
-            "project_lifetime_years": 20,  # Changed from default 15
-            "variable_opex_share": 0.90,  # Changed from default 0.85
-            "maintenance_pct_of_equip": 0.12,  # Changed from default 0.09
-            "ga_other_scale_factor": 12.0,  # Changed from default 10.84
-        },
-        "labor": {
-            "plant_manager_salary": 120000,  # Changed from default 104000
-            "fermentation_specialist_salary": 45000,  # Changed from default 39000
-            "downstream_process_operator_salary": 60000,  # Changed from default 52000
-            "general_technician_salary": 40000,  # Changed from default 32500
-            "qaqc_lab_tech_salary": 45000,  # Changed from default 39000
-            "maintenance_tech_salary": 45000,  # Changed from default 39000
-            "utility_operator_salary": 45000,  # Changed from default 39000
-            "logistics_clerk_salary": 45000,  # Changed from default 39000
-            "office_clerk_salary": 40000,  # Changed from default 32500
-            "min_fte": 20,  # Changed from default 15
-            "fte_per_tpa": 1.5,  # Changed from default 1.0
-        },
-        "opex": {
-            "electricity_usd_per_kwh": 0.15,  # Changed from default 0.107
-            "steam_usd_per_kg": 0.03,  # Changed from default 0.0228
-            "water_usd_per_m3": 0.003,  # Changed from default 0.002
-            "natural_gas_usd_per_mmbtu": 4.0,  # Changed from default 3.5
-            "raw_materials_markup": 1.2,  # Changed from default 1.0
-            "utilities_efficiency": 0.90,  # Changed from default 0.85
-        },
-        "capex": {
-            "land_cost_per_m2": 600,  # Changed from default 500
-            "building_cost_per_m2": 2500,  # Changed from default 2000
-            "fermenter_base_cost": 180000,  # Changed from default 150000
-            "fermenter_scale_exponent": 0.65,  # Changed from default 0.6
-            "centrifuge_cost": 250000,  # Changed from default 200000
-            "tff_skid_cost": 180000,  # Changed from default 150000
-            "lyophilizer_cost_per_m2": 60000,  # Changed from default 50000
-            "utilities_cost_factor": 0.30,  # Changed from default 0.25
-            "installation_factor": 0.20,  # Changed from default 0.15
-            "contingency_factor": 0.15,  # Changed from default 0.125
-            "working_capital_months": 4,  # Changed from default 3
-        },
-        "prices": {
-            "product_prices": {
-                "yogurt": 450,  # Changed from default 400
-                "lacto_bifido": 450,  # Changed from default 400
-                "bacillus": 450,  # Changed from default 400
-                "sacco": 550,  # Changed from default 500
-                "default": 450,  # Changed from default 400
-            },
-            "raw_prices": {
-                "glucose": 0.85,  # Will be populated with test values
-                "yeast_extract": 6.5,
-                "peptone": 8.5,
-                "corn_steep_liquor": 0.65,
-            }
-        },
-        "optimize_equipment": False,  # Disable optimization to see direct form effects
-        "use_multiobjective": False,
-        "optimization": {
-            "enabled": False,
-            "simulation_type": "deterministic",
-            "objectives": [],
-            "min_tpa": None,
-            "max_capex_usd": None,
-            "min_utilization": None,
-            "max_payback": None,
-            "max_evaluations": 100,
-            "population_size": 50,
-            "n_generations": 100,
-            "n_monte_carlo_samples": 1000,
-            "confidence_level": 0.95,
-        },
-        "sensitivity": {
-            "enabled": False,
-            "parameters": [],
-            "delta_percentage": 0.1,
-            "grid_points": 5,
-            "n_samples": 1000,
+_session = None
+
+def get_session():
+    """One keep-alive session for every request; retries connection flakes while the server starts."""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+
+        _session = requests.Session()
+        _session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=Retry(total=2, backoff_factor=0.1))
+        )
+        _session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+    return _session
+
+# Scenario with every form value changed from its default; built once at import
+_BASE_SCENARIO = {
+    "name": "Form Data Test Scenario",
+    "description": "Testing if form data changes are processed",
+    "target_tpa": 15.0,  # Changed from default 10.0
+    "strains": [{
+        "name": "Test Strain",
+        "fermentation_time_h": 20.0,  # Changed from default 18.0
+        "turnaround_time_h": 10.0,  # Changed from default 9.0
+        "downstream_time_h": 5.0,  # Changed from default 4.0
+        "yield_g_per_L": 90.0,  # Changed from default 82.87
+        "media_cost_usd": 300.0,  # Changed from default 245
+        "cryo_cost_usd": 200.0,  # Changed from default 189
+        "utility_rate_ferm_kw": 350.0,  # Changed from default 324
+        "utility_rate_cent_kw": 20.0,  # Changed from default 15
+        "utility_rate_lyo_kw": 2.0,  # Changed from default 1.5
+        "utility_cost_steam": 0.025,  # Changed from default 0.0228
+        "cv_ferm": 0.15,  # Changed from default 0.1
+        "cv_turn": 0.15,  # Changed from default 0.1
+        "cv_down": 0.15,  # Changed from default 0.1
+    }],
+    "equipment": {
+        "reactors_total": 6,  # Changed from default 4
+        "ds_lines_total": 3,  # Changed from default 2
+        "reactor_allocation_policy": "inverse_ct",
+        "ds_allocation_policy": "inverse_ct",
+        "shared_downstream": True
+    },
+    "volumes": {
+        "base_fermenter_vol_l": 2500.0,  # Changed from default 2000
+        "volume_options_l": [2500.0, 3000.0],  # Changed
+        "working_volume_fraction": 0.85,  # Changed from default 0.8
+        "seed_fermenter_ratio": 0.15,  # Changed from default 0.125
+        "media_tank_ratio": 1.5,  # Changed from default 1.25
+    },
+    "economics": {
+        "discount_rate": 0.12,  # Changed from default 0.10
+        "tax_rate": 0.30,  # Changed from default 0.25
+        "depreciation_years": 12,  # Changed from default 10
+        "project_lifetime_years": 20,  # Changed from default 15
+        "variable_opex_share": 0.90,  # Changed from default 0.85
+        "maintenance_pct_of_equip": 0.12,  # Changed from default 0.09
+        "ga_other_scale_factor": 12.0,  # Changed from default 10.84
+    },
+    "labor": {
+        "plant_manager_salary": 120000,  # Changed from default 104000
+        "fermentation_specialist_salary": 45000,  # Changed from default 39000
+        "downstream_process_operator_salary": 60000,  # Changed from default 52000
+        "general_technician_salary": 40000,  # Changed from default 32500
+        "qaqc_lab_tech_salary": 45000,  # Changed from default 39000
+        "maintenance_tech_salary": 45000,  # Changed from default 39000
+        "utility_operator_salary": 45000,  # Changed from default 39000
+        "logistics_clerk_salary": 45000,  # Changed from default 39000
+        "office_clerk_salary": 40000,  # Changed from default 32500
+        "min_fte": 20,  # Changed from default 15
+        "fte_per_tpa": 1.5,  # Changed from default 1.0
+    },
+    "opex": {
+        "electricity_usd_per_kwh": 0.15,  # Changed from default 0.107
+        "steam_usd_per_kg": 0.03,  # Changed from default 0.0228
+        "water_usd_per_m3": 0.003,  # Changed from default 0.002
+        "natural_gas_usd_per_mmbtu": 4.0,  # Changed from default 3.5
+        "raw_materials_markup": 1.2,  # Changed from default 1.0
+        "utilities_efficiency": 0.90,  # Changed from default 0.85
+    },
+    "capex": {
+        "land_cost_per_m2": 600,  # Changed from default 500
+        "building_cost_per_m2": 2500,  # Changed from default 2000
+        "fermenter_base_cost": 180000,  # Changed from default 150000
+        "fermenter_scale_exponent": 0.65,  # Changed from default 0.6
+        "centrifuge_cost": 250000,  # Changed from default 200000
+        "tff_skid_cost": 180000,  # Changed from default 150000
+        "lyophilizer_cost_per_m2": 60000,  # Changed from default 50000
+        "utilities_cost_factor": 0.30,  # Changed from default 0.25
+        "installation_factor": 0.20,  # Changed from default 0.15
+        "contingency_factor": 0.15,  # Changed from default 0.125
+        "working_capital_months": 4,  # Changed from default 3
+    },
+    "prices": {
+        "product_prices": {
+            "yogurt": 450,  # Changed from default 400
+            "lacto_bifido": 450,  # Changed from default 400
+            "bacillus": 450,  # Changed from default 400
+            "sacco": 550,  # Changed from default 500
+            "default": 450,  # Changed from default 400
         },
-        "assumptions": {
-            "hours_per_year": 8760.0,
-            "upstream_availability": 0.92,
-            "downstream_availability": 0.90,
-            "quality_yield": 0.98,
-            "discount_rate": 0.12,  # Should match economics
-            "tax_rate": 0.30,  # Should match economics
-            "variable_opex_share": 0.90,  # Should match economics
-            "maintenance_pct_of_equip": 0.12,  # Should match economics
-            "ga_other_scale_factor": 12.0,  # Should match economics
-            "depreciation_years": 12,  # Should match economics
-            "project_lifetime_years": 20,  # Should match economics
+        "raw_prices": {
+            "glucose": 0.85,  # Will be populated with test values
+            "yeast_extract": 6.5,
+            "peptone": 8.5,
+            "corn_steep_liquor": 0.65,
         }
+    },
+    "optimize_equipment": False,  # Disable optimization to see direct form effects
+    "use_multiobjective": False,
+    "optimization": {
+        "enabled": False,
+        "simulation_type": "deterministic",
+        "objectives": [],
+        "min_tpa": None,
+        "max_capex_usd": None,
+        "min_utilization": None,
+        "max_payback": None,
+        "max_evaluations": 100,
+        "population_size": 50,
+        "n_generations": 100,
+        "n_monte_carlo_samples": 1000,
+        "confidence_level": 0.95,
+    },
+    "sensitivity": {
+        "enabled": False,
+        "parameters": [],
+        "delta_percentage": 0.1,
+        "grid_points": 5,
+        "n_samples": 1000,
+    },
+    "assumptions": {
+        "hours_per_year": 8760.0,
+        "upstream_availability": 0.92,
+        "downstream_availability": 0.90,
+        "quality_yield": 0.98,
+        # discount_rate, tax_rate etc. are sent once under "economics"; the API
+        # builds the scenario assumptions from that section
     }
+}
+
+def make_scenario(**overrides):
+    """Shallow copy of the base scenario with top-level fields replaced."""
+    return {**_BASE_SCENARIO, **overrides}
+
+# Each top-level field of the base scenario pre-encoded, so a request only encodes its overrides
+_BASE_FIELD_BYTES = {key: orjson.dumps(value) for key, value in _BASE_SCENARIO.items()}
+
+def encode_scenario(**overrides):
+    """JSON bytes for make_scenario(**overrides), reusing the pre-encoded base fields."""
+    fields = {**_BASE_FIELD_BYTES, **{key: orjson.dumps(value) for key, value in overrides.items()}}
+    return b"{" + b",".join(orjson.dumps(key) + b":" + value for key, value in fields.items()) + b"}"
+
+def get_test_scenario(mutable=False):
+    """The shared test scenario; pass mutable=True for a private deep copy to edit."""
+    return copy.deepcopy(_BASE_SCENARIO) if mutable else _BASE_SCENARIO
+
+def create_test_scenario_with_modified_values():
+    """Create a test scenario with modified values that should be different from defaults."""
+    return get_test_scenario(mutable=True)
+
+# (label, key path into the returned scenario input, value the form sent)
+INPUT_CHECKS = [
+    ("Target TPA", ("target_tpa",), 15.0),
+    ("Discount Rate", ("assumptions", "discount_rate"), 0.12),
+    ("Plant Manager Salary", ("labor", "plant_manager_salary"), 120000),
+    ("Electricity Cost", ("opex", "electricity_usd_per_kwh"), 0.15),
+    ("Land Cost", ("capex", "land_cost_per_m2"), 600),
+]
+
+def dig(data, path):
+    """Value at ``path`` in nested dicts, or None if any key along it is missing."""
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+def analyze_scenario_result(scenario_result):
+    """Print the metrics and input checks for one scenario result."""
+    print("\nAnalyzing results to verify form data was used...")
 
-    return scenario
+    # Check some key financial metrics that should be affected by our changes
+    if "financial_metrics" in scenario_result:
+        metrics = scenario_result["financial_metrics"]
 
-def test_form_data_processing():
+        lines = ["\n📊 FINANCIAL METRICS ANALYSIS:"]
+        lines.extend(
+            f"  - {key}: {value:,.2f}"
+            for key, value in metrics.items()
+            if isinstance(value, (int, float))
+        )
+        print("\n".join(lines))
+
+        # The changed parameters should affect these results
+        # If the default values were used instead of our form values,
+        # the results would be different
+
+    else:
+        print("⚠️  No financial_metrics found in result")
+
+    # Check if scenario input was logged/returned (for debugging)
+    if "scenario_input" in scenario_result:
+        input_data = scenario_result["scenario_input"]
+        lines = ["\n🔍 VERIFYING SCENARIO INPUT DATA:"]
+
+        # Check key values to see if our form data was used
+        for check_name, path, expected_value in INPUT_CHECKS:
+            actual_value = dig(input_data, path)
+            if actual_value == expected_value:
+                lines.append(f"  ✅ {check_name}: {actual_value} (CORRECT)")
+            else:
+                lines.append(f"  ❌ {check_name}: {actual_value} (EXPECTED: {expected_value})")
+        print("\n".join(lines))
+
+async def _run_one(client, body):
+    """POST one scenario body and return its result, or an error entry."""
+    response = await client.post(SCENARIO_ENDPOINT, content=body)
+    if response.status_code != 200:
+        return {"error": f"HTTP {response.status_code}: {response.text}"}
+    return orjson.loads(response.content).get("result") or {"error": "No result data returned"}
+
+async def run_scenarios_concurrently(bodies):
+    """POST each scenario body as its own request, all of them in flight at once."""
+    import httpx
+
+    async with httpx.AsyncClient(
+        headers={"Content-Type": "application/json"},
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+        timeout=60,
+    ) as client:
+        return await asyncio.gather(*(_run_one(client, body) for body in bodies))
+
+def run_scenarios_sequentially(bodies):
+    """POST each scenario body in turn over one kept-alive http.client connection."""
+    import http.client
+
+    conn = http.client.HTTPConnection(API_HOST, API_PORT, timeout=60)
+    results = []
+    try:
+        for body in bodies:
+            conn.request("POST", SCENARIO_PATH, body=body, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            content = response.read()
+            if response.status != 200:
+                results.append({"error": f"HTTP {response.status}: {content.decode(errors='replace')}"})
+            else:
+                results.append(orjson.loads(content).get("result") or {"error": "No result data returned"})
+    finally:
+        conn.close()
+    return results
+
+def test_form_data_processing(batch_size=1, mode="batch"):
     """Test if form data changes are actually processed by the API."""
+    from datetime import datetime
+
+    import httpx
+    import requests
+
     print("=" * 60)
     print("BIOPROCESS FORM DATA COLLECTION TEST")
     print("=" * 60)
     print(f"Testing API at: {API_BASE}")
-    print(f"Timestamp: {datetime.now()}")
+    started = datetime.now()
+    outfile = f"form_data_test_result_{started.strftime('%Y%m%d_%H%M%S')}.json"
+    print(f"Timestamp: {started}")
     print()
 
-    # Create test scenario with modified values
-    test_scenario = create_test_scenario_with_modified_values()
+    # Test scenario with modified values (only read here, so no copy is needed)
+    test_scenario = get_test_scenario()
+    per_request = mode in ("concurrent", "sequential") and batch_size > 1
 
-    # Prepare request payload
-    payload = {
-        "scenario": test_scenario,
-        "async_mode": False
-    }
+    # Prepare request body; a batch sends named copies of the scenario in one call,
+    # while the "concurrent" and "sequential" modes send one request per copy
+    if per_request:
+        bodies = [
+            b'{"scenario":' + encode_scenario(name=f"{test_scenario['name']} #{i + 1}") + b',"async_mode":false}'
+            for i in range(batch_size)
+        ]
+    elif batch_size > 1:
+        endpoint = BATCH_ENDPOINT
+        scenarios = b",".join(
+            encode_scenario(name=f"{test_scenario['name']} #{i + 1}")
+            for i in range(batch_size)
+        )
+        body = b'{"scenarios":[' + scenarios + b'],"async_mode":false}'
+    else:
+        endpoint = SCENARIO_ENDPOINT
+        body = b'{"scenario":' + encode_scenario() + b',"async_mode":false}'
 
     print("Sending test scenario with modified form values...")
     print("Key test values being sent:")
@@ -177,82 +324,70 @@ def test_form_data_processing():
 
     try:
         # Send request to API
-        response = requests.post(
-            SCENARIO_ENDPOINT,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=60
-        )
+        if per_request:
+            if mode == "concurrent":
+                results = asyncio.run(run_scenarios_concurrently(bodies))
+            else:
+                results = run_scenarios_sequentially(bodies)
+            result = {"results": results}
+            status_code = 200
+        else:
+            response = get_session().post(
+                endpoint,
+                data=body,
+                timeout=60 * batch_size,
+                stream=True
+            )
+            status_code = response.status_code
 
-        print(f"API Response Status: {response.status_code}")
+        print(f"API Response Status: {status_code}")
 
-        if response.status_code == 200:
-            result = response.json()
+        if status_code == 200:
+            if per_request:
+                with open(outfile, 'wb') as f:
+                    f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                # Save the response body as it arrives rather than re-encoding it, then parse the copy
+                with open(outfile, 'wb') as f:
+                    for chunk in response.iter_content(65536):
+                        f.write(chunk)
+                with open(outfile, 'rb') as f:
+                    result = orjson.loads(f.read())
             print("✅ API request successful!")
 
             # Check if we got results
-            if "result" in result and result["result"]:
-                scenario_result = result["result"]
-                print("\nAnalyzing results to verify form data was used...")
-
-                # Check some key financial metrics that should be affected by our changes
-                if "financial_metrics" in scenario_result:
-                    metrics = scenario_result["financial_metrics"]
-
-                    print("\n📊 FINANCIAL METRICS ANALYSIS:")
-                    for key, value in metrics.items():
-                        if isinstance(value, (int, float)):
-                            print(f"  - {key}: {value:,.2f}")
-
-                    # The changed parameters should affect these results
-                    # If the default values were used instead of our form values,
-                    # the results would be different
-
-                else:
-                    print("⚠️  No financial_metrics found in result")
-
-                # Check if scenario input was logged/returned (for debugging)
-                if "scenario_input" in scenario_result:
-                    input_data = scenario_result["scenario_input"]
-                    print("\n🔍 VERIFYING SCENARIO INPUT DATA:")
-
-                    # Check key values to see if our form data was used
-                    checks = [
-                        ("Target TPA", input_data.get("target_tpa"), 15.0),
-                        ("Discount Rate", input_data.get("assumptions", {}).get("discount_rate"), 0.12),
-                        ("Plant Manager Salary", input_data.get("labor", {}).get("plant_manager_salary"), 120000),
-                        ("Electricity Cost", input_data.get("opex", {}).get("electricity_usd_per_kwh"), 0.15),
-                        ("Land Cost", input_data.get("capex", {}).get("land_cost_per_m2"), 600),
-                    ]
-
-                    for check_name, actual_value, expected_value in checks:
-                        if actual_value == expected_value:
-                            print(f"  ✅ {check_name}: {actual_value} (CORRECT)")
-                        else:
-                            print(f"  ❌ {check_name}: {actual_value} (EXPECTED: {expected_value})")
-
-                print(f"\n📁 Full result saved to: form_data_test_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
-
-                # Save full result for analysis
-                with open(f"form_data_test_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json", 'w') as f:
-                    json.dump(result, f, indent=2)
+            if batch_size > 1:
+                scenario_results = result.get("results") or []
+            else:
+                scenario_results = [result["result"]] if result.get("result") else []
+
+            if scenario_results:
+                for i, scenario_result in enumerate(scenario_results):
+                    if batch_size > 1:
+                        print(f"\n--- Scenario {i + 1}/{len(scenario_results)} ---")
+                    if "error" in scenario_result:
+                        print(f"❌ Scenario failed: {scenario_result['error']}")
+                        continue
+                    analyze_scenario_result(scenario_result)
+
+                print(f"\n📁 Full result saved to: {outfile}")
 
             else:
                 print("❌ No result data returned from API")
 
         else:
-            print(f"❌ API request failed: {response.status_code}")
+            print(f"❌ API request failed: {status_code}")
             try:
-                error_detail = response.json()
-                print(f"Error details: {json.dumps(error_detail, indent=2)}")
+                error_detail = orjson.loads(response.content)
+                print(f"Error details: {orjson.dumps(error_detail, option=orjson.OPT_INDENT_2).decode()}")
             except:
                 print(f"Raw error response: {response.text}")
 
-    except requests.exceptions.ConnectionError:
+    except (requests.exceptions.ConnectionError, httpx.ConnectError, ConnectionError):
         print("❌ Connection Error: Could not connect to the API.")
         print("Make sure the bioprocess web application is running on localhost:8000")
         return False
-    except requests.exceptions.Timeout:
+    except (requests.exceptions.Timeout, httpx.TimeoutException, TimeoutError):
         print("❌ Timeout Error: API request took too long")
         return False
     except Exception as e:
@@ -265,5 +400,15 @@ def test_form_data_processing():
     return True
 
 if __name__ == "__main__":
-    success = test_form_data_processing()
+    # --batch=N runs N copies of the scenario through one run_batch request;
+    # --mode=concurrent sends them as N parallel run requests instead, and
+    # --mode=sequential as N requests over one kept-alive connection
+    batch_size = 1
+    mode = "batch"
+    for arg in sys.argv[1:]:
+        if arg.startswith("--batch="):
+            batch_size = int(arg.split("=", 1)[1])
+        elif arg.startswith("--mode="):
+            mode = arg.split("=", 1)[1]
+    success = test_form_data_processing(batch_size, mode)
     sys.exit(0 if success else 1)
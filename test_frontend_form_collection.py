@@ -15,19 +15,245 @@ It validates that:
 Usage: python test_frontend_form_collection.py
 """
 
+import asyncio
+import httpx
 import json
+import operator
+import orjson
 import requests
 import sys
 from datetime import datetime
 from typing import Dict, Any, List
+from requests.adapters import HTTPAdapter
 
 # API Configuration
 API_BASE = "http://localhost:8000"
 SCENARIO_ENDPOINT = f"{API_BASE}/api/scenarios/run"
+JOBS_ENDPOINT = f"{API_BASE}/api/jobs"
+
+# Background job polling: first delay, delay cap and overall limit, in seconds
+POLL_INITIAL_DELAY = 0.1
+POLL_MAX_DELAY = 2.0
+POLL_TIMEOUT = 300.0
+
+# Form data collected from the comprehensive form, built once. The name, description,
+# optimization and sensitivity flags are filled in by simulate_comprehensive_form_data
+_FORM_TEMPLATE = {
+    "name": "Frontend Form Test Scenario",
+    "description": "Testing frontend form data collection",
+    "target_tpa": 12.5,  # Modified from default 10.0
+
+    # Strains section - simulate strain form data
+    "strains": [
+        {
+            "name": "Test Lactobacillus",
+            "fermentation_time_h": 22.0,  # Modified from default 18.0
+            "turnaround_time_h": 11.0,    # Modified from default 9.0
+            "downstream_time_h": 6.0,     # Modified from default 4.0
+            "yield_g_per_L": 95.0,        # Modified from default 82.87
+            "media_cost_usd": 275.0,      # Modified from default 245
+            "cryo_cost_usd": 210.0,       # Modified from default 189
+            "utility_rate_ferm_kw": 380.0, # Modified from default 324
+            "utility_rate_cent_kw": 18.0,  # Modified from default 15
+            "utility_rate_lyo_kw": 2.2,    # Modified from default 1.5
+            "utility_cost_steam": 0.027,   # Modified from default 0.0228
+            "cv_ferm": 0.12,               # Modified from default 0.1
+            "cv_turn": 0.12,               # Modified from default 0.1
+            "cv_down": 0.12,               # Modified from default 0.1
+            "respiration_type": "aerobic",
+            "requires_tff": True,
+            "downstream_complexity": 1.2
+        }
+    ],
+
+    # Equipment section
+    "equipment": {
+        "reactors_total": 8,           # Increased to allow more optimization configurations
+        "ds_lines_total": 4,           # Increased to allow more optimization configurations
+        "reactor_allocation_policy": "inverse_ct",
+        "ds_allocation_policy": "inverse_ct",
+        "shared_downstream": True
+    },
+
+    # Volumes section
+    "volumes": {
+        "base_fermenter_vol_l": 2200.0,   # Modified from default 2000
+        "volume_options_l": [1500.0, 2000.0, 2500.0, 3000.0, 3500.0, 4000.0],  # More options for optimization
+        "working_volume_fraction": 0.82,   # Modified from default 0.8
+        "seed_fermenter_ratio": 0.14,      # Modified from default 0.125
+        "media_tank_ratio": 1.35,          # Modified from default 1.25
+    },
+
+    # Economics section - simulate form inputs
+    "economics": {
+        "discount_rate": 0.13,              # Modified from default 0.10 (13% vs 10%)
+        "tax_rate": 0.28,                   # Modified from default 0.25 (28% vs 25%)
+        "depreciation_years": 12,           # Modified from default 10
+        "project_lifetime_years": 18,       # Modified from default 15
+        "variable_opex_share": 0.88,        # Modified from default 0.85 (88% vs 85%)
+        "maintenance_pct_of_equip": 0.11,   # Modified from default 0.09 (11% vs 9%)
+        "ga_other_scale_factor": 12.5,      # Modified from default 10.84
+    },
+
+    # Labor section - simulate form inputs
+    "labor": {
+        "plant_manager_salary": 125000,         # Modified from default 104000
+        "fermentation_specialist_salary": 48000, # Modified from default 39000
+        "downstream_process_operator_salary": 62000, # Modified from default 52000
+        "general_technician_salary": 41000,     # Modified from default 32500
+        "qaqc_lab_tech_salary": 47000,         # Modified from default 39000
+        "maintenance_tech_salary": 47000,       # Modified from default 39000
+        "utility_operator_salary": 47000,       # Modified from default 39000
+        "logistics_clerk_salary": 47000,        # Modified from default 39000
+        "office_clerk_salary": 41000,          # Modified from default 32500
+        "min_fte": 18,                          # Modified from default 15
+        "fte_per_tpa": 1.2,                     # Modified from default 1.0
+    },
+
+    # OPEX section - simulate form inputs
+    "opex": {
+        "electricity_usd_per_kwh": 0.125,      # Modified from default 0.107
+        "steam_usd_per_kg": 0.028,             # Modified from default 0.0228
+        "water_usd_per_m3": 0.0025,            # Modified from default 0.002
+        "natural_gas_usd_per_mmbtu": 4.2,      # Modified from default 3.5
+        "raw_materials_markup": 1.15,          # Modified from default 1.0
+        "utilities_efficiency": 0.88,          # Modified from default 0.85
+    },
+
+    # CAPEX section - simulate form inputs
+    "capex": {
+        "land_cost_per_m2": 650,              # Modified from default 500
+        "building_cost_per_m2": 2400,         # Modified from default 2000
+        "fermenter_base_cost": 175000,        # Modified from default 150000
+        "fermenter_scale_exponent": 0.65,     # Modified from default 0.6
+        "centrifuge_cost": 240000,            # Modified from default 200000
+        "tff_skid_cost": 175000,              # Modified from default 150000
+        "lyophilizer_cost_per_m2": 58000,     # Modified from default 50000
+        "utilities_cost_factor": 0.28,        # Modified from default 0.25
+        "installation_factor": 0.18,          # Modified from default 0.15
+        "contingency_factor": 0.14,           # Modified from default 0.125
+        "working_capital_months": 4,          # Modified from default 3
+        "parity_mode": False,                 # Ensure we use form inputs
+    },
+
+    # Pricing section - simulate form inputs
+    "prices": {
+        "product_prices": {
+            "yogurt": 475,          # Modified from default 400
+            "lacto_bifido": 475,    # Modified from default 400
+            "bacillus": 475,        # Modified from default 400
+            "sacco": 575,           # Modified from default 500
+            "default": 475,         # Modified from default 400
+        },
+        "raw_prices": {
+            "glucose": 0.88,               # Modified from typical 0.8
+            "yeast_extract": 6.8,          # Modified from typical 6.0
+            "peptone": 8.8,               # Modified from typical 8.0
+            "corn_steep_liquor": 0.68,     # Modified from typical 0.6
+            "sodium_chloride": 0.25,
+            "magnesium_sulfate": 1.2,
+            "potassium_phosphate": 2.1
+        }
+    },
+
+    # Equipment optimization - should be configurable via form
+    "optimize_equipment": False,
+    "use_multiobjective": False,
+
+    # Optimization section - simulate form inputs
+    "optimization": {
+        "enabled": False,
+        "simulation_type": "deterministic",
+        "objectives": [],
+        "min_tpa": 5.0,                 # Relaxed constraint to allow more exploration
+        "max_capex_usd": 25000000,      # Increased to allow more configurations (25M USD)
+        "min_utilization": 0.60,        # Relaxed constraint to allow more exploration
+        "max_payback": 5.0,             # Relaxed constraint to allow more exploration
+        "max_evaluations": 200,         # Increased to force more optimization exploration
+        "population_size": 50,          # Increased to explore more solutions
+        "n_generations": 20,            # Increased to allow more evolution
+        "n_monte_carlo_samples": 100,   # Keep reasonable for speed
+        "confidence_level": 0.96,       # Modified from default 0.95
+    },
+
+    # Sensitivity section - simulate form inputs
+    "sensitivity": {
+        "enabled": False,
+        "parameters": [],
+        "delta_percentage": 0.12,       # Modified from default 0.1 (12% vs 10%)
+        "grid_points": 3,               # Reduced for faster testing
+        "n_samples": 100,               # Reduced for faster testing
+    },
+
+    # Assumptions section - should reflect economics values
+    "assumptions": {
+        "hours_per_year": 8760.0,
+        "upstream_availability": 0.92,
+        "downstream_availability": 0.90,
+        "quality_yield": 0.98,
+        "discount_rate": 0.13,          # Should match economics
+        "tax_rate": 0.28,               # Should match economics
+        "variable_opex_share": 0.88,    # Should match economics
+        "maintenance_pct_of_equip": 0.11, # Should match economics
+        "ga_other_scale_factor": 12.5,  # Should match economics
+        "depreciation_years": 12,       # Should match economics
+        "project_lifetime_years": 18,   # Should match economics
+    }
+}
+
+# The template is plain JSON data, so decoding its encoded form gives a fresh
+# independent copy faster than copy.deepcopy
+_FORM_TEMPLATE_BYTES = orjson.dumps(_FORM_TEMPLATE)
+
+# Fields validate_form_data_structure requires, in the order issues are reported
+_REQUIRED_FIELDS = (
+    "name", "strains", "equipment", "volumes",
+    "economics", "labor", "opex", "capex", "prices"
+)
+_REQUIRED_STRAIN_FIELDS = (
+    "name", "fermentation_time_h", "turnaround_time_h",
+    "downstream_time_h", "yield_g_per_L"
+)
+_NESTED_CHECKS = {
+    "economics": ("discount_rate", "tax_rate", "project_lifetime_years"),
+    "labor": ("plant_manager_salary", "fermentation_specialist_salary"),
+    "opex": ("electricity_usd_per_kwh", "steam_usd_per_kg"),
+    "capex": ("land_cost_per_m2", "building_cost_per_m2"),
+    "equipment": ("reactors_total", "ds_lines_total"),
+}
+
+# Metrics taken from the first per-strain capacity entry: (metric key, per-strain field)
+_STRAIN_METRIC_KEYS = (
+    ("strain_name", "name"),
+    ("fermentation_time", "fermentation_time_h"),
+    ("batch_mass_kg", "batch_mass_kg"),
+    ("annual_kg_good", "annual_kg_good"),
+)
+
+def _within_tenth(actual, expected):
+    return abs(actual - expected) < 0.1
+
+# Form inputs the API should echo back: (validation name, metric key, comparison, description)
+_FORM_INPUT_CHECKS = (
+    ("target_tpa_form", "target_tpa", _within_tenth, "Target TPA should match form input"),
+    ("strain_name", "strain_name", operator.eq, "Strain name should match form input"),
+    ("fermentation_time", "fermentation_time", _within_tenth, "Fermentation time should match form input"),
+)
+
+# Financial sanity checks: (validation name, metric key, predicate on the value, description)
+_FINANCIAL_CHECKS = (
+    ("npv_positive", "npv", lambda v: v > 0, "NPV should be positive (basic sanity check)"),
+    ("irr_reasonable", "irr", lambda v: 0.1 <= v <= 5.0, "IRR should be reasonable (0.1 to 5.0)"),
+    ("payback_reasonable", "payback_years", lambda v: 1.0 <= v <= 10.0, "Payback should be reasonable (1-10 years)"),
+)
 
 class FrontendFormCollectionTester:
     def __init__(self):
         self.test_results = []
+        # One pooled keep-alive session shared by every scenario run
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        self.session.headers.update({"Content-Type": "application/json"})
 
     def simulate_comprehensive_form_data(self,
                                        enable_equipment_optimization: bool = False,
@@ -40,180 +266,25 @@ class FrontendFormCollectionTester:
 
         This mirrors the structure in web/static/js/app-comprehensive.js
         """
-        return {
-            "name": scenario_name,
-            "description": f"Testing frontend form data collection - {scenario_name}",
-            "target_tpa": 12.5,  # Modified from default 10.0
-
-            # Strains section - simulate strain form data
-            "strains": [
-                {
-                    "name": "Test Lactobacillus",
-                    "fermentation_time_h": 22.0,  # Modified from default 18.0
-                    "turnaround_time_h": 11.0,    # Modified from default 9.0
-                    "downstream_time_h": 6.0,     # Modified from default 4.0
-                    "yield_g_per_L": 95.0,        # Modified from default 82.87
-                    "media_cost_usd": 275.0,      # Modified from default 245
-                    "cryo_cost_usd": 210.0,       # Modified from default 189
-                    "utility_rate_ferm_kw": 380.0, # Modified from default 324
-                    "utility_rate_cent_kw": 18.0,  # Modified from default 15
-                    "utility_rate_lyo_kw": 2.2,    # Modified from default 1.5
-                    "utility_cost_steam": 0.027,   # Modified from default 0.0228
-                    "cv_ferm": 0.12,               # Modified from default 0.1
-                    "cv_turn": 0.12,               # Modified from default 0.1
-                    "cv_down": 0.12,               # Modified from default 0.1
-                    "respiration_type": "aerobic",
-                    "requires_tff": True,
-                    "downstream_complexity": 1.2
-                }
-            ],
-
-            # Equipment section
-            "equipment": {
-                "reactors_total": 8,           # Increased to allow more optimization configurations
-                "ds_lines_total": 4,           # Increased to allow more optimization configurations
-                "reactor_allocation_policy": "inverse_ct",
-                "ds_allocation_policy": "inverse_ct",
-                "shared_downstream": True
-            },
-
-            # Volumes section
-            "volumes": {
-                "base_fermenter_vol_l": 2200.0,   # Modified from default 2000
-                "volume_options_l": [1500.0, 2000.0, 2500.0, 3000.0, 3500.0, 4000.0],  # More options for optimization
-                "working_volume_fraction": 0.82,   # Modified from default 0.8
-                "seed_fermenter_ratio": 0.14,      # Modified from default 0.125
-                "media_tank_ratio": 1.35,          # Modified from default 1.25
-            },
-
-            # Economics section - simulate form inputs
-            "economics": {
-                "discount_rate": 0.13,              # Modified from default 0.10 (13% vs 10%)
-                "tax_rate": 0.28,                   # Modified from default 0.25 (28% vs 25%)
-                "depreciation_years": 12,           # Modified from default 10
-                "project_lifetime_years": 18,       # Modified from default 15
-                "variable_opex_share": 0.88,        # Modified from default 0.85 (88% vs 85%)
-                "maintenance_pct_of_equip": 0.11,   # Modified from default 0.09 (11% vs 9%)
-                "ga_other_scale_factor": 12.5,      # Modified from default 10.84
-            },
-
-            # Labor section - simulate form inputs
-            "labor": {
-                "plant_manager_salary": 125000,         # Modified from default 104000
-                "fermentation_specialist_salary": 48000, # Modified from default 39000
-                "downstream_process_operator_salary": 62000, # Modified from default 52000
-                "general_technician_salary": 41000,     # Modified from default 32500
-                "qaqc_lab_tech_salary": 47000,         # Modified from default 39000
-                "maintenance_tech_salary": 47000,       # Modified from default 39000
-                "utility_operator_salary": 47000,       # Modified from default 39000
-                "logistics_clerk_salary": 47000,        # Modified from default 39000
-                "office_clerk_salary": 41000,          # Modified from default 32500
-                "min_fte": 18,                          # Modified from default 15
-                "fte_per_tpa": 1.2,                     # Modified from default 1.0
-            },
-
-            # OPEX section - simulate form inputs
-            "opex": {
-                "electricity_usd_per_kwh": 0.125,      # Modified from default 0.107
-                "steam_usd_per_kg": 0.028,             # Modified from default 0.0228
-                "water_usd_per_m3": 0.0025,            # Modified from default 0.002
-                "natural_gas_usd_per_mmbtu": 4.2,      # Modified from default 3.5
-                "raw_materials_markup": 1.15,          # Modified from default 1.0
-                "utilities_efficiency": 0.88,          # Modified from default 0.85
-            },
-
-            # CAPEX section - simulate form inputs
-            "capex": {
-                "land_cost_per_m2": 650,              # Modified from default 500
-                "building_cost_per_m2": 2400,         # Modified from default 2000
-                "fermenter_base_cost": 175000,        # Modified from default 150000
-                "fermenter_scale_exponent": 0.65,     # Modified from default 0.6
-                "centrifuge_cost": 240000,            # Modified from default 200000
-                "tff_skid_cost": 175000,              # Modified from default 150000
-                "lyophilizer_cost_per_m2": 58000,     # Modified from default 50000
-                "utilities_cost_factor": 0.28,        # Modified from default 0.25
-                "installation_factor": 0.18,          # Modified from default 0.15
-                "contingency_factor": 0.14,           # Modified from default 0.125
-                "working_capital_months": 4,          # Modified from default 3
-                "parity_mode": False,                 # Ensure we use form inputs
-            },
-
-            # Pricing section - simulate form inputs
-            "prices": {
-                "product_prices": {
-                    "yogurt": 475,          # Modified from default 400
-                    "lacto_bifido": 475,    # Modified from default 400
-                    "bacillus": 475,        # Modified from default 400
-                    "sacco": 575,           # Modified from default 500
-                    "default": 475,         # Modified from default 400
-                },
-                "raw_prices": {
-                    "glucose": 0.88,               # Modified from typical 0.8
-                    "yeast_extract": 6.8,          # Modified from typical 6.0
-                    "peptone": 8.8,               # Modified from typical 8.0
-                    "corn_steep_liquor": 0.68,     # Modified from typical 0.6
-                    "sodium_chloride": 0.25,
-                    "magnesium_sulfate": 1.2,
-                    "potassium_phosphate": 2.1
-                }
-            },
-
-            # Equipment optimization - should be configurable via form
-            "optimize_equipment": enable_equipment_optimization,
-            "use_multiobjective": enable_multiobjective,
-
-            # Optimization section - simulate form inputs
-            "optimization": {
-                "enabled": enable_equipment_optimization or enable_multiobjective,
-                "simulation_type": "deterministic",
-                "objectives": ["npv", "irr"] if enable_multiobjective else [],
-                "min_tpa": 5.0,                 # Relaxed constraint to allow more exploration
-                "max_capex_usd": 25000000,      # Increased to allow more configurations (25M USD)
-                "min_utilization": 0.60,        # Relaxed constraint to allow more exploration
-                "max_payback": 5.0,             # Relaxed constraint to allow more exploration
-                "max_evaluations": 200,         # Increased to force more optimization exploration
-                "population_size": 50,          # Increased to explore more solutions
-                "n_generations": 20,            # Increased to allow more evolution
-                "n_monte_carlo_samples": 100,   # Keep reasonable for speed
-                "confidence_level": 0.96,       # Modified from default 0.95
-            },
-
-            # Sensitivity section - simulate form inputs
-            "sensitivity": {
-                "enabled": enable_sensitivity,
-                "parameters": ["discount_rate", "electricity_usd_per_kwh", "plant_manager_salary"] if enable_sensitivity else [],
-                "delta_percentage": 0.12,       # Modified from default 0.1 (12% vs 10%)
-                "grid_points": 3,               # Reduced for faster testing
-                "n_samples": 100,               # Reduced for faster testing
-            },
-
-            # Assumptions section - should reflect economics values
-            "assumptions": {
-                "hours_per_year": 8760.0,
-                "upstream_availability": 0.92,
-                "downstream_availability": 0.90,
-                "quality_yield": 0.98,
-                "discount_rate": 0.13,          # Should match economics
-                "tax_rate": 0.28,               # Should match economics
-                "variable_opex_share": 0.88,    # Should match economics
-                "maintenance_pct_of_equip": 0.11, # Should match economics
-                "ga_other_scale_factor": 12.5,  # Should match economics
-                "depreciation_years": 12,       # Should match economics
-                "project_lifetime_years": 18,   # Should match economics
-            }
-        }
+        data = orjson.loads(_FORM_TEMPLATE_BYTES)
+        data["name"] = scenario_name
+        data["description"] = f"Testing frontend form data collection - {scenario_name}"
+        data["optimize_equipment"] = enable_equipment_optimization
+        data["use_multiobjective"] = enable_multiobjective
+        data["optimization"]["enabled"] = enable_equipment_optimization or enable_multiobjective
+        data["optimization"]["objectives"] = ["npv", "irr"] if enable_multiobjective else []
+        data["sensitivity"]["enabled"] = enable_sensitivity
+        data["sensitivity"]["parameters"] = (
+            ["discount_rate", "electricity_usd_per_kwh", "plant_manager_salary"] if enable_sensitivity else []
+        )
+        return data
 
     def validate_form_data_structure(self, form_data: Dict[str, Any]) -> List[str]:
         """Validate that the form data has the expected structure."""
         issues = []
 
         # Check required top-level fields
-        required_fields = [
-            "name", "strains", "equipment", "volumes",
-            "economics", "labor", "opex", "capex", "prices"
-        ]
-
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in form_data:
                 issues.append(f"Missing required field: {field}")
             elif not form_data[field]:
@@ -225,28 +296,19 @@ class FrontendFormCollectionTester:
                 issues.append("No strains defined")
             else:
                 strain = form_data["strains"][0]
-                required_strain_fields = [
-                    "name", "fermentation_time_h", "turnaround_time_h",
-                    "downstream_time_h", "yield_g_per_L"
-                ]
-                for field in required_strain_fields:
-                    if field not in strain:
-                        issues.append(f"Missing strain field: {field}")
+                issues.extend(
+                    f"Missing strain field: {field}"
+                    for field in _REQUIRED_STRAIN_FIELDS if field not in strain
+                )
 
         # Check nested object structures
-        nested_checks = {
-            "economics": ["discount_rate", "tax_rate", "project_lifetime_years"],
-            "labor": ["plant_manager_salary", "fermentation_specialist_salary"],
-            "opex": ["electricity_usd_per_kwh", "steam_usd_per_kg"],
-            "capex": ["land_cost_per_m2", "building_cost_per_m2"],
-            "equipment": ["reactors_total", "ds_lines_total"]
-        }
-
-        for section, required_subfields in nested_checks.items():
-            if section in form_data and isinstance(form_data[section], dict):
-                for subfield in required_subfields:
-                    if subfield not in form_data[section]:
-                        issues.append(f"Missing {section}.{subfield}")
+        for section, required_subfields in _NESTED_CHECKS.items():
+            section_data = form_data.get(section)
+            if isinstance(section_data, dict):
+                issues.extend(
+                    f"Missing {section}.{subfield}"
+                    for subfield in required_subfields if subfield not in section_data
+                )
 
         return issues
 
@@ -258,15 +320,14 @@ class FrontendFormCollectionTester:
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 SCENARIO_ENDPOINT,
-                json=payload,
-                headers={"Content-Type": "application/json"},
+                data=orjson.dumps(payload),
                 timeout=90
             )
 
             if response.status_code == 200:
-                return {"success": True, "data": response.json()}
+                return {"success": True, "data": orjson.loads(response.content)}
             else:
                 return {
                     "success": False,
@@ -277,6 +338,49 @@ class FrontendFormCollectionTester:
         except Exception as e:
             return {"success": False, "error": "Exception", "details": str(e)}
 
+    async def run_scenario_with_form_data_async(self, client: httpx.AsyncClient,
+                                                form_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue form data as a background job, poll it until done and return the result."""
+        payload = {
+            "scenario": form_data,
+            "async_mode": True
+        }
+
+        try:
+            response = await client.post(SCENARIO_ENDPOINT, content=orjson.dumps(payload))
+            if response.status_code != 200:
+                return {
+                    "success": False,
+                    "error": f"HTTP {response.status_code}",
+                    "details": response.text
+                }
+            job_id = orjson.loads(response.content)["job_id"]
+
+            # Poll with exponential backoff until the job finishes
+            delay = POLL_INITIAL_DELAY
+            deadline = asyncio.get_running_loop().time() + POLL_TIMEOUT
+            while True:
+                await asyncio.sleep(delay)
+                response = await client.get(f"{JOBS_ENDPOINT}/{job_id}")
+                if response.status_code != 200:
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status_code}",
+                        "details": response.text
+                    }
+                job = orjson.loads(response.content)
+                if job["status"] == "completed":
+                    # Same shape as the synchronous response
+                    return {"success": True, "data": {"result": job["result"]}}
+                if job["status"] in ("failed", "cancelled"):
+                    return {"success": False, "error": f"Job {job['status']}", "details": job.get("error")}
+                if asyncio.get_running_loop().time() > deadline:
+                    return {"success": False, "error": "Timeout", "details": f"Job {job_id} still {job['status']}"}
+                delay = min(delay * 2, POLL_MAX_DELAY)
+
+        except Exception as e:
+            return {"success": False, "error": "Exception", "details": str(e)}
+
     def extract_validation_metrics(self, api_result: Dict[str, Any]) -> Dict[str, Any]:
         """Extract key metrics to validate that form data was processed correctly."""
         if not api_result.get("success"):
@@ -288,16 +392,19 @@ class FrontendFormCollectionTester:
         # Extract key financial metrics
         if "kpis" in result_data:
             kpis = result_data["kpis"]
+            get = kpis.get
+            tpa = get("tpa")
+            target = get("target_tpa")
             metrics.update({
-                "npv": kpis.get("npv"),
-                "irr": kpis.get("irr"),
-                "payback_years": kpis.get("payback_years"),
-                "capex": kpis.get("capex"),
-                "opex": kpis.get("opex"),
-                "target_tpa": kpis.get("target_tpa"),
-                "actual_tpa": kpis.get("tpa"),
-                "tpa_ratio": kpis.get("tpa") / kpis.get("target_tpa") if kpis.get("target_tpa") else None,
-                "tpa_matches_target": abs(kpis.get("tpa", 0) - kpis.get("target_tpa", 0)) < (kpis.get("target_tpa", 0) * 0.1) if kpis.get("target_tpa") else False
+                "npv": get("npv"),
+                "irr": get("irr"),
+                "payback_years": get("payback_years"),
+                "capex": get("capex"),
+                "opex": get("opex"),
+                "target_tpa": target,
+                "actual_tpa": tpa,
+                "tpa_ratio": tpa / target if target else None,
+                "tpa_matches_target": abs((tpa or 0) - target) < target * 0.1 if target else False
             })
 
         # Extract economics breakdown
@@ -316,30 +423,27 @@ class FrontendFormCollectionTester:
 
         # Extract capacity info
         if "capacity" in result_data:
-            capacity = result_data["capacity"]
-            if "per_strain" in capacity and len(capacity["per_strain"]) > 0:
-                strain_info = capacity["per_strain"][0]
-                metrics.update({
-                    "strain_name": strain_info.get("name"),
-                    "fermentation_time": strain_info.get("fermentation_time_h"),
-                    "batch_mass_kg": strain_info.get("batch_mass_kg"),
-                    "annual_kg_good": strain_info.get("annual_kg_good")
-                })
+            per_strain = result_data["capacity"].get("per_strain")
+            if per_strain:
+                strain_get = per_strain[0].get
+                metrics.update({metric: strain_get(key) for metric, key in _STRAIN_METRIC_KEYS})
 
         # Extract optimization results if present
         if "optimization" in result_data:
             opt_result = result_data["optimization"]
             if opt_result is not None and isinstance(opt_result, dict):
+                best = opt_result.get("best_solution") or {}
+                capacity_kg = best.get("capacity_kg")
                 metrics.update({
                     "optimization_completed": True,
-                    "best_solution_npv": opt_result.get("best_solution", {}).get("npv"),
-                    "best_solution_irr": opt_result.get("best_solution", {}).get("irr"),
+                    "best_solution_npv": best.get("npv"),
+                    "best_solution_irr": best.get("irr"),
                     "optimization_evaluations": opt_result.get("n_evaluations", opt_result.get("evaluations_completed", opt_result.get("total_evaluations", 1))),
                     "pareto_front_size": len(opt_result.get("pareto_front", [])),
-                    "best_solution_tpa": opt_result.get("best_solution", {}).get("capacity_kg", 0) / 1000.0 if opt_result.get("best_solution", {}).get("capacity_kg") else None,
-                    "best_solution_reactors": opt_result.get("best_solution", {}).get("reactors"),
-                    "best_solution_ds_lines": opt_result.get("best_solution", {}).get("ds_lines"),
-                    "best_solution_volume": opt_result.get("best_solution", {}).get("fermenter_volume_l"),
+                    "best_solution_tpa": capacity_kg / 1000.0 if capacity_kg else None,
+                    "best_solution_reactors": best.get("reactors"),
+                    "best_solution_ds_lines": best.get("ds_lines"),
+                    "best_solution_volume": best.get("fermenter_volume_l"),
                 })
             else:
                 metrics["optimization_completed"] = False
@@ -352,10 +456,7 @@ class FrontendFormCollectionTester:
             # Check if sensitivity has actual parameter results
             if isinstance(sens_result, dict) and len(sens_result) > 0:
                 # Count parameters that have actual sensitivity data
-                param_count = 0
-                for key, value in sens_result.items():
-                    if isinstance(value, dict) and len(value) > 0:
-                        param_count += 1
+                param_count = sum(1 for value in sens_result.values() if isinstance(value, dict) and value)
 
                 metrics.update({
                     "sensitivity_completed": True,
@@ -374,16 +475,17 @@ class FrontendFormCollectionTester:
         """Validate that form inputs had the expected effects on results."""
         validations = {}
 
-        # Check that target TPA was respected in form processing
-        if "target_tpa" in metrics and "target_tpa" in expected_values:
-            expected = expected_values["target_tpa"]
-            actual = metrics["target_tpa"]
-            validations["target_tpa_form"] = {
-                "expected": expected,
-                "actual": actual,
-                "passed": abs(actual - expected) < 0.1,
-                "test": "Target TPA should match form input"
-            }
+        # Check that the form inputs (target TPA, strain parameters) were used
+        for name, key, matches, description in _FORM_INPUT_CHECKS:
+            if key in metrics and key in expected_values:
+                expected = expected_values[key]
+                actual = metrics[key]
+                validations[name] = {
+                    "expected": expected,
+                    "actual": actual,
+                    "passed": matches(actual, expected),
+                    "test": description
+                }
 
         # Check that actual TPA production is reasonable vs target
         if "actual_tpa" in metrics and "target_tpa" in metrics:
@@ -410,46 +512,14 @@ class FrontendFormCollectionTester:
                 "test": "Optimization best solution TPA should align with target"
             }
 
-        # Check that strain parameters were used
-        if "strain_name" in metrics and "strain_name" in expected_values:
-            validations["strain_name"] = {
-                "expected": expected_values["strain_name"],
-                "actual": metrics["strain_name"],
-                "passed": metrics["strain_name"] == expected_values["strain_name"],
-                "test": "Strain name should match form input"
-            }
-
-        if "fermentation_time" in metrics and "fermentation_time" in expected_values:
-            expected = expected_values["fermentation_time"]
-            actual = metrics["fermentation_time"]
-            validations["fermentation_time"] = {
-                "expected": expected,
-                "actual": actual,
-                "passed": abs(actual - expected) < 0.1,
-                "test": "Fermentation time should match form input"
-            }
-
         # Validate that modified economics values affected results
         # Higher costs should generally reduce NPV/IRR compared to defaults
-        financial_impact_tests = {
-            "npv_positive": {
-                "test": "NPV should be positive (basic sanity check)",
-                "passed": metrics.get("npv", 0) > 0,
-                "value": metrics.get("npv")
-            },
-            "irr_reasonable": {
-                "test": "IRR should be reasonable (0.1 to 5.0)",
-                "passed": 0.1 <= metrics.get("irr", 0) <= 5.0,
-                "value": metrics.get("irr")
-            },
-            "payback_reasonable": {
-                "test": "Payback should be reasonable (1-10 years)",
-                "passed": 1.0 <= metrics.get("payback_years", 0) <= 10.0,
-                "value": metrics.get("payback_years")
+        for name, key, is_reasonable, description in _FINANCIAL_CHECKS:
+            validations[name] = {
+                "test": description,
+                "passed": is_reasonable(metrics.get(key, 0)),
+                "value": metrics.get(key)
             }
-        }
-
-        validations.update(financial_impact_tests)
 
         # Add optimization-specific validations
         if test_scenario in ["equipment_optimization", "multiobjective", "combined"]:
@@ -509,9 +579,9 @@ class FrontendFormCollectionTester:
 
         return validations
 
-    def run_single_scenario_test(self, test_name: str, enable_equipment_opt: bool = False,
-                                enable_multiobjective: bool = False, enable_sensitivity: bool = False) -> Dict[str, Any]:
-        """Run a single test scenario with specified optimization settings."""
+    def _prepare_scenario(self, test_name: str, enable_equipment_opt: bool,
+                          enable_multiobjective: bool, enable_sensitivity: bool):
+        """Build and check the form data for a scenario; returns (form_data, error result or None)."""
 
         print(f"\n🧪 Running {test_name} Test...")
 
@@ -526,14 +596,14 @@ class FrontendFormCollectionTester:
         # Validate structure
         structure_issues = self.validate_form_data_structure(form_data)
         if structure_issues:
-            return {
+            return form_data, {
                 "test_name": test_name,
                 "success": False,
                 "error": "Form structure validation failed",
                 "issues": structure_issues
             }
 
-        # Send to API
+        # Report what is about to be sent to the API
         print(f"   📡 Sending {test_name.lower()} request to API...")
         if enable_equipment_opt or enable_multiobjective:
             print(f"      - Equipment optimization: {enable_equipment_opt}")
@@ -541,8 +611,12 @@ class FrontendFormCollectionTester:
         if enable_sensitivity:
             print(f"      - Sensitivity analysis: {enable_sensitivity}")
 
-        api_result = self.run_scenario_with_form_data(form_data)
+        return form_data, None
 
+    def _evaluate_scenario(self, test_name: str, form_data: Dict[str, Any], api_result: Dict[str, Any],
+                           enable_equipment_opt: bool, enable_multiobjective: bool,
+                           enable_sensitivity: bool) -> Dict[str, Any]:
+        """Validate the API result for a scenario against the form data that was sent."""
         if not api_result["success"]:
             return {
                 "test_name": test_name,
@@ -619,8 +693,77 @@ class FrontendFormCollectionTester:
             "api_result": api_result
         }
 
-    def run_comprehensive_test(self) -> bool:
-        """Run the comprehensive frontend form collection test with all optimization modes."""
+    def run_single_scenario_test(self, test_name: str, enable_equipment_opt: bool = False,
+                                enable_multiobjective: bool = False, enable_sensitivity: bool = False) -> Dict[str, Any]:
+        """Run a single test scenario with specified optimization settings."""
+        flags = (enable_equipment_opt, enable_multiobjective, enable_sensitivity)
+        form_data, error = self._prepare_scenario(test_name, *flags)
+        if error:
+            return error
+        api_result = self.run_scenario_with_form_data(form_data)
+        return self._evaluate_scenario(test_name, form_data, api_result, *flags)
+
+    async def run_single_scenario_test_async(self, client: httpx.AsyncClient, test_name: str,
+                                             enable_equipment_opt: bool = False, enable_multiobjective: bool = False,
+                                             enable_sensitivity: bool = False) -> Dict[str, Any]:
+        """Async run_single_scenario_test that runs the scenario as a polled background job."""
+        flags = (enable_equipment_opt, enable_multiobjective, enable_sensitivity)
+        form_data, error = self._prepare_scenario(test_name, *flags)
+        if error:
+            return error
+        api_result = await self.run_scenario_with_form_data_async(client, form_data)
+        return self._evaluate_scenario(test_name, form_data, api_result, *flags)
+
+    async def _run_scenarios_concurrently(self, test_scenarios: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run the test scenarios as background jobs, results in scenario order.
+
+        The first (basic) scenario runs on its own so the server is warm before
+        the heavier scenarios start together; its result is kept as the basic one.
+        """
+        def run(client, scenario):
+            return self.run_single_scenario_test_async(
+                client,
+                scenario["name"],
+                scenario["equipment_opt"],
+                scenario["multiobjective"],
+                scenario["sensitivity"]
+            )
+
+        async with httpx.AsyncClient(
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_keepalive_connections=8),
+            timeout=30,
+        ) as client:
+            warm_up = await run(client, test_scenarios[0])
+            rest = await asyncio.gather(*(run(client, scenario) for scenario in test_scenarios[1:]))
+        return [warm_up, *rest]
+
+    def _run_scenarios_sequentially(self, test_scenarios: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run the test scenarios one at a time as blocking requests."""
+        scenario_results = []
+        for scenario in test_scenarios:
+            result = self.run_single_scenario_test(
+                scenario["name"],
+                scenario["equipment_opt"],
+                scenario["multiobjective"],
+                scenario["sensitivity"]
+            )
+            scenario_results.append(result)
+
+            # Short pause between tests to avoid overwhelming the server
+            if len(scenario_results) < len(test_scenarios):
+                print("   ⏳ Waiting 2 seconds before next test...")
+                import time
+                time.sleep(2)
+
+        return scenario_results
+
+    def run_comprehensive_test(self, concurrent: bool = True) -> bool:
+        """Run the comprehensive frontend form collection test with all optimization modes.
+
+        By default every scenario is queued as a background job at once; pass
+        concurrent=False to run them one after another as blocking requests.
+        """
         print("=" * 90)
         print("COMPREHENSIVE FRONTEND FORM COLLECTION TEST")
         print("Bioprocess Web Application - Form Data + Optimization + Sensitivity Testing")
@@ -674,21 +817,10 @@ class FrontendFormCollectionTester:
         print()
 
         # Run all test scenarios
-        scenario_results = []
-        for scenario in test_scenarios:
-            result = self.run_single_scenario_test(
-                scenario["name"],
-                scenario["equipment_opt"],
-                scenario["multiobjective"],
-                scenario["sensitivity"]
-            )
-            scenario_results.append(result)
-
-            # Short pause between tests to avoid overwhelming the server
-            if len(scenario_results) < len(test_scenarios):
-                print("   ⏳ Waiting 2 seconds before next test...")
-                import time
-                time.sleep(2)
+        if concurrent:
+            scenario_results = asyncio.run(self._run_scenarios_concurrently(test_scenarios))
+        else:
+            scenario_results = self._run_scenarios_sequentially(test_scenarios)
 
         # Analyze overall results
         print("\n" + "=" * 90)
@@ -888,7 +1020,8 @@ def main():
     tester = FrontendFormCollectionTester()
 
     try:
-        success = tester.run_comprehensive_test()
+        # --sequential runs the scenarios one at a time instead of as concurrent jobs
+        success = tester.run_comprehensive_test(concurrent="--sequential" not in sys.argv[1:])
         return 0 if success else 1
     except KeyboardInterrupt:
         print("\n\n⏹️  Test interrupted by user")
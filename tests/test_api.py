@@ -164,6 +164,20 @@ class TestAPIEndpoints(unittest.TestCase):
         self.assertEqual(data["total_scenarios"], 2)
         self.assertIn("job_id", data)
 
+    def test_run_batch_scenarios_sync(self):
+        """Test running several scenarios in one synchronous request"""
+        scenarios = [self.test_scenario, self.test_scenario]
+
+        response = self.client.post(
+            "/api/scenarios/run_batch", json={"scenarios": scenarios}
+        )
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertIn("kpis", result)
+            self.assertIn("capacity", result)
+
     def test_export_excel(self):
         """Test Excel export endpoint"""
         # First run a scenario to get results